@@ -0,0 +1,257 @@
+"""Time the scheduler's hot paths against synthetic databases of several sizes.
+
+Each (tracks, days) scale gets a freshly built database; every case is run
+``--repeat`` times and one JSON record per invocation is appended to
+``benchmarks/results/hotpaths.jsonl`` for comparison across commits.
+
+    python benchmarks/hotpaths.py --tracks 100,1000 --days 7,365
+    python benchmarks/hotpaths.py --preset full --cases generate_schedule
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rich.console import Console
+
+from scheduler import db, helpers, scheduler
+from scheduler.commands import export, report, status, sync
+from scheduler.models.track import Track
+from scheduler.synth import synthesize
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "hotpaths.jsonl"
+
+PRESETS = {
+    "quick": ([100, 1000], [7, 365]),
+    "full": ([100, 1000, 10_000, 100_000], [7, 365, 5 * 365, 20 * 365]),
+}
+
+
+def load_tracks():
+    conn = db.connect()
+    return [
+        Track(*row)
+        for row in conn.execute(
+            "SELECT title, category, total, completed, active FROM tracks"
+        )
+    ]
+
+
+def case_deterministic_k(ctx):
+    helpers._cached_k.cache_clear()
+    helpers.deterministic_k_batch(ctx["today"].isoformat(), ctx["titles"])
+
+
+def case_calculate_track_score(ctx):
+    snapshot = ctx["snapshot"]
+    score_track = scheduler.get_scorer()
+    for track in snapshot.tracks:
+        score_track(track, snapshot)
+
+
+def case_get_recent_history(ctx):
+    scheduler.get_recent_history(as_of=ctx["today"])
+
+
+def case_generate_schedule(ctx):
+    helpers._cached_k.cache_clear()
+    # Rescore even though the inputs match the previous run's
+    scheduler.generate_schedule(ctx["today"], force=True, reuse=False)
+
+
+def case_populate(ctx):
+    # Flip progress on every track so each row is an update
+    for track in ctx["tracks"]:
+        track.completed = track.total - track.completed
+    Track.save_many(ctx["tracks"])
+
+
+def case_sync(ctx):
+    conn = db.connect()
+    tracks = ctx["tracks"]
+    # Change roughly 1% of the catalog
+    for track in tracks[:: max(1, len(tracks) // 100)]:
+        track.total += 1
+    try:
+        sync.stage_tracks(conn, tracks)
+        with conn:
+            sync.apply_changes(conn, sync.diff_tracks(conn))
+    finally:
+        conn.execute("DROP TABLE IF EXISTS temp.sync_tracks")
+
+
+def case_export(ctx):
+    export.export(
+        table="logs",
+        format="ndjson",
+        output="bench",
+        where="",
+        week=False,
+        start=None,
+        end=None,
+        compress=False,
+        batch_size=1000,
+    )
+
+
+def case_report(ctx):
+    report.report(
+        week=False,
+        month=False,
+        year=False,
+        start=None,
+        end=None,
+        limit=25,
+        rebuild=False,
+    )
+
+
+def case_report_year(ctx):
+    report.report(
+        week=False,
+        month=False,
+        year=True,
+        start=None,
+        end=None,
+        limit=25,
+        rebuild=False,
+    )
+
+
+def case_status(ctx):
+    status.status()
+
+
+CASES = {
+    "deterministic_k": case_deterministic_k,
+    "calculate_track_score": case_calculate_track_score,
+    "get_recent_history": case_get_recent_history,
+    "generate_schedule": case_generate_schedule,
+    "populate": case_populate,
+    "sync": case_sync,
+    "export": case_export,
+    "report": case_report,
+    "report_year": case_report_year,
+    "status": case_status,
+}
+
+
+def run_scale(workdir: Path, tracks: int, days: int, cases, repeat: int):
+    today = date.today()
+    build_start = time.perf_counter()
+    path = workdir / f"bench-{tracks}-{days}.db"
+    synthesize(
+        path,
+        tracks=tracks,
+        categories=min(20, tracks // 5),
+        days=days,
+        overwrite=True,
+    )
+    build_seconds = time.perf_counter() - build_start
+    db.use_database(path)
+
+    ctx = {
+        "today": today,
+        "tracks": load_tracks(),
+        "snapshot": scheduler.load_scoring_snapshot(today),
+    }
+    ctx["titles"] = [track.title for track in ctx["tracks"]]
+
+    results = {}
+    for name in cases:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            CASES[name](ctx)
+            timings.append(time.perf_counter() - start)
+        results[name] = {
+            "median_s": statistics.median(timings),
+            "min_s": min(timings),
+            "runs": timings,
+        }
+        print(
+            f"{tracks:>7} tracks {days:>6} days  {name:<22} "
+            f"{results[name]['median_s'] * 1000:>10.2f} ms"
+        )
+
+    return {
+        "tracks": tracks,
+        "days": days,
+        "build_s": build_seconds,
+        "cases": results,
+    }
+
+
+def git_revision() -> str:
+    proc = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=False,
+    )
+    return proc.stdout.strip() or "unknown"
+
+
+def int_list(value: str):
+    return [int(part) for part in value.split(",") if part]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=PRESETS, default="quick")
+    parser.add_argument("--tracks", type=int_list, help="Comma-separated sizes")
+    parser.add_argument("--days", type=int_list, help="Comma-separated history days")
+    parser.add_argument(
+        "--cases", type=lambda v: v.split(","), default=list(CASES), help="Subset"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    options = parser.parse_args()
+
+    unknown = set(options.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    preset_tracks, preset_days = PRESETS[options.preset]
+    track_sizes = options.tracks or preset_tracks
+    history_days = options.days or preset_days
+
+    # Keep rendering and exports out of the terminal and the user's folders
+    quiet = Console(file=io.StringIO())
+    report.console = status.console = export.console = quiet
+
+    with tempfile.TemporaryDirectory() as workdir:
+        export.DOWNLOADS_DIR = Path(workdir)
+        scales = [
+            run_scale(Path(workdir), tracks, days, options.cases, options.repeat)
+            for tracks in track_sizes
+            for days in history_days
+        ]
+        db.close_all()
+
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "repeat": options.repeat,
+        "scales": scales,
+    }
+    options.output.parent.mkdir(parents=True, exist_ok=True)
+    with options.output.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
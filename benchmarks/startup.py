@@ -0,0 +1,138 @@
+"""Track CLI cold-start cost over time.
+
+Runs a few representative invocations under ``python -X importtime`` against
+a throwaway database and appends one JSON record per run to
+``benchmarks/results/startup.jsonl``, so results can be compared across
+commits.
+
+    python benchmarks/startup.py [--repeat 5] [--output PATH]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "startup.jsonl"
+
+# Invocations that shell hooks make
+INVOCATIONS = {
+    "import": [],
+    "log": ["log", "python", "--status", "in_progress"],
+    "generate": ["generate"],
+    "status": ["status"],
+    "report": ["report"],
+}
+
+RUNNER = (
+    "import sys\n"
+    "from scheduler import main\n"
+    "sys.argv = ['scheduler', *sys.argv[1:]]\n"
+    "if len(sys.argv) > 1:\n"
+    "    try:\n"
+    "        main()\n"
+    "    except SystemExit:\n"
+    "        pass\n"
+)
+
+
+def parse_importtime(stderr: str):
+    """Return {module: cumulative_us} for top-level imports and the module count."""
+    top_level = {}
+    count = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        count += 1
+        if not name.startswith("  "):  # Only top-level imports are not indented
+            top_level[name.strip()] = int(cumulative)
+    return top_level, count
+
+
+def measure(args, repeat: int, env):
+    command = [sys.executable, "-X", "importtime", "-c", RUNNER, *args]
+
+    wall_ms = []
+    top_level = {}
+    modules = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            command, capture_output=True, text=True, env=env, check=True
+        )
+        wall_ms.append((time.perf_counter() - start) * 1000)
+        top_level, modules = parse_importtime(proc.stderr)
+
+    heaviest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "wall_ms_median": round(statistics.median(wall_ms), 2),
+        "wall_ms_min": round(min(wall_ms), 2),
+        "import_us_total": sum(top_level.values()),
+        "modules_imported": modules,
+        "heaviest_imports": dict(heaviest[:10]),
+    }
+
+
+def git_revision() -> str:
+    proc = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=False,
+    )
+    return proc.stdout.strip() or "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        env = {**os.environ, "HOME": home, "PYTHONPATH": str(ROOT / "src")}
+        env.pop("MODE", None)
+        for setup in (["init"], ["populate"], ["generate"]):
+            subprocess.run(
+                [sys.executable, "-c", RUNNER, *setup],
+                capture_output=True,
+                env=env,
+                check=True,
+            )
+
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "results": {
+                name: measure(args, options.repeat, env)
+                for name, args in INVOCATIONS.items()
+            },
+        }
+
+    options.output.parent.mkdir(parents=True, exist_ok=True)
+    with options.output.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+    for name, result in record["results"].items():
+        print(
+            f"{name:<10} {result['wall_ms_median']:>8.1f} ms  "
+            f"{result['import_us_total'] / 1000:>7.1f} ms imports  "
+            f"{result['modules_imported']:>4} modules"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,93 @@
+import importlib
+from pathlib import Path
+from typing import Optional
+
 import typer
+from typer.core import TyperGroup
+
+# Subcommand name -> (module, attribute). Modules are imported only when the
+# subcommand is invoked, so e.g. `scheduler log` never loads the renderers
+# used by `generate`, `report` or `status`.
+LAZY_COMMANDS = {
+    "init": ("scheduler.commands.init", "init"),
+    "generate": ("scheduler.commands.generate", "generate"),
+    "populate": ("scheduler.commands.populate", "populate"),
+    "log": ("scheduler.commands.log", "log"),
+    "backup": ("scheduler.commands.backup", "backup"),
+    "restore": ("scheduler.commands.backup", "restore"),
+    "export": ("scheduler.commands.export", "export"),
+    "explain": ("scheduler.commands.explain", "explain"),
+    "report": ("scheduler.commands.report", "report"),
+    "status": ("scheduler.commands.status", "status"),
+    "serve": ("scheduler.commands.serve", "serve"),
+    "simulate": ("scheduler.commands.simulate", "simulate"),
+    "sync": ("scheduler.commands.sync", "sync"),
+    "synth": ("scheduler.commands.synth", "synth"),
+    "track": ("scheduler.commands.track", "app"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Command group that imports a subcommand's module on first use."""
+
+    def list_commands(self, ctx):
+        return [*LAZY_COMMANDS, *super().list_commands(ctx)]
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in LAZY_COMMANDS:
+            return command
+
+        module_name, attribute = LAZY_COMMANDS[cmd_name]
+        target = getattr(importlib.import_module(module_name), attribute)
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+        else:
+            single = typer.Typer()
+            single.command(name=cmd_name)(target)
+            command = typer.main.get_command(single)
+        command.name = cmd_name
+
+        self.commands[cmd_name] = command
+        return command
 
-from scheduler.commands import (
-    export,
-    generate,
-    init,
-    log,
-    populate,
-    report,
-    status,
-    sync,
-    track,
-)
 
 app = typer.Typer(
-    help="Enhanced Learning Track Scheduler with Bitcoin-style Determinism"
+    cls=LazyGroup,
+    help="Enhanced Learning Track Scheduler with Bitcoin-style Determinism",
 )
+
+
+@app.callback()
+def options(
+    profile: bool = typer.Option(
+        False, "--profile", help="Print per-phase timings and SQL counts on exit"
+    ),
+    profile_output: Optional[Path] = typer.Option(
+        None, "--profile-output", help="Write the profile to this file as JSON"
+    ),
+    profile_name: Optional[str] = typer.Option(
+        None,
+        "--profile-name",
+        envvar="SCHEDULER_PROFILE",
+        help="Use the named learner profile's database instead of the default",
+    ),
+):
+    """Enhanced Learning Track Scheduler with Bitcoin-style Determinism"""
+    if profile_name:
+        from scheduler import db
+
+        try:
+            db.use_profile(profile_name)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--profile-name")
+
+    if profile or profile_output:
+        from scheduler import profiling
+
+        profiling.enable(profile_output)
+
+
 app.add_typer(
     typer.Typer(
         name="cli",
@@ -24,17 +97,6 @@ app.add_typer(
     name="cli",
 )
 
-app.command()(init.init)
-app.command()(generate.generate)
-app.command()(populate.populate)
-app.command()(log.log)
-app.command()(export.export)
-app.command()(report.report)
-app.command()(status.status)
-app.command()(sync.sync)
-
-app.add_typer(track.app, name="track", help="Track management commands")
-
 
 def main() -> None:
     """Standalone entry point."""
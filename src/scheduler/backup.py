@@ -0,0 +1,236 @@
+"""Online snapshots of the database through the SQLite backup API.
+
+Backups copy pages in steps, each under a short read lock, so the database
+stays in use meanwhile (with WAL, readers and writers are never blocked).
+Snapshots are plain SQLite files, optionally gzip-compressed, and are
+integrity-checked before they are kept or restored.
+"""
+
+import gzip
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+from scheduler import db
+from scheduler.constants import BACKUPS_DIR, MIGRATIONS_DIR, PROFILES_DIR
+
+PAGES_PER_STEP = 4096  # 16 MiB at the default 4 KiB page size
+STEP_SLEEP = 0.001  # Seconds between steps, letting other connections in
+COMPRESS_LEVEL = 1  # Database pages still compress well at the fastest level
+COPY_BUFFER = 16 * 1024 * 1024
+
+# (status, remaining, total) in pages, called after every step
+Progress = Callable[[int, int, int], object]
+
+
+def snapshot_dir() -> Path:
+    """Where the current database's snapshots are kept.
+
+    Profiles get their own directory, since a profile may share its name with
+    the default database.
+    """
+    if db.DATABASE_PATH.parent == PROFILES_DIR:
+        return BACKUPS_DIR / "profiles"
+    return BACKUPS_DIR
+
+
+def snapshot_path(directory: Optional[Path] = None, compress: bool = False) -> Path:
+    """A new timestamped snapshot file for the current database."""
+    directory = directory or snapshot_dir()
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    suffix = ".db.gz" if compress else ".db"
+    path = directory / f"{db.DATABASE_PATH.stem}-{stamp}{suffix}"
+    count = 1
+    while path.exists():
+        count += 1
+        path = directory / f"{db.DATABASE_PATH.stem}-{stamp}-{count}{suffix}"
+    return path
+
+
+def latest_snapshot(directory: Optional[Path] = None) -> Optional[Path]:
+    """Most recent snapshot of the current database, if any."""
+    directory = directory or snapshot_dir()
+    # Only names snapshot_path gives this database, not e.g. "<stem>-old-..."
+    name = re.compile(
+        rf"{re.escape(db.DATABASE_PATH.stem)}-\d{{8}}-\d{{6}}(-\d+)?\.db(\.gz)?"
+    )
+    snapshots = [
+        path
+        for path in directory.glob(f"{db.DATABASE_PATH.stem}-*")
+        if name.fullmatch(path.name)
+    ]
+    return max(snapshots, key=lambda path: path.stat().st_mtime, default=None)
+
+
+def check_integrity(conn: sqlite3.Connection, quick: bool = False) -> None:
+    """Raise ValueError unless SQLite's integrity check passes."""
+    pragma = "quick_check" if quick else "integrity_check"
+    problems = [row[0] for row in conn.execute(f"PRAGMA {pragma}")]
+    if problems != ["ok"]:
+        raise ValueError(f"Integrity check failed: {'; '.join(problems[:5])}")
+
+
+def _describe(conn: sqlite3.Connection) -> Dict:
+    return {
+        "pages": conn.execute("PRAGMA page_count").fetchone()[0],
+        "page_size": conn.execute("PRAGMA page_size").fetchone()[0],
+        "schema": conn.execute("PRAGMA user_version").fetchone()[0],
+    }
+
+
+@contextmanager
+def _open_source(source: Optional[Path]) -> Iterator[sqlite3.Connection]:
+    if source is None:
+        yield db.connect(readonly=True)
+        return
+    conn = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def backup_database(
+    destination: Path,
+    compress: bool = False,
+    verify: bool = True,
+    pages: int = PAGES_PER_STEP,
+    progress: Optional[Progress] = None,
+    source: Optional[Path] = None,
+) -> Dict:
+    """Snapshot the current database to `destination` while it stays in use.
+
+    The copy is built beside the destination and only moved into place once
+    it is complete and verified, so a failed backup leaves nothing behind.
+    Pass `source` to copy that file exactly as it is, bypassing the shared
+    connection and the migrations it applies on opening.
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    partial = destination.with_name(destination.name + ".partial")
+    raw = destination.with_name(destination.name + ".raw") if compress else partial
+
+    try:
+        target = sqlite3.connect(raw)
+        try:
+            with _open_source(source) as reader:
+                reader.backup(target, pages=pages, progress=progress, sleep=STEP_SLEEP)
+            # A snapshot is one self-contained file
+            target.execute("PRAGMA journal_mode = DELETE")
+            if verify:
+                check_integrity(target)
+            info = _describe(target)
+        finally:
+            target.close()
+
+        if compress:
+            with (
+                raw.open("rb") as f,
+                gzip.open(partial, "wb", compresslevel=COMPRESS_LEVEL) as out,
+            ):
+                shutil.copyfileobj(f, out, COPY_BUFFER)
+        os.replace(partial, destination)
+    finally:
+        raw.unlink(missing_ok=True)
+        partial.unlink(missing_ok=True)
+
+    return {**info, "path": destination, "bytes": destination.stat().st_size}
+
+
+@contextmanager
+def open_snapshot(path: Path) -> Iterator[sqlite3.Connection]:
+    """Open a .db or .db.gz snapshot for reading.
+
+    Compressed snapshots are unpacked to a temporary file beside the database
+    first, since they can't be read in place.
+    """
+    if path.suffix != ".gz":
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    db.DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=db.DATABASE_PATH.parent) as workdir:
+        unpacked = Path(workdir) / "snapshot.db"
+        with gzip.open(path, "rb") as f, unpacked.open("wb") as out:
+            shutil.copyfileobj(f, out, COPY_BUFFER)
+        conn = sqlite3.connect(unpacked)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _latest_schema() -> int:
+    return max(
+        int(path.name[:4]) for path in MIGRATIONS_DIR.glob("[0-9][0-9][0-9][0-9]_*.sql")
+    )
+
+
+def _copy_into_database(
+    source: sqlite3.Connection, snapshot: Path, progress: Optional[Progress]
+) -> None:
+    try:
+        source.backup(db.connect(), pages=-1, progress=progress)
+    except sqlite3.OperationalError as e:
+        raise ValueError(f"Could not restore {snapshot}: {e}") from None
+
+
+def restore_database(
+    snapshot: Path, verify: bool = True, progress: Optional[Progress] = None
+) -> Dict:
+    """Replace the current database's contents with a snapshot's.
+
+    Pages are copied into the live database in a single step, i.e. one
+    transaction: other connections, the daemon's included, go straight from
+    the old contents to the new. Snapshots with an older schema are migrated
+    on a private copy first, so one that can't be upgraded changes nothing.
+    """
+    latest = _latest_schema()
+    with open_snapshot(snapshot) as source:
+        try:
+            if verify:
+                check_integrity(source, quick=True)
+            info = _describe(source)
+            is_scheduler = source.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schedule'"
+            ).fetchone()
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"{snapshot} is not a readable database: {e}") from None
+        if not is_scheduler:
+            raise ValueError(f"{snapshot} is not a scheduler database")
+        if info["schema"] > latest:
+            raise ValueError(
+                f"{snapshot} has schema version {info['schema']}, newer than "
+                f"this scheduler's {latest}; upgrade before restoring it"
+            )
+
+        db.DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        if info["schema"] == latest:
+            _copy_into_database(source, snapshot, progress)
+            return {**info, "path": snapshot, "migrated_to": latest}
+
+        with tempfile.TemporaryDirectory(dir=db.DATABASE_PATH.parent) as workdir:
+            upgraded = sqlite3.connect(Path(workdir) / "upgraded.db")
+            try:
+                source.backup(upgraded)
+                try:
+                    migrated_to = db.migrate(upgraded)
+                except sqlite3.Error as e:
+                    raise ValueError(
+                        f"{snapshot} can't be migrated from schema version "
+                        f"{info['schema']}: {e}"
+                    ) from None
+                _copy_into_database(upgraded, snapshot, progress)
+            finally:
+                upgraded.close()
+
+    return {**info, "path": snapshot, "migrated_to": migrated_to}
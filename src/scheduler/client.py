@@ -0,0 +1,80 @@
+"""Forward CLI commands to a running `scheduler serve` daemon, if any."""
+
+import http.client
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from scheduler import db
+
+TIMEOUT = 5.0
+
+
+class ServiceError(Exception):
+    """The daemon rejected a request."""
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP over a Unix domain socket."""
+
+    def __init__(self, path: str, timeout: float = TIMEOUT):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def service_file() -> Path:
+    """Where a daemon serving the current database advertises its address."""
+    return db.DATABASE_PATH.with_name(db.DATABASE_PATH.name + ".serve.json")
+
+
+def request(
+    method: str, path: str, payload: Optional[Dict] = None
+) -> Optional[Dict[str, Any]]:
+    """Send a request to the daemon serving the current database.
+
+    Returns None when no daemon is running (or SCHEDULER_DAEMON=off), so the
+    caller can fall back to doing the work in-process. Once connected, a
+    failure raises ServiceError instead: the daemon may already have applied
+    the request, and doing it again in-process could apply a write twice.
+    """
+    if os.getenv("SCHEDULER_DAEMON", "").lower() == "off":
+        return None
+    try:
+        address = json.loads(service_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if "socket" in address:
+        conn = UnixHTTPConnection(address["socket"])
+    else:
+        conn = http.client.HTTPConnection(
+            address["host"], address["port"], timeout=TIMEOUT
+        )
+
+    body = json.dumps(payload).encode() if payload is not None else None
+    try:
+        try:
+            conn.connect()
+        except OSError:
+            # Stale address file from a daemon that is gone
+            return None
+        conn.request(
+            method, path, body=body, headers={"Content-Type": "application/json"}
+        )
+        response = conn.getresponse()
+        data = json.loads(response.read() or b"{}")
+    except (OSError, http.client.HTTPException, ValueError) as e:
+        raise ServiceError(f"Lost the daemon's reply to {method} {path}: {e}")
+    finally:
+        conn.close()
+
+    if response.status >= 400:
+        raise ServiceError(data.get("error", response.reason))
+    return data
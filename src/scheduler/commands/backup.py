@@ -0,0 +1,133 @@
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.progress import BarColumn, Progress, TextColumn
+
+from scheduler import db
+from scheduler.backup import (
+    PAGES_PER_STEP,
+    backup_database,
+    latest_snapshot,
+    restore_database,
+    snapshot_dir,
+    snapshot_path,
+)
+from scheduler.constants import BACKUPS_DIR
+
+console = Console()
+
+# Unreadable snapshots surface as any of these
+SNAPSHOT_ERRORS = (ValueError, OSError, EOFError, sqlite3.Error)
+
+
+def _size(count: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GiB"
+
+
+def backup(
+    output: Optional[Path] = typer.Option(
+        None, help=f"Snapshot file (default: a timestamped file in {BACKUPS_DIR})"
+    ),
+    compress: bool = typer.Option(False, "--gzip", help="Gzip the snapshot"),
+    verify: bool = typer.Option(
+        True, "--verify/--no-verify", help="Run an integrity check on the snapshot"
+    ),
+    pages: int = typer.Option(
+        PAGES_PER_STEP, min=1, help="Pages copied per step; others get in between"
+    ),
+):
+    """Snapshot the database while it stays in use."""
+    if not db.DATABASE_PATH.exists():
+        console.print(f"❌ No database at {db.DATABASE_PATH}", style="red")
+        raise typer.Exit(1)
+
+    compress = compress or (output is not None and output.suffix == ".gz")
+    destination = output or snapshot_path(compress=compress)
+
+    started = time.perf_counter()
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.percentage:>3.0f}%"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Copying pages...", total=None)
+        try:
+            info = backup_database(
+                destination,
+                compress=compress,
+                verify=verify,
+                pages=pages,
+                progress=lambda _, remaining, total: progress.update(
+                    task, total=total, completed=total - remaining
+                ),
+            )
+        except SNAPSHOT_ERRORS as e:
+            console.print(f"❌ Backup failed: {e}", style="red")
+            raise typer.Exit(1)
+
+    console.print(
+        f"💾 Saved {info['pages']} pages ({_size(info['pages'] * info['page_size'])}) "
+        f"to {destination} ({_size(info['bytes'])}) "
+        f"in {time.perf_counter() - started:.1f}s"
+        + (", integrity ok" if verify else ""),
+        style="green",
+    )
+
+
+def restore(
+    snapshot: Optional[Path] = typer.Argument(
+        None,
+        exists=True,
+        dir_okay=False,
+        help="Snapshot (.db or .db.gz); default: the latest backup",
+    ),
+    verify: bool = typer.Option(
+        True, "--verify/--no-verify", help="Check the snapshot before restoring it"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Replace the contents of an existing database"
+    ),
+):
+    """Replace the database's contents with a snapshot, in one transaction."""
+    snapshot = snapshot or latest_snapshot()
+    if snapshot is None:
+        console.print(
+            f"❌ No snapshots of this database in {snapshot_dir()}", style="red"
+        )
+        raise typer.Exit(1)
+
+    if db.DATABASE_PATH.exists() and not force:
+        console.print(
+            f"Database already exists at {db.DATABASE_PATH}. "
+            f"Use --force to replace it with {snapshot}.",
+            style="yellow",
+        )
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    with console.status(f"Restoring {snapshot}..."):
+        try:
+            info = restore_database(snapshot, verify=verify)
+        except SNAPSHOT_ERRORS as e:
+            console.print(f"❌ Restore failed: {e}", style="red")
+            raise typer.Exit(1)
+
+    migrated = (
+        f", migrated from schema {info['schema']} to {info['migrated_to']}"
+        if info["migrated_to"] != info["schema"]
+        else ""
+    )
+    console.print(
+        f"✅ Restored {info['pages']} pages from {snapshot} "
+        f"in {time.perf_counter() - started:.1f}s{migrated}",
+        style="green",
+    )
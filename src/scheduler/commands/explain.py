@@ -0,0 +1,159 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from scheduler import db
+from scheduler.constants import DAYS_FOR_TRACK_ROTATION, MAX_APPEARANCES_PER_WEEK
+from scheduler.scheduler import ScoreBreakdown, get_schedule, get_score_breakdowns
+
+console = Console()
+
+COMPONENTS = (
+    ("Total", "total"),
+    ("Progress", "progress"),
+    ("Recency", "recency"),
+    ("Rotation", "rotation"),
+    ("Category", "category"),
+    ("Bonus", "diversity_bonus"),
+)
+
+
+def explain(
+    day: datetime = typer.Argument(
+        ..., formats=["%Y-%m-%d"], help="Planned date to explain"
+    ),
+    track: Optional[str] = typer.Argument(None, help="Explain a single track"),
+):
+    """Show the stored scores behind a day's schedule, or one track's outcome."""
+    date_str = day.date().isoformat()
+    conn = db.connect(readonly=True)
+
+    schedule = get_schedule(conn, date_str)
+    if schedule is None:
+        console.print(f"❌ No schedule for {date_str}", style="red")
+        raise typer.Exit(1)
+
+    scores = get_score_breakdowns(conn, date_str)
+    if not scores:
+        console.print(
+            f"ℹ️  No scores stored for {date_str}; it was planned before they were "
+            f"kept. Run 'generate --from {date_str} --force' to replan it.",
+            style="yellow",
+        )
+        return
+
+    core, extra = schedule
+    slots = {title: "Core" for title in core} | {title: "Extra" for title in extra}
+
+    if track is None:
+        show_day(date_str, scores, slots)
+    else:
+        show_track(conn, day.date(), track, scores, slots, core + extra)
+
+
+def show_day(date_str: str, scores: Dict[str, ScoreBreakdown], slots: Dict[str, str]):
+    table = Table(
+        title=f"📊 Scores for {date_str}", show_header=True, header_style="bold cyan"
+    )
+    table.add_column("Rank", justify="right")
+    table.add_column("Track", style="yellow")
+    table.add_column("Slot")
+    for label, _ in COMPONENTS:
+        table.add_column(label, justify="right")
+
+    for rank, (title, breakdown) in enumerate(scores.items(), 1):
+        table.add_row(
+            str(rank),
+            title,
+            slots.get(title, ""),
+            *(f"{getattr(breakdown, field):.3f}" for _, field in COMPONENTS),
+        )
+
+    console.print(table)
+
+
+def show_track(
+    conn,
+    day: date,
+    track: str,
+    scores: Dict[str, ScoreBreakdown],
+    slots: Dict[str, str],
+    picks: list,
+):
+    ranks = {title: rank for rank, title in enumerate(scores, 1)}
+    last_pick = picks[-1] if picks else None
+
+    if track in slots:
+        console.print(
+            f"✅ {track} was picked on {day}: {slots[track]} (rank {ranks[track]})",
+            style="green",
+        )
+    elif track in scores:
+        gap = scores[last_pick].total - scores[track].total if last_pick else 0
+        console.print(
+            f"❌ {track} ranked {ranks[track]} on {day}, {gap:.3f} below the last "
+            f"pick ({last_pick})",
+            style="yellow",
+        )
+    else:
+        explain_unranked(conn, day, track, scores)
+        return
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Component")
+    table.add_column(track, justify="right", style="yellow")
+    compare = last_pick if last_pick and last_pick != track else None
+    if compare:
+        table.add_column(f"{compare} (last pick)", justify="right")
+
+    rows = [(label, field, "{:.3f}") for label, field in COMPONENTS] + [
+        ("Completion %", "completion_ratio", "{:.1%}"),
+        ("Days Since Last", "days_since_last", "{}"),
+        ("Recent Appearances", "recent_appearances", "{}"),
+    ]
+    for label, field, fmt in rows:
+        cells = [fmt.format(getattr(scores[track], field))]
+        if compare:
+            cells.append(fmt.format(getattr(scores[compare], field)))
+        table.add_row(label, *cells)
+
+    console.print(table)
+
+
+def explain_unranked(conn, day: date, track: str, scores: Dict[str, ScoreBreakdown]):
+    """Say why a track has no stored score for the day."""
+    row = conn.execute("SELECT active FROM tracks WHERE title = ?", (track,)).fetchone()
+    if row is None:
+        console.print(f"❌ Unknown track '{track}'", style="red")
+        raise typer.Exit(1)
+    if not row[0]:
+        console.print(
+            f"⏸️  {track} is not active, so it is never scored", style="yellow"
+        )
+        return
+
+    window_start = day - timedelta(days=DAYS_FOR_TRACK_ROTATION)
+    appearances = conn.execute(
+        """
+        SELECT COUNT(*) FROM schedule_entries
+        WHERE track = ? AND slot = 'core' AND date >= ? AND date < ?
+    """,
+        (track, window_start.isoformat(), day.isoformat()),
+    ).fetchone()[0]
+    if appearances >= MAX_APPEARANCES_PER_WEEK:
+        console.print(
+            f"⏭️  {track} was skipped on {day}: already core {appearances} times in "
+            f"the {DAYS_FOR_TRACK_ROTATION} days before",
+            style="yellow",
+        )
+        return
+
+    lowest = min(breakdown.total for breakdown in scores.values())
+    console.print(
+        f"❌ {track} was not among the {len(scores)} best-scored tracks on {day} "
+        f"(lowest kept total {lowest:.3f}), or was already completed",
+        style="yellow",
+    )
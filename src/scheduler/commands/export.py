@@ -1,5 +1,7 @@
 import sqlite3
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import typer
 from platformdirs import user_downloads_dir
@@ -11,46 +13,79 @@ console = Console()
 
 DOWNLOADS_DIR = Path(user_downloads_dir())
 
+WRITERS = {
+    "csv": utils.stream_csv,
+    "json": utils.stream_json,
+    "ndjson": utils.stream_ndjson,
+}
+
 
 def export(
     table: str = typer.Argument(help="Table name to export"),
-    format: str = typer.Option("csv", help="Export format: csv or json"),
+    format: str = typer.Option("csv", help="Export format: csv, json or ndjson"),
     output: str = typer.Option("progress", help="Output filename (w/o extension)"),
-    where: str = typer.Option("", help="SQL WHERE clause"),
+    where: str = typer.Option("", help="Raw SQL WHERE clause"),
     week: bool = typer.Option(False, help="Export current week only"),
+    start: Optional[datetime] = typer.Option(
+        None, "--from", formats=["%Y-%m-%d"], help="Export rows on or after date"
+    ),
+    end: Optional[datetime] = typer.Option(
+        None, "--to", formats=["%Y-%m-%d"], help="Export rows on or before date"
+    ),
+    compress: bool = typer.Option(False, "--gzip", help="Gzip the output file"),
+    batch_size: int = typer.Option(1000, help="Rows fetched per batch"),
 ):
-    """Export data from the database to CSV or JSON."""
-    conn = db.connect()
+    """Export data from the database to CSV, JSON or NDJSON."""
+    if week and (start or end):
+        raise typer.BadParameter("--week can't be combined with --from/--to")
+    if format not in WRITERS:
+        console.print(
+            f"❌ Unsupported format. Choose one of: {', '.join(WRITERS)}.", style="red"
+        )
+        return
+
+    conn = db.connect(readonly=True)
     cursor = conn.cursor()
 
     try:
-        query = f"SELECT * FROM {table}"
+        if not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?",
+            (table,),
+        ).fetchone():
+            console.print(f"❌ Unknown table '{table}'", style="red")
+            return
+
+        query = f'SELECT * FROM "{table}"'
+        clauses = []
+        params = []
 
         if week:
-            start, end = utils.get_week_range()
-            query += f" WHERE date BETWEEN '{start}' AND '{end}'"
-        elif where:
-            query += f" WHERE {where}"
+            clauses.append("date BETWEEN ? AND ?")
+            params.extend(utils.get_week_range())
+        if start:
+            clauses.append("date >= ?")
+            params.append(start.date().isoformat())
+        if end:
+            clauses.append("date <= ?")
+            params.append(end.date().isoformat())
+        if where:
+            clauses.append(f"({where})")
 
-        rows = cursor.execute(query).fetchall()
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+
+        cursor.execute(query, params)
         colnames = [description[0] for description in cursor.description]
-        data = [dict(zip(colnames, row)) for row in rows]
 
-        out_path = DOWNLOADS_DIR / f"{output}.{format}"
+        out_path = DOWNLOADS_DIR / f"{output}.{format}{'.gz' if compress else ''}"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if format == "csv":
-            utils.export_to_csv(data, fieldnames=colnames, filename=out_path)
-        elif format == "json":
-            utils.export_to_json(data, filename=out_path)
-        else:
-            console.print("❌ Unsupported format. Choose 'csv' or 'json'.", style="red")
-            return
+        with utils.open_export(out_path, compress) as f:
+            count = WRITERS[format](utils.iter_rows(cursor, batch_size), colnames, f)
 
         console.print(
-            f"✅ Exported {len(data)} rows from '{table}' to '{out_path}'",
+            f"✅ Exported {count} rows from '{table}' to '{out_path}'",
             style="green",
         )
     except sqlite3.Error as e:
         console.print(f"❌ Database error: {e}", style="red")
-    finally:
-        conn.close()
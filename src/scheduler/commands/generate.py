@@ -1,9 +1,17 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from scheduler.scheduler import generate_schedule
+from scheduler import client, db
+from scheduler.constants import PROFILES_DIR
+from scheduler.scheduler import ScoreBreakdown, generate_range, generate_schedule
 
 console = Console()
 
@@ -11,8 +19,43 @@ console = Console()
 def generate(
     force: bool = typer.Option(False, help="Force regenerate today's schedule"),
     show_scores: bool = typer.Option(False, help="Show detailed scoring breakdown"),
+    start: Optional[datetime] = typer.Option(
+        None,
+        "--from",
+        formats=["%Y-%m-%d"],
+        help="First day of a range to plan (default today)",
+    ),
+    end: Optional[datetime] = typer.Option(
+        None,
+        "--to",
+        formats=["%Y-%m-%d"],
+        help="Last day of a range to plan (default --from)",
+    ),
+    all_profiles: bool = typer.Option(
+        False, "--all-profiles", help="Plan every named profile in parallel"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, help="Worker processes for --all-profiles (default: CPU count)"
+    ),
 ):
     """Generate today's track schedule using deterministic algorithm."""
+    if workers is not None and not all_profiles:
+        raise typer.BadParameter("--workers only applies with --all-profiles")
+    if show_scores and (all_profiles or start or end):
+        raise typer.BadParameter(
+            "--show-scores only applies to today's schedule; "
+            "use 'scheduler explain DATE' for other days"
+        )
+    if all_profiles:
+        first = start or datetime.today()
+        generate_profiles(first.date(), (end or first).date(), force, workers)
+        return
+
+    if start or end:
+        # --from alone plans a single day, --to alone plans from today
+        first = start or datetime.today()
+        generate_days(first.date(), (end or first).date(), force)
+        return
 
     with Progress(
         SpinnerColumn(),
@@ -21,7 +64,23 @@ def generate(
     ) as progress:
         task = progress.add_task("Generating optimal schedule...", total=None)
 
-        core, extra, score_details = generate_schedule(force=force)
+        try:
+            forwarded = client.request(
+                "POST", "/generate", {"force": force, "scores": show_scores}
+            )
+        except client.ServiceError as e:
+            console.print(f"❌ Error generating schedule: {e}", style="red")
+            raise typer.Exit(1)
+        if forwarded is not None:
+            core, extra = forwarded["core"], forwarded["extra"]
+            score_details = {
+                track: ScoreBreakdown(**details)
+                for track, details in forwarded["details"].items()
+            }
+        else:
+            core, extra, score_details = generate_schedule(
+                force=force, explain=show_scores
+            )
 
         progress.update(task, completed=100, description="Schedule generated!")
 
@@ -54,17 +113,136 @@ def generate(
 
         # Show top 10 scores
         sorted_tracks = sorted(
-            score_details.items(), key=lambda x: x[1]["total"], reverse=True
+            score_details.items(), key=lambda x: x[1].total, reverse=True
         )
         for track, details in sorted_tracks[:10]:
             score_table.add_row(
                 track,
-                f"{details['total']:.3f}",
-                f"{details['progress']:.3f}",
-                f"{details['recency']:.3f}",
-                f"{details['rotation']:.3f}",
-                f"{details['category']:.3f}",
-                f"{details['completion_ratio'] * 100:.1f}%",
+                f"{details.total:.3f}",
+                f"{details.progress:.3f}",
+                f"{details.recency:.3f}",
+                f"{details.rotation:.3f}",
+                f"{details.category:.3f}",
+                f"{details.completion_ratio * 100:.1f}%",
             )
 
         console.print(score_table)
+
+
+def generate_days(start_date: date, end_date: date, force: bool):
+    """Plan a range of days in one pass and show the resulting schedules."""
+    if end_date < start_date:
+        console.print("❌ --to must not be before --from", style="red")
+        raise typer.Exit(1)
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Planning schedules...", total=None)
+
+        results = generate_range(start_date, end_date, force=force)
+
+        progress.update(task, completed=100, description="Schedules generated!")
+
+    table = Table(
+        title=f"📅 Learning Schedule ({start_date} to {end_date})",
+        show_header=True,
+        header_style="bold cyan",
+    )
+    table.add_column("Date", style="cyan")
+    table.add_column("🎯 Core", style="yellow")
+    table.add_column("⭐ Extra", style="green")
+
+    for date_str, (core, extra, _) in results.items():
+        table.add_row(date_str, ", ".join(core), ", ".join(extra) if extra else "None")
+
+    console.print(table)
+
+
+def plan_profile(
+    name: str, start_date: date, end_date: date, force: bool
+) -> Tuple[str, Dict[str, Tuple[List[str], List[str]]], Optional[str]]:
+    """Plan one profile's days; runs in a worker process."""
+    try:
+        db.use_profile(name)
+        results = generate_range(start_date, end_date, force=force)
+        return (
+            name,
+            {day: (core, extra) for day, (core, extra, _) in results.items()},
+            None,
+        )
+    except Exception as e:
+        # One broken profile must not abort the whole batch
+        return name, {}, str(e)
+    finally:
+        db.close_all()
+
+
+def generate_profiles(
+    start_date: date, end_date: date, force: bool, workers: Optional[int]
+):
+    """Plan every named profile across a process pool and summarize the results."""
+    if end_date < start_date:
+        console.print("❌ --to must not be before --from", style="red")
+        raise typer.Exit(1)
+
+    names = db.list_profiles()
+    if not names:
+        console.print(f"No profiles found in {PROFILES_DIR}", style="yellow")
+        return
+
+    workers = min(workers or os.cpu_count() or 1, len(names))
+    # Hand out profiles in chunks so thousands of small jobs don't pay one
+    # round trip each, while still leaving a few chunks per worker to balance
+    chunksize = max(1, len(names) // (workers * 4))
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task(
+            f"Planning {len(names)} profiles on {workers} workers...", total=None
+        )
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(
+                pool.map(
+                    plan_profile,
+                    names,
+                    repeat(start_date),
+                    repeat(end_date),
+                    repeat(force),
+                    chunksize=chunksize,
+                )
+            )
+
+        progress.update(task, completed=100, description="Schedules generated!")
+
+    table = Table(
+        title=f"📅 Profiles ({start_date} to {end_date})",
+        show_header=True,
+        header_style="bold cyan",
+    )
+    table.add_column("Profile", style="cyan")
+    table.add_column("Days", justify="right")
+    table.add_column(f"🎯 Core ({end_date})", style="yellow")
+    table.add_column("⭐ Extra", style="green")
+
+    failed = 0
+    for name, results, error in outcomes:
+        if error is not None:
+            failed += 1
+            table.add_row(name, "-", f"[red]❌ {error}[/red]", "")
+            continue
+        core, extra = results[end_date.isoformat()]
+        table.add_row(
+            name, str(len(results)), ", ".join(core), ", ".join(extra) or "None"
+        )
+
+    console.print(table)
+    if failed:
+        console.print(f"⚠️  {failed} of {len(names)} profile(s) failed", style="yellow")
+        raise typer.Exit(1)
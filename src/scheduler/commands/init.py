@@ -1,25 +1,34 @@
+import sqlite3
+
 import typer
 from rich.console import Console
 
 from scheduler import db
-from scheduler.constants import DATA_DIR, DATABASE_PATH
+from scheduler.backup import backup_database, snapshot_path
 
 console = Console()
 
 
 def init(
     force: bool = typer.Option(False, "--force", help="Reinitialize database"),
+    snapshot: bool = typer.Option(
+        True,
+        "--snapshot/--no-snapshot",
+        help="Back up the existing database before --force deletes it",
+    ),
 ):
     """Initialize user data directory and database.
 
     This command sets up the necessary directories and initializes the database.
     If the database already exists, it will be deleted and recreated.
 
-    Use the --force option to skip confirmation.
+    Use the --force option to skip confirmation. The existing database is
+    first saved as a compressed snapshot (see `restore`) unless --no-snapshot.
     """
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    database_path = db.DATABASE_PATH
+    database_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if DATABASE_PATH.exists() and not force:
+    if database_path.exists() and not force:
         console.print(
             "Database already exists. Use --force to recreate.", style="yellow"
         )
@@ -27,9 +36,26 @@ def init(
         typer.echo("Use --force to recreate the database.")
         raise typer.Exit()
 
-    if DATABASE_PATH.exists():
-        DATABASE_PATH.unlink()
+    if database_path.exists():
+        if snapshot:
+            try:
+                # Straight from the file: the old schema is kept, not migrated
+                saved = backup_database(
+                    snapshot_path(compress=True), compress=True, source=database_path
+                )
+            except (ValueError, OSError, sqlite3.Error) as e:
+                console.print(f"❌ Snapshot failed: {e}", style="red")
+                console.print(
+                    "Nothing was deleted. Use --no-snapshot to recreate anyway.",
+                    style="yellow",
+                )
+                raise typer.Exit(1)
+            console.print(f"💾 Snapshot saved to {saved['path']}", style="green")
+
+        db.close_all()
+        for suffix in ("", "-wal", "-shm"):
+            database_path.with_name(database_path.name + suffix).unlink(missing_ok=True)
         console.print("🗑️  Existing DB deleted.", style="yellow")
 
     db.initialize()
-    console.print(f"✅ Database initialized at {DATABASE_PATH}", style="green")
+    console.print(f"✅ Database initialized at {database_path}", style="green")
@@ -1,111 +1,399 @@
-from datetime import date
+import csv
+import io
+import json
+import sqlite3
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
 import typer
 from rich.console import Console
 
-from scheduler import db
+from scheduler import client, db
 
 console = Console()
 
+VALID_STATUSES = ["not_started", "in_progress", "completed"]
+
+LogRecord = Tuple[str, str, str, int]  # (date, track, status, exercises)
+
+FIELDS = ("date", "track", "status", "exercises")
+FILE_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+def write_log(
+    conn: sqlite3.Connection, track: str, status: str, exercises: int, day_str: str
+) -> Optional[str]:
+    """Log a track's status and adjust its completed count, without committing.
+
+    Returns the previously logged status, or None for a new entry.
+    """
+    if status not in VALID_STATUSES:
+        raise ValueError(f"Invalid status. Must be one of: {', '.join(VALID_STATUSES)}")
+    if not conn.execute("SELECT 1 FROM tracks WHERE title = ?", (track,)).fetchone():
+        raise ValueError(f"Unknown track: {track}")
+
+    # Check if already logged today
+    cursor = conn.execute(
+        "SELECT status FROM logs WHERE date = ? AND track = ?",
+        (day_str, track),
+    )
+    existing = cursor.fetchone()
+
+    if existing:
+        # Update existing entry, don't increment again
+        old_status = existing[0]
+        conn.execute(
+            "UPDATE logs SET status = ? WHERE date = ? AND track = ?",
+            (status, day_str, track),
+        )
+
+        # Handle track completion count changes
+        if old_status != "completed" and status == "completed":
+            # Changing from not-completed to completed - increment
+            conn.execute(
+                "UPDATE tracks SET completed = completed + ? WHERE title = ?",
+                (exercises, track),
+            )
+        elif old_status == "completed" and status != "completed":
+            # Changing from completed to not-completed - decrement
+            conn.execute(
+                "UPDATE tracks SET completed = completed - ? WHERE title = ? AND completed >= ?",
+                (exercises, track, exercises),
+            )
+        return old_status
+
+    # New entry, safe to insert and increment
+    conn.execute(
+        "INSERT INTO logs (date, track, status) VALUES (?, ?, ?)",
+        (day_str, track, status),
+    )
+
+    # Only increment track completion count if status is 'completed'
+    if status == "completed":
+        conn.execute(
+            "UPDATE tracks SET completed = completed + ? WHERE title = ?",
+            (exercises, track),
+        )
+    return None
+
+
+def read_records(f: TextIO, format: Optional[str] = None) -> Iterator[LogRecord]:
+    """Parse CSV (with a header row) or NDJSON log records.
+
+    Each record needs a track; date defaults to today, status to completed
+    and exercises to 1. Dates may carry a time, which is ignored.
+    """
+    if format is None:
+        # Sniff stdin and unknown extensions from the first character
+        head = f.read(1)
+        while head.isspace():
+            head = f.read(1)
+        format = "ndjson" if head == "{" else "csv"
+        f = io.StringIO(head + f.read())
+
+    if format == "csv":
+        rows: Iterable[Union[Dict, str]] = csv.DictReader(f)
+        start = 2
+    elif format == "ndjson":
+        rows = (line for line in f if line.strip())
+        start = 1
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+    return parse_records(rows, start)
+
+
+def parse_records(
+    rows: Iterable[Union[Dict, str]], start: int = 1
+) -> Iterator[LogRecord]:
+    """Validate {date, track, status, exercises} mappings into log records.
+
+    Rows may also be NDJSON lines, decoded here so that malformed ones are
+    reported with their record number like any other invalid record.
+    """
+    today = date.today().isoformat()
+    for number, row in enumerate(rows, start):
+        try:
+            if isinstance(row, str):
+                row = json.loads(row)
+            if not isinstance(row, dict):
+                raise ValueError("not an object")
+            track = row["track"]
+            if not track:
+                raise ValueError("missing track")
+            day = date.fromisoformat(str(row.get("date") or today)[:10])
+            status = row.get("status") or "completed"
+            if status not in VALID_STATUSES:
+                raise ValueError(f"invalid status {status!r}")
+            exercises = row.get("exercises")
+            exercises = 1 if exercises in (None, "") else int(exercises)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Record {number}: {e}") from None
+        yield day.isoformat(), track, status, exercises
+
+
+def write_logs(conn: sqlite3.Connection, records: Iterable[LogRecord]) -> Dict:
+    """Apply many log records in one pass, without committing.
+
+    The result matches calling write_log for each record in order: a record
+    adds its exercises to the track's completed count only when its (date,
+    track) moves to completed, and takes them back when it moves away.
+    """
+    conn.execute("DROP TABLE IF EXISTS temp.incoming_logs")
+    conn.execute(
+        """
+        CREATE TEMP TABLE incoming_logs (
+            seq INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            track TEXT NOT NULL,
+            status TEXT NOT NULL,
+            exercises INTEGER NOT NULL
+        )
+    """
+    )
+    try:
+        conn.executemany(
+            "INSERT INTO incoming_logs (date, track, status, exercises) "
+            "VALUES (?, ?, ?, ?)",
+            records,
+        )
+        unknown = [
+            track
+            for (track,) in conn.execute(
+                """
+                SELECT DISTINCT track FROM incoming_logs
+                WHERE track NOT IN (SELECT title FROM tracks)
+                ORDER BY track
+            """
+            )
+        ]
+        if unknown:
+            raise ValueError(f"Unknown track(s): {', '.join(unknown)}")
+
+        total, inserted = conn.execute(
+            """
+            SELECT COUNT(*), COUNT(*) FILTER (WHERE first AND logs.rowid IS NULL)
+            FROM (
+                SELECT date, track,
+                       seq = MIN(seq) OVER (PARTITION BY date, track) AS first
+                FROM incoming_logs
+            )
+            LEFT JOIN logs USING (date, track)
+        """
+        ).fetchone()
+
+        # A record's previous status is the record before it for the same
+        # (date, track), or the stored log for the first one. Keep each
+        # change to a completed count with its running total per track.
+        conn.execute("DROP TABLE IF EXISTS temp.log_deltas")
+        conn.execute(
+            """
+            CREATE TEMP TABLE log_deltas AS
+            SELECT track, seq, delta,
+                   SUM(delta) OVER (PARTITION BY track ORDER BY seq) AS running
+            FROM (
+                SELECT track, seq,
+                       CASE
+                           WHEN status = 'completed' AND previous IS NOT 'completed'
+                               THEN exercises
+                           WHEN status != 'completed' AND previous IS 'completed'
+                               THEN -exercises
+                           ELSE 0
+                       END AS delta
+                FROM (
+                    SELECT incoming.*,
+                           COALESCE(
+                               LAG(incoming.status) OVER (
+                                   PARTITION BY incoming.date, incoming.track
+                                   ORDER BY incoming.seq
+                               ),
+                               logs.status
+                           ) AS previous
+                    FROM incoming_logs AS incoming
+                    LEFT JOIN logs USING (date, track)
+                )
+            )
+            WHERE delta != 0
+        """
+        )
+        before = conn.execute(
+            "SELECT COALESCE(SUM(completed), 0) FROM tracks"
+            " WHERE title IN (SELECT track FROM log_deltas)"
+        ).fetchone()[0]
+
+        # write_log skips a decrement that would go below zero. Tracks that
+        # never get there take their net change; replay the others in order.
+        per_track = """
+            SELECT track, SUM(delta) AS delta, MIN(running) AS low
+            FROM log_deltas GROUP BY track
+        """
+        replayed: Dict[str, int] = {}
+        for track, completed, delta in conn.execute(
+            f"""
+            SELECT log_deltas.track, tracks.completed, log_deltas.delta
+            FROM log_deltas
+            JOIN ({per_track}) AS totals USING (track)
+            JOIN tracks ON tracks.title = log_deltas.track
+            WHERE tracks.completed + totals.low < 0
+            ORDER BY log_deltas.track, log_deltas.seq
+        """
+        ):
+            completed = replayed.get(track, completed)
+            if completed + delta >= 0:
+                completed += delta
+            replayed[track] = completed
+        conn.execute(
+            f"""
+            UPDATE tracks SET completed = completed + totals.delta
+            FROM ({per_track}) AS totals
+            WHERE tracks.title = totals.track AND tracks.completed + totals.low >= 0
+        """
+        )
+        conn.executemany(
+            "UPDATE tracks SET completed = ? WHERE title = ?",
+            [(completed, track) for track, completed in replayed.items()],
+        )
+        after = conn.execute(
+            "SELECT COALESCE(SUM(completed), 0) FROM tracks"
+            " WHERE title IN (SELECT track FROM log_deltas)"
+        ).fetchone()[0]
+
+        # The last record for each (date, track) is the status that sticks
+        conn.execute(
+            """
+            INSERT INTO logs (date, track, status)
+            SELECT date, track, status FROM incoming_logs
+            WHERE seq IN (
+                SELECT MAX(seq) FROM incoming_logs GROUP BY date, track
+            )
+            ORDER BY date, track
+            ON CONFLICT(date, track) DO UPDATE SET status = excluded.status
+        """
+        )
+    finally:
+        conn.execute("DROP TABLE IF EXISTS temp.incoming_logs")
+        conn.execute("DROP TABLE IF EXISTS temp.log_deltas")
+
+    return {
+        "records": total,
+        "inserted": inserted,
+        "updated": total - inserted,
+        "completed": after - before,
+    }
+
+
+def record_log(track: str, status: str, exercises: int, day: date) -> Optional[str]:
+    """Log a track's status for `day` in its own transaction."""
+    conn = db.connect()
+    with conn:
+        return write_log(conn, track, status, exercises, day.isoformat())
+
+
+def record_logs(records: List[LogRecord]) -> Dict:
+    """Apply many log records in a single transaction."""
+    conn = db.connect()
+    with conn:
+        return write_logs(conn, records)
+
+
+def import_logs(path: Path, format: Optional[str] = None) -> None:
+    """Log every record in a CSV/NDJSON file, or stdin for '-'."""
+    if format is None:
+        format = FILE_FORMATS.get(path.suffix.lower())
+    try:
+        if str(path) == "-":
+            records = list(read_records(sys.stdin, format))
+        else:
+            with path.open(encoding="utf-8", newline="") as f:
+                records = list(read_records(f, format))
+
+        forwarded = client.request(
+            "POST", "/logs", {"records": [dict(zip(FIELDS, r)) for r in records]}
+        )
+        counts = forwarded or record_logs(records)
+    except Exception as e:
+        console.print(f"❌ Error importing logs: {e}", style="red")
+        raise typer.Exit(1)
+
+    console.print(
+        f"📥 Imported {counts['records']} record(s): {counts['inserted']} new, "
+        f"{counts['updated']} updated, {counts['completed']:+d} exercise(s) completed",
+        style="green",
+    )
+
 
 def log(
-    track: str = typer.Argument(help="Track title to log progress for"),
+    track: Optional[str] = typer.Argument(None, help="Track title to log progress for"),
     status: str = typer.Option(
         "completed", help="Status: completed, in_progress, not_started"
     ),
     exercises: int = typer.Option(
         1, help="Number of exercises completed (only for completed status)"
     ),
+    day: Optional[datetime] = typer.Option(
+        None, "--date", formats=["%Y-%m-%d"], help="Day to log for (default today)"
+    ),
+    file: Optional[Path] = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="Log date,track,status,exercises records from a CSV or NDJSON file "
+        "('-' reads stdin)",
+    ),
+    format: Optional[str] = typer.Option(
+        None, help="File format: csv or ndjson (default: from the extension)"
+    ),
 ):
-    """Log daily progress for a track."""
-    today_str = date.today().isoformat()
+    """Log daily progress for a track, or many records from a file."""
+    if file is not None:
+        import_logs(file, format)
+        return
+    if track is None:
+        console.print("❌ Give a track to log, or --file to import", style="red")
+        raise typer.Exit(1)
 
     # Validate status
-    valid_statuses = ["not_started", "in_progress", "completed"]
-    if status not in valid_statuses:
+    if status not in VALID_STATUSES:
         console.print(
-            f"❌ Invalid status. Must be one of: {', '.join(valid_statuses)}",
+            f"❌ Invalid status. Must be one of: {', '.join(VALID_STATUSES)}",
             style="red",
         )
         return
 
+    logged_on = day.date() if day else date.today()
     try:
-        conn = db.connect()
-        with conn:
-            # Check if already logged today
-            cursor = conn.execute(
-                "SELECT status FROM logs WHERE date = ? AND track = ?",
-                (today_str, track),
-            )
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update existing entry, don't increment again
-                old_status = existing[0]
-                conn.execute(
-                    "UPDATE logs SET status = ? WHERE date = ? AND track = ?",
-                    (status, today_str, track),
-                )
-
-                # Handle track completion count changes
-                if old_status != "completed" and status == "completed":
-                    # Changing from not-completed to completed - increment
-                    conn.execute(
-                        "UPDATE tracks SET completed = completed + ? WHERE title = ?",
-                        (exercises, track),
-                    )
-                elif old_status == "completed" and status != "completed":
-                    # Changing from completed to not-completed - decrement
-                    conn.execute(
-                        "UPDATE tracks SET completed = completed - ? WHERE title = ? AND completed >= ?",
-                        (exercises, track, exercises),
-                    )
-
-                # Display update message
-                if status == "pending":
-                    console.print(
-                        f"📝 Updated {track}: 📤 carried over (status: {status})",
-                        style="yellow",
-                    )
-                elif status == "completed":
-                    console.print(
-                        f"📝 Updated {track}: ✅ completed ({exercises} exercise(s))",
-                        style="green",
-                    )
-                elif status == "in_progress":
-                    console.print(f"📝 Updated {track}: 🔄 in progress", style="blue")
-                else:  # not_started
-                    console.print(f"📝 Updated {track}: ⭕ not started", style="gray")
-
-            else:
-                # New entry, safe to insert and increment
-                conn.execute(
-                    "INSERT INTO logs (date, track, status) VALUES (?, ?, ?)",
-                    (today_str, track, status),
-                )
-
-                # Only increment track completion count if status is 'completed'
-                if status == "completed":
-                    conn.execute(
-                        "UPDATE tracks SET completed = completed + ? WHERE title = ?",
-                        (exercises, track),
-                    )
-
-                # Display new entry message
-                if status == "pending":
-                    console.print(
-                        f"📝 Logged {track}: 📤 carried over (status: {status})",
-                        style="yellow",
-                    )
-                elif status == "completed":
-                    console.print(
-                        f"📝 Logged {track}: ✅ completed ({exercises} exercise(s))",
-                        style="green",
-                    )
-                elif status == "in_progress":
-                    console.print(f"📝 Logged {track}: 🔄 in progress", style="blue")
-                else:  # not_started
-                    console.print(f"📝 Logged {track}: ⭕ not started", style="gray")
-
+        forwarded = client.request(
+            "POST",
+            "/log",
+            {
+                "track": track,
+                "status": status,
+                "exercises": exercises,
+                "date": logged_on.isoformat(),
+            },
+        )
+        if forwarded is not None:
+            updated = forwarded["previous_status"] is not None
+        else:
+            updated = record_log(track, status, exercises, logged_on) is not None
     except Exception as e:
         console.print(f"❌ Error logging progress: {e}", style="red")
+        return
+
+    verb = "Updated" if updated else "Logged"
+    if status == "pending":
+        console.print(
+            f"📝 {verb} {track}: 📤 carried over (status: {status})",
+            style="yellow",
+        )
+    elif status == "completed":
+        console.print(
+            f"📝 {verb} {track}: ✅ completed ({exercises} exercise(s))",
+            style="green",
+        )
+    elif status == "in_progress":
+        console.print(f"📝 {verb} {track}: 🔄 in progress", style="blue")
+    else:  # not_started
+        console.print(f"📝 {verb} {track}: ⭕ not started", style="gray")
@@ -9,12 +9,18 @@ from scheduler.models.track import Track
 console = Console()
 
 
-def populate(file: Optional[Path] = typer.Argument(None)):
+def populate(
+    file: Optional[Path] = typer.Argument(None),
+    chunk_size: int = typer.Option(5000, help="Rows written per batch"),
+):
     """Import tracks from tracks.json into the tracks table."""
     try:
         tracks = Track.load_many_from_json(file)
-        for track in tracks:
-            track.save()
-        console.print("✅ Tracks imported from tracks.json into tracks.", style="green")
+        inserted, updated, unchanged = Track.save_many(tracks, chunk_size=chunk_size)
+        console.print(
+            f"✅ Tracks imported from {file.name if file else 'tracks.json'}: "
+            f"{inserted} inserted, {updated} updated, {unchanged} unchanged.",
+            style="green",
+        )
     except Exception as e:
         console.print(f"❌ Error importing tracks: {e}", style="red")
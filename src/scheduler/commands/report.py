@@ -1,32 +1,58 @@
-import json
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
 
+import typer
 from rich.console import Console
 from rich.table import Table
 
-from scheduler import db, utils
+from scheduler import client, db, utils
+from scheduler.scheduler import rebuild_rollups
 
 console = Console()
 
+# Ranges up to this many days also list every scheduled track and log
+DETAIL_DAYS = 7
 
-def report():
-    """Generate a comprehensive weekly learning report."""
-    start_date, end_date = utils.get_week_range()
+COUNT_COLUMNS = ("logged", "completed", "in_progress", "not_started")
 
-    conn = db.connect()
+PERIOD_KEYS = {
+    "day": "date",
+    # Monday of the week
+    "week": "date(date, '-' || ((strftime('%w', date) + 6) % 7) || ' days')",
+    "month": "substr(date, 1, 7)",
+}
+
+
+def _granularity(days: int) -> str:
+    if days <= 31:
+        return "day"
+    if days <= 184:
+        return "week"
+    return "month"
+
+
+def _load_detail(conn, start_date: str, end_date: str) -> Dict:
     cursor = conn.cursor()
 
-    # Get scheduled tracks for the week
+    # Get scheduled tracks for the range
     cursor.execute(
         """
-        SELECT date, core, extra FROM schedule WHERE date BETWEEN ? AND ?
-        ORDER BY date
+        SELECT schedule.date, entries.slot, entries.track
+        FROM schedule
+        LEFT JOIN schedule_entries AS entries ON entries.date = schedule.date
+        WHERE schedule.date BETWEEN ? AND ?
+        ORDER BY schedule.date, entries.slot, entries.position
     """,
         (start_date, end_date),
     )
 
-    weekly_schedule = cursor.fetchall()
+    schedule: Dict[str, Dict[str, List[str]]] = {}
+    for date_str, slot, track in cursor.fetchall():
+        slots = schedule.setdefault(date_str, {"core": [], "extra": []})
+        if slot is not None:
+            slots[slot].append(track)
 
-    # Get progress for the week
+    # Get progress for the range
     cursor.execute(
         """
         SELECT date, track, status FROM logs WHERE date BETWEEN ? AND ?
@@ -35,41 +61,212 @@ def report():
         (start_date, end_date),
     )
 
-    weekly_progress = cursor.fetchall()
-    conn.close()
+    return {"schedule": schedule, "progress": [list(row) for row in cursor]}
 
-    console.print(f"\n📊 Weekly Report ({start_date} to {end_date})", style="bold cyan")
 
-    # Schedule overview
-    schedule_table = Table(title="📅 Weekly Schedule", show_header=True)
-    schedule_table.add_column("Date", style="cyan")
-    schedule_table.add_column("Core Tracks", style="yellow", justify="center")
-    schedule_table.add_column("Extra", style="green")
+def _track_totals(conn, start: date, end: date) -> List[List]:
+    """Per-track counts: whole months from the rollup, edge days from raw rows."""
+    first_month = start.replace(day=1)
+    if first_month < start:
+        first_month = (first_month + timedelta(days=32)).replace(day=1)
+    last_month_end = end
+    if (end + timedelta(days=1)).day != 1:
+        last_month_end = end.replace(day=1) - timedelta(days=1)
+    if first_month < last_month_end:
+        months = (first_month.isoformat()[:7], last_month_end.isoformat()[:7])
+        head_end, tail_start = first_month - timedelta(days=1), last_month_end
+    else:
+        # No whole month in range: read it all from the raw tables
+        months = ("", "")
+        head_end, tail_start = end, end
+    tail_start += timedelta(days=1)
 
-    for row in weekly_schedule:
-        date_str = row[0]
-        core = json.loads(row[1]) if row[1] else []
-        extra = json.loads(row[2]) if row[2] else []
+    edges = "(date BETWEEN :start AND :head_end) OR (date BETWEEN :tail_start AND :end)"
+    rows = conn.execute(
+        f"""
+        SELECT track, SUM(scheduled), SUM(logged), SUM(completed),
+               SUM(in_progress), SUM(not_started)
+        FROM (
+            SELECT track, scheduled, logged, completed, in_progress, not_started
+            FROM monthly_track_rollup
+            WHERE month BETWEEN :first_month AND :last_month
+            UNION ALL
+            SELECT track, 1, 0, 0, 0, 0 FROM schedule_entries WHERE {edges}
+            UNION ALL
+            SELECT track, 0, 1, status IS 'completed', status IS 'in_progress',
+                   status IS 'not_started'
+            FROM logs WHERE {edges}
+        )
+        GROUP BY track
+        HAVING SUM(scheduled) > 0 OR SUM(logged) > 0
+        ORDER BY SUM(completed) DESC, SUM(scheduled) DESC, track
+    """,
+        {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "first_month": months[0],
+            "last_month": months[1],
+            "head_end": head_end.isoformat(),
+            "tail_start": tail_start.isoformat(),
+        },
+    )
+    return [list(row) for row in rows]
+
+
+def load_report(start_date: str, end_date: str) -> Dict:
+    """Totals per period and per track between two ISO dates.
+
+    Counts come from the rollup tables, so the cost depends on the number of
+    days and tracks in range rather than the number of logged rows. Short
+    ranges also carry the full schedule and log listing.
+    """
+    conn = db.connect(readonly=True)
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    granularity = _granularity((end - start).days + 1)
+
+    periods = conn.execute(
+        f"""
+        SELECT {PERIOD_KEYS[granularity]}, SUM(core), SUM(extra), SUM(logged),
+               SUM(completed), SUM(in_progress), SUM(not_started)
+        FROM daily_rollup
+        WHERE date BETWEEN ? AND ?
+        GROUP BY 1
+        ORDER BY 1
+    """,
+        (start_date, end_date),
+    )
 
-        schedule_table.add_row(
-            date_str,
-            ", ".join(core) if core else "None",
-            ", ".join(extra) if extra else "None",
+    data = {
+        "start": start_date,
+        "end": end_date,
+        "granularity": granularity,
+        "periods": [list(row) for row in periods],
+        "tracks": _track_totals(conn, start, end),
+        "schedule": None,
+        "progress": None,
+    }
+    if (end - start).days < DETAIL_DAYS:
+        data.update(_load_detail(conn, start_date, end_date))
+    return data
+
+
+def _report_range(
+    week: bool,
+    month: bool,
+    year: bool,
+    start: Optional[datetime],
+    end: Optional[datetime],
+):
+    if sum((week, month, year, bool(start or end))) > 1:
+        raise typer.BadParameter(
+            "Use only one of --week, --month, --year or --from/--to"
         )
+    if month:
+        return utils.get_month_range()
+    if year:
+        return utils.get_year_range()
+    if start or end:
+        # A missing bound is today, so --to alone runs from today as in generate
+        today = datetime.today()
+        first = (start or today).date()
+        last = (end or today).date()
+        if first > last:
+            raise typer.BadParameter("--from (default today) must not be after --to")
+        return first.isoformat(), last.isoformat()
+    return utils.get_week_range()
+
+
+def _counts_table(title: str, label: str, rows: List[List], scheduled: List[str]):
+    table = Table(title=title, show_header=True)
+    table.add_column(label, style="cyan")
+    for column in scheduled:
+        table.add_column(column, justify="right", style="yellow")
+    for column in COUNT_COLUMNS:
+        table.add_column(column.replace("_", " ").title(), justify="right")
+    for row in rows:
+        table.add_row(*(str(value) for value in row))
+    return table
+
+
+def report(
+    week: bool = typer.Option(False, "--week", help="Report the current week"),
+    month: bool = typer.Option(False, "--month", help="Report the current month"),
+    year: bool = typer.Option(False, "--year", help="Report the current year"),
+    start: Optional[datetime] = typer.Option(
+        None, "--from", formats=["%Y-%m-%d"], help="First day to report (default today)"
+    ),
+    end: Optional[datetime] = typer.Option(
+        None, "--to", formats=["%Y-%m-%d"], help="Last day to report (default today)"
+    ),
+    limit: int = typer.Option(25, help="Most tracks listed (0 lists all)"),
+    rebuild: bool = typer.Option(
+        False, "--rebuild", help="Recompute the rollup tables before reporting"
+    ),
+):
+    """Generate a learning report for the current week or another range."""
+    start_date, end_date = _report_range(week, month, year, start, end)
+
+    if rebuild:
+        rebuild_rollups(db.connect())
+        console.print("🔧 Rebuilt report rollups", style="green")
 
-    console.print(schedule_table)
+    try:
+        data = client.request(
+            "GET", f"/report?from={start_date}&to={end_date}"
+        ) or load_report(start_date, end_date)
+    except client.ServiceError as e:
+        console.print(f"❌ Error loading report: {e}", style="red")
+        raise typer.Exit(1)
 
-    # Progress summary
-    if weekly_progress:
-        progress_table = Table(title="✅ Weekly Progress", show_header=True)
-        progress_table.add_column("Date", style="blue")
-        progress_table.add_column("Track", style="yellow")
-        progress_table.add_column("Status", style="white")
+    console.print(f"\n📊 Report ({start_date} to {end_date})", style="bold cyan")
 
-        for row in weekly_progress:
-            status = str(row[2]).replace("_", " ").title()
-            progress_table.add_row(row[0], row[1], status)
+    if data["schedule"] is not None:
+        # Schedule overview
+        schedule_table = Table(title="📅 Schedule", show_header=True)
+        schedule_table.add_column("Date", style="cyan")
+        schedule_table.add_column("Core Tracks", style="yellow", justify="center")
+        schedule_table.add_column("Extra", style="green")
 
-        console.print(progress_table)
+        for date_str, slots in data["schedule"].items():
+            core = slots["core"]
+            extra = slots["extra"]
+
+            schedule_table.add_row(
+                date_str,
+                ", ".join(core) if core else "None",
+                ", ".join(extra) if extra else "None",
+            )
+
+        console.print(schedule_table)
+
+        # Progress summary
+        if data["progress"]:
+            progress_table = Table(title="✅ Progress", show_header=True)
+            progress_table.add_column("Date", style="blue")
+            progress_table.add_column("Track", style="yellow")
+            progress_table.add_column("Status", style="white")
+
+            for row in data["progress"]:
+                status = str(row[2]).replace("_", " ").title()
+                progress_table.add_row(row[0], row[1], status)
+
+            console.print(progress_table)
+        else:
+            console.print("ℹ️  No progress logged in this range.", style="yellow")
     else:
-        console.print("ℹ️  No progress logged this week.", style="yellow")
+        console.print(
+            _counts_table(
+                f"📅 By {data['granularity'].title()}",
+                data["granularity"].title(),
+                data["periods"],
+                ["Core", "Extra"],
+            )
+        )
+
+    tracks = data["tracks"]
+    if tracks:
+        shown = tracks[:limit] if limit > 0 else tracks
+        table = _counts_table("🎯 By Track", "Track", shown, ["Scheduled"])
+        if len(shown) < len(tracks):
+            table.caption = f"Top {len(shown)} of {len(tracks)} tracks"
+        console.print(table)
@@ -0,0 +1,42 @@
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from scheduler import db
+from scheduler.server import SchedulerServer
+from scheduler.service import MAX_BATCH, READ_WORKERS
+
+console = Console()
+
+
+def serve(
+    host: str = typer.Option("127.0.0.1", help="Address to listen on"),
+    port: int = typer.Option(8765, help="Port to listen on (0 picks a free one)"),
+    socket: Optional[Path] = typer.Option(
+        None, help="Listen on this Unix socket instead of TCP"
+    ),
+    workers: int = typer.Option(READ_WORKERS, help="Threads serving reads"),
+    batch_size: int = typer.Option(
+        MAX_BATCH, help="Most writes grouped into one transaction"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", help="Log every request"),
+):
+    """Serve generate, log, status and report over a local HTTP API.
+
+    While it runs, the CLI forwards those commands to it for the same database.
+    """
+    server = SchedulerServer(workers, batch_size, verbose)
+    asyncio.run(
+        server.run(
+            host,
+            port,
+            socket,
+            on_ready=lambda where: console.print(
+                f"🚀 Serving {db.DATABASE_PATH} on {where}", style="green"
+            ),
+        )
+    )
+    console.print("👋 Server stopped", style="yellow")
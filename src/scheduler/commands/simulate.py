@@ -0,0 +1,191 @@
+import csv
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import typer
+from rich.console import Console
+from rich.progress import BarColumn, Progress, TextColumn
+from rich.table import Table
+
+from scheduler.constants import (
+    CATEGORY_WEIGHT,
+    MAX_APPEARANCES_PER_WEEK,
+    PROGRESS_WEIGHT,
+    RECENCY_WEIGHT,
+    ROTATION_WEIGHT,
+    WEIGHT_SCALE,
+)
+from scheduler.scheduler import DEFAULT_WEIGHTS
+from scheduler.simulation import SimulationResult, run_grid, weight_grid
+
+console = Console()
+
+# Metric -> key ranking the best configuration first, ties broken by another
+SORT_KEYS: Dict[str, Callable[[SimulationResult], Tuple]] = {
+    "coverage": lambda r: (-r.coverage, -r.fairness),
+    "fairness": lambda r: (-r.fairness, -r.coverage),
+    "completed": lambda r: (-r.completed, _median(r)),
+    "days": lambda r: (_median(r), -r.completed),
+}
+
+
+def _median(result: SimulationResult) -> float:
+    return result.median_days if result.median_days is not None else float("inf")
+
+
+WEIGHT_FIELDS = ("progress", "recency", "rotation", "category", "max_appearances")
+
+
+def _decimal(text: str) -> Decimal:
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        raise typer.BadParameter(f"'{text}' is not a number") from None
+    # The fixed-point engine works in parts per million
+    if value < 0 or value * WEIGHT_SCALE % 1:
+        raise typer.BadParameter(
+            f"Weights must be non-negative with at most 6 decimals, got {text}"
+        )
+    return value
+
+
+def _integer(text: str) -> int:
+    if not text.isdigit() or int(text) < 1:
+        raise typer.BadParameter(f"'{text}' is not a positive integer")
+    return int(text)
+
+
+def parse_values(spec: str, parse: Callable) -> List:
+    """Values from 'a,b,c' where any item may be an inclusive 'start:stop:step'."""
+    values = []
+    for item in spec.split(","):
+        if ":" not in item:
+            values.append(parse(item.strip()))
+            continue
+        try:
+            start, stop, step = (parse(part.strip()) for part in item.split(":"))
+        except ValueError:
+            raise typer.BadParameter(f"Use start:stop:step, got '{item}'") from None
+        if not step:
+            raise typer.BadParameter(f"Step must be positive in '{item}'")
+        while start <= stop:
+            values.append(start)
+            start += step
+    return list(dict.fromkeys(values))
+
+
+def write_results(path: Path, results: List[SimulationResult]):
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [*WEIGHT_FIELDS, "coverage", "fairness", "completed", "median_days"]
+        )
+        for result in results:
+            weights = result.weights._asdict()
+            writer.writerow(
+                [
+                    *(weights[name] for name in WEIGHT_FIELDS),
+                    f"{result.coverage:.4f}",
+                    f"{result.fairness:.4f}",
+                    result.completed,
+                    "" if result.median_days is None else result.median_days,
+                ]
+            )
+
+
+def simulate(
+    days: int = typer.Option(365, help="Days to simulate"),
+    progress: str = typer.Option(
+        str(PROGRESS_WEIGHT),
+        help="Progress weights to try, e.g. 0.2,0.35 or 0.1:0.5:0.1",
+    ),
+    recency: str = typer.Option(str(RECENCY_WEIGHT), help="Recency weights to try"),
+    rotation: str = typer.Option(str(ROTATION_WEIGHT), help="Rotation weights to try"),
+    category: str = typer.Option(str(CATEGORY_WEIGHT), help="Category weights to try"),
+    max_appearances: str = typer.Option(
+        str(MAX_APPEARANCES_PER_WEEK), help="Weekly core appearance caps to try"
+    ),
+    exercises: int = typer.Option(
+        1, min=0, help="Exercises finished per core pick each simulated day"
+    ),
+    start: Optional[datetime] = typer.Option(
+        None, "--from", formats=["%Y-%m-%d"], help="First simulated day (default today)"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, help="Worker processes (default: CPU count)"
+    ),
+    sort: str = typer.Option(
+        "coverage", help="Rank by coverage, fairness, completed or days"
+    ),
+    top: int = typer.Option(10, help="Configurations listed (0 lists all)"),
+    output: Optional[Path] = typer.Option(
+        None, help="Also write every configuration's metrics to this CSV file"
+    ),
+):
+    """Replay planning under many weight configurations and compare outcomes.
+
+    The current schedule history is the starting point; simulated picks are
+    worked through in memory and nothing is written to the database.
+    """
+    if sort not in SORT_KEYS:
+        raise typer.BadParameter(f"--sort must be one of: {', '.join(SORT_KEYS)}")
+    if days < 1:
+        raise typer.BadParameter("--days must be at least 1")
+
+    grid = weight_grid(
+        parse_values(progress, _decimal),
+        parse_values(recency, _decimal),
+        parse_values(rotation, _decimal),
+        parse_values(category, _decimal),
+        parse_values(max_appearances, _integer),
+    )
+    start_date = (start or datetime.today()).date()
+
+    results = []
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        console=console,
+    ) as progress_bar:
+        task = progress_bar.add_task(
+            f"Simulating {days} days x {len(grid)} configurations...", total=len(grid)
+        )
+        for result in run_grid(grid, start_date, days, exercises, workers):
+            results.append(result)
+            progress_bar.advance(task)
+
+    if output is not None:
+        write_results(output, results)
+        console.print(f"💾 Wrote {len(results)} configurations to {output}")
+
+    ranked = sorted(results, key=SORT_KEYS[sort])
+    shown = ranked[:top] if top > 0 else ranked
+
+    table = Table(
+        title=f"🧪 Simulated {days} days from {start_date}",
+        show_header=True,
+        header_style="bold cyan",
+    )
+    for label in ("Progress", "Recency", "Rotation", "Category", "Cap"):
+        table.add_column(label, justify="right")
+    table.add_column("Coverage", justify="right", style="green")
+    table.add_column("Fairness", justify="right", style="green")
+    table.add_column("Completed", justify="right", style="yellow")
+    table.add_column("Median Days", justify="right", style="yellow")
+
+    for result in shown:
+        weights = result.weights
+        table.add_row(
+            *(str(getattr(weights, name)) for name in WEIGHT_FIELDS),
+            f"{result.coverage:.1%}",
+            f"{result.fairness:.3f}",
+            str(result.completed),
+            "-" if result.median_days is None else f"{result.median_days:g}",
+            style="bold" if weights == DEFAULT_WEIGHTS else None,
+        )
+    if len(shown) < len(ranked):
+        table.caption = f"Top {len(shown)} of {len(ranked)} by {sort}"
+    console.print(table)
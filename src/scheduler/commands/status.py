@@ -1,42 +1,70 @@
+from typing import Dict
+
+import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from scheduler import scheduler
+from scheduler import client, db
 
 console = Console()
 
 
+def load_status() -> Dict:
+    """Overall and per-category progress, aggregated in SQL."""
+    conn = db.connect(readonly=True)
+    tracks, active, total, completed = conn.execute(
+        """
+        SELECT COUNT(*), COUNT(*) FILTER (WHERE active),
+               COALESCE(SUM(total), 0), COALESCE(SUM(completed), 0)
+        FROM tracks
+    """
+    ).fetchone()
+    categories = {
+        category: {"tracks": count, "total": cat_total, "completed": cat_completed}
+        for category, count, cat_total, cat_completed in conn.execute(
+            """
+            SELECT category, COUNT(*), SUM(total), SUM(completed)
+            FROM tracks
+            GROUP BY category
+            ORDER BY category
+        """
+        )
+    }
+    return {
+        "tracks": tracks,
+        "active": active,
+        "total": total,
+        "completed": completed,
+        "categories": categories,
+    }
+
+
 def status():
     """Show current learning progress and statistics."""
-    tracks = scheduler.get_all_tracks()
+    try:
+        data = client.request("GET", "/status") or load_status()
+    except client.ServiceError as e:
+        console.print(f"❌ Error loading status: {e}", style="red")
+        raise typer.Exit(1)
 
-    if not tracks:
+    if not data["tracks"]:
         console.print("❌ No tracks found. Run 'import-tracks' first.", style="red")
         return
 
     # Summary statistics
-    total_exercises = sum(t["total"] for t in tracks)
-    completed_exercises = sum(t["completed"] for t in tracks)
+    total_exercises = data["total"]
+    completed_exercises = data["completed"]
     overall_progress = (
         (completed_exercises / total_exercises * 100) if total_exercises > 0 else 0
     )
-
-    # Progress by category
-    categories = {}
-    for track in tracks:
-        cat = track["category"]
-        if cat not in categories:
-            categories[cat] = {"total": 0, "completed": 0, "tracks": 0}
-        categories[cat]["total"] += track["total"]
-        categories[cat]["completed"] += track["completed"]
-        categories[cat]["tracks"] += 1
+    categories = data["categories"]
 
     # Display summary
     summary_panel = Panel(
         f"📊 Total Progress: {completed_exercises}/{total_exercises} ({overall_progress:.1f}%)\n"
-        f"📚 Total Tracks: {len(tracks)}\n"
-        f"📚 Active Tracks: {len([t for t in tracks if t['active']])}\n"  # type: ignore
+        f"📚 Total Tracks: {data['tracks']}\n"
+        f"📚 Active Tracks: {data['active']}\n"
         f"🎯 Categories: {len(categories)}",
         title="Learning Overview",
         title_align="left",
@@ -53,7 +81,7 @@ def status():
     cat_table.add_column("Progress Bar", justify="left")
     cat_table.add_column("Completion %", justify="center", style="white")
 
-    for cat, data in sorted(categories.items()):
+    for cat, data in categories.items():
         completion_pct = (
             (data["completed"] / data["total"] * 100) if data["total"] > 0 else 0
         )
@@ -1,5 +1,7 @@
+import sqlite3
+from itertools import batched
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import typer
 from rich.console import Console
@@ -10,60 +12,27 @@ from scheduler.models.track import Track
 
 console = Console()
 
+SYNC_FIELDS = ("category", "total", "completed")
+
 
 def sync(
     json_path: Optional[Path] = typer.Argument(None),
     dry_run: bool = typer.Option(
         False, "--dry-run", "-d", help="Show changes without applying them"
     ),
+    batch_size: int = typer.Option(1000, help="Rows written per batch"),
 ):
     """Sync tracks from JSON file to database, showing what will change."""
 
     if json_path is None:
-        json_path = Path(__file__).parent / "database" / "tracks.json"
+        json_path = Path(__file__).parent.parent / "database" / "tracks.json"
     tracks = Track.load_many_from_json(json_path)
 
-    json_tracks = {track.title: track.__dict__ for track in tracks}
-
     conn = db.connect()
-    cursor = conn.cursor()
 
     try:
-        # Get current database state
-        cursor.execute("SELECT title, category, total, completed FROM tracks")
-        db_tracks = {
-            row[0]: {
-                "title": row[0],
-                "category": row[1],
-                "total": row[2],
-                "completed": row[3],
-            }
-            for row in cursor.fetchall()
-        }
-
-        changes = []
-
-        # Check for updates and new tracks
-        for title, json_track in json_tracks.items():
-            if title in db_tracks:
-                db_track = db_tracks[title]
-                track_changes = []
-
-                for field in ["category", "total", "completed"]:
-                    if json_track[field] != db_track[field]:
-                        track_changes.append(
-                            f"{field}: {db_track[field]} → {json_track[field]}"
-                        )
-
-                if track_changes:
-                    changes.append(("UPDATE", title, track_changes))
-            else:
-                changes.append(("INSERT", title, []))
-
-        # Check for deleted tracks
-        for title in db_tracks:
-            if title not in json_tracks:
-                changes.append(("DELETE", title, []))
+        stage_tracks(conn, tracks)
+        changes = diff_tracks(conn)
 
         # Display changes
         if changes:
@@ -73,15 +42,25 @@ def sync(
             table.add_column("Changes", style="yellow")
 
             for action, title, track_changes in changes:
-                change_str = "; ".join(track_changes) if track_changes else "New track"
+                if track_changes:
+                    change_str = "; ".join(track_changes)
+                else:
+                    change_str = "New track" if action == "INSERT" else "Removed"
                 table.add_row(action, title, change_str)
 
             console.print(table)
 
+            removed_logs = count_removed_logs(conn)
+            if removed_logs:
+                console.print(
+                    f"⚠️  Removing tracks also deletes their {removed_logs} log(s)",
+                    style="yellow",
+                )
+
             if not dry_run:
                 if typer.confirm("Apply these changes?"):
-                    apply_changes(cursor, json_tracks, db_tracks)
-                    conn.commit()
+                    with conn:
+                        apply_changes(conn, changes, batch_size)
                     console.print("✅ Changes applied successfully", style="green")
                 else:
                     console.print("❌ Changes cancelled", style="yellow")
@@ -92,24 +71,115 @@ def sync(
                 "✅ No changes needed - database is up to date", style="green"
             )
 
+    except Exception:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
-
-
-def apply_changes(cursor, json_tracks, db_tracks):
-    """Apply the changes to the database."""
-    for _, json_track in json_tracks.items():
-        cursor.execute(
-            "INSERT OR REPLACE INTO tracks (title, category, total, completed) VALUES (?, ?, ?, ?)",
-            (
-                json_track["title"],
-                json_track["category"],
-                json_track["total"],
-                json_track["completed"],
-            ),
+        conn.execute("DROP TABLE IF EXISTS temp.sync_tracks")
+
+
+def stage_tracks(conn: sqlite3.Connection, tracks: List[Track]) -> None:
+    """Load the JSON tracks into a temporary table for set-based diffing."""
+    conn.execute("DROP TABLE IF EXISTS temp.sync_tracks")
+    conn.execute("""
+        CREATE TEMP TABLE sync_tracks (
+            title TEXT PRIMARY KEY,
+            category TEXT,
+            total INTEGER,
+            completed INTEGER
+        )
+    """)
+    # Later duplicates of a title win
+    conn.executemany(
+        "INSERT OR REPLACE INTO temp.sync_tracks VALUES (?, ?, ?, ?)",
+        ((t.title, t.category, t.total, t.completed) for t in tracks),
+    )
+
+
+def diff_tracks(conn: sqlite3.Connection) -> List[Tuple[str, str, List[str]]]:
+    """Compute INSERT, UPDATE and DELETE sets between staged and stored tracks."""
+    changes: List[Tuple[str, str, List[str]]] = []
+
+    # Tracks only in JSON
+    for (title,) in conn.execute("""
+        SELECT staged.title
+        FROM temp.sync_tracks AS staged
+        LEFT JOIN tracks ON tracks.title = staged.title
+        WHERE tracks.title IS NULL
+        ORDER BY staged.title
+    """):
+        changes.append(("INSERT", title, []))
+
+    # Tracks whose synced fields differ
+    for row in conn.execute("""
+        SELECT staged.title,
+               tracks.category, staged.category,
+               tracks.total, staged.total,
+               tracks.completed, staged.completed
+        FROM temp.sync_tracks AS staged
+        JOIN tracks ON tracks.title = staged.title
+        WHERE (tracks.category, tracks.total, tracks.completed)
+              IS NOT (staged.category, staged.total, staged.completed)
+        ORDER BY staged.title
+    """):
+        track_changes = []
+        for i, field in enumerate(SYNC_FIELDS):
+            old, new = row[1 + 2 * i], row[2 + 2 * i]
+            if old != new:
+                track_changes.append(f"{field}: {old} → {new}")
+        changes.append(("UPDATE", row[0], track_changes))
+
+    # Tracks no longer in JSON; their logs go with them (ON DELETE CASCADE)
+    for title, logs in conn.execute("""
+        SELECT tracks.title, COUNT(logs.track)
+        FROM tracks
+        LEFT JOIN temp.sync_tracks AS staged ON staged.title = tracks.title
+        LEFT JOIN logs ON logs.track = tracks.title
+        WHERE staged.title IS NULL
+        GROUP BY tracks.title
+        ORDER BY tracks.title
+    """):
+        changes.append(
+            ("DELETE", title, ["Removed", f"deletes {logs} log(s)"] if logs else [])
         )
 
-    # Delete tracks that are no longer in JSON
-    for title in db_tracks:
-        if title not in json_tracks:
-            cursor.execute("DELETE FROM tracks WHERE title = ?", (title,))
+    return changes
+
+
+def count_removed_logs(conn: sqlite3.Connection) -> int:
+    """Logs of the tracks no longer in JSON, which removing them deletes."""
+    return conn.execute("""
+        SELECT COUNT(*)
+        FROM logs
+        WHERE track NOT IN (SELECT title FROM temp.sync_tracks)
+    """).fetchone()[0]
+
+
+APPLY_SQL = {
+    "INSERT": """
+        INSERT INTO tracks (title, category, total, completed)
+        SELECT title, category, total, completed
+        FROM temp.sync_tracks WHERE title = ?
+    """,
+    "UPDATE": """
+        UPDATE tracks
+        SET category = staged.category,
+            total = staged.total,
+            completed = staged.completed
+        FROM temp.sync_tracks AS staged
+        WHERE staged.title = tracks.title AND tracks.title = ?
+    """,
+    "DELETE": "DELETE FROM tracks WHERE title = ?",
+}
+
+
+def apply_changes(
+    conn: sqlite3.Connection,
+    changes: List[Tuple[str, str, List[str]]],
+    batch_size: int = 1000,
+) -> None:
+    """Apply only the changed rows to the database, in batches."""
+    for action, sql in APPLY_SQL.items():
+        titles = [(title,) for change, title, _ in changes if change == action]
+        for batch in batched(titles, batch_size):
+            conn.executemany(sql, batch)
@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from scheduler.constants import DATA_DIR
+from scheduler.synth import DISTRIBUTIONS, synthesize
+
+console = Console()
+
+
+def synth(
+    output: Path = typer.Option(
+        DATA_DIR / "synthetic.db", help="Database file to create"
+    ),
+    tracks: int = typer.Option(1000, help="Number of tracks"),
+    categories: int = typer.Option(10, help="Number of categories"),
+    days: int = typer.Option(365, help="Days of schedule and log history"),
+    seed: int = typer.Option(0, help="Random seed; same seed, same database"),
+    distribution: str = typer.Option(
+        "uniform", help=f"Completion distribution: {', '.join(DISTRIBUTIONS)}"
+    ),
+    logs_per_day: Optional[int] = typer.Option(
+        None, help="Log rows per day (default: the scheduled tracks)"
+    ),
+    force: bool = typer.Option(False, "--force", help="Overwrite the output file"),
+):
+    """Fill a separate database with synthetic tracks, schedules and logs."""
+    if output.exists() and not force:
+        console.print(
+            f"❌ {output} already exists. Use --force to overwrite.", style="red"
+        )
+        raise typer.Exit(1)
+
+    try:
+        counts = synthesize(
+            output,
+            tracks=tracks,
+            categories=categories,
+            days=days,
+            seed=seed,
+            distribution=distribution,
+            logs_per_day=logs_per_day,
+            overwrite=force,
+        )
+    except ValueError as e:
+        console.print(f"❌ {e}", style="red")
+        raise typer.Exit(1)
+
+    console.print(
+        f"✅ Synthetic database written to {output}: "
+        + ", ".join(f"{count} {table}" for table, count in counts.items()),
+        style="green",
+    )
@@ -5,8 +5,9 @@ from rich.console import Console
 
 from scheduler import db
 from scheduler.models.track import Track
+from scheduler.scheduler import check_track_stats, rebuild_track_stats
 
-app = typer.Typer()
+app = typer.Typer(help="Track management commands")
 
 console = Console()
 
@@ -54,33 +55,51 @@ def update(
 @app.command()
 def list():
     """List all tracks."""
-    conn = db.connect()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT title, category, total, completed FROM tracks ORDER BY title"
-        )
-        tracks = cursor.fetchall()
+    conn = db.connect(readonly=True)
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT title, category, total, completed FROM tracks ORDER BY title"
+    )
+    tracks = cursor.fetchall()
 
-        if not tracks:
-            console.print("No tracks found", style="yellow")
-            return
+    if not tracks:
+        console.print("No tracks found", style="yellow")
+        return
 
-        console.print("\n[bold]TRACKS:[/bold]\n")
-        console.print(
-            "  [bold]{:<15} {:<15} {:>10} {:<10}[/bold]\n".format(
-                "Title",
-                "Category",
-                "Progress",
-                "Percentage",
-            )
+    console.print("\n[bold]TRACKS:[/bold]\n")
+    console.print(
+        "  [bold]{:<15} {:<15} {:>10} {:<10}[/bold]\n".format(
+            "Title",
+            "Category",
+            "Progress",
+            "Percentage",
         )
-        for title, category, total, completed in tracks:  # type: ignore
-            progress = f"{completed}/{total}"
-            percentage = f"{completed / total * 100:.1f}%" if total > 0 else "0%"
-            console.print(
-                f"  {title:<15} {category:<15} {progress:>10} {percentage:>10}"
-            )
+    )
+    for title, category, total, completed in tracks:  # type: ignore
+        progress = f"{completed}/{total}"
+        percentage = f"{completed / total * 100:.1f}%" if total > 0 else "0%"
+        console.print(f"  {title:<15} {category:<15} {progress:>10} {percentage:>10}")
+
+
+@app.command()
+def stats(
+    rebuild: bool = typer.Option(
+        False, "--rebuild", help="Recompute track_stats from the full history"
+    ),
+):
+    """Check the trigger-maintained track_stats table against the history."""
+    drift = check_track_stats(db.connect(readonly=True))
+
+    if not drift:
+        console.print("✅ track_stats is consistent with the history", style="green")
+    else:
+        console.print(f"⚠️  {len(drift)} track(s) out of date:", style="yellow")
+        for track, stored, expected in drift[:20]:
+            console.print(f"  {track}: stored {stored}, expected {expected}")
+
+    if rebuild:
+        count = rebuild_track_stats(db.connect())
+        console.print(f"✅ Rebuilt track_stats for {count} track(s)", style="green")
 
 
 @app.command("show")
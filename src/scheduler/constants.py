@@ -16,7 +16,12 @@ else:
 # Database file and directory
 DATABASE_FILE = "scheduler.db"
 DATABASE_PATH = DATA_DIR / DATABASE_FILE
-SCHEMA_PATH = Path(__file__).parent / "migrations" / "schema.sql"
+# Named profiles (one learner each) live side by side as <name>.db
+PROFILES_DIR = DATA_DIR / "profiles"
+# Snapshots taken by `backup` (and by `init --force`), named after the database
+BACKUPS_DIR = DATA_DIR / "backups"
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+SCHEMA_PATH = MIGRATIONS_DIR / "schema.sql"
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
 # /////////////////////////////////////////////
@@ -27,20 +32,39 @@ PROGRESS_WEIGHT = Decimal("0.35")
 RECENCY_WEIGHT = Decimal("0.25")
 ROTATION_WEIGHT = Decimal("0.15")
 CATEGORY_WEIGHT = Decimal("0.25")
+DIVERSITY_BONUS = Decimal("0.5")  # Flat bonus for categories not overused
 
 # Constants for algorithm tuning
 MAX_DAILY_TRACKS = 4
 DAYS_FOR_TRACK_ROTATION = 7  # Days to consider for track rotation history
 COMPLETION_THRESHOLD = Decimal("0.96")  # Consider a track completed at 96% completion
 
+# Score breakdowns stored per planned day (picks first, then runners-up)
+SCORES_KEPT_PER_DAY = 50
+
 # Weekly coverage constraints
 MIN_APPEARANCES_PER_WEEK = 1
 MAX_APPEARANCES_PER_WEEK = 4
 BITCOIN_STYLE_SELECTION = True
 
+# Scoring engine: "decimal" (reference implementation) or "fixed" (scaled
+# integers, faster, picking the same tracks)
+SCORING_ENGINE = os.getenv("SCHEDULER_SCORING_ENGINE", "decimal").lower()
+if SCORING_ENGINE not in ("decimal", "fixed"):
+    raise ValueError(
+        f"Unknown SCHEDULER_SCORING_ENGINE '{SCORING_ENGINE}'. "
+        "Choose one of: decimal, fixed"
+    )
+
+# Fixed-point weights are scaled to parts-per-million (see scale_weights)
+WEIGHT_SCALE = 10**6
+
 # Determinism settings
 FLOAT_PRECISION = 28  # Precision for Decimal calculations
 RANDOM_SEED_MOD = 2**256 - 2**32 - 977  # Modulo for daily seed generation
+# "rfc6979" keeps historical schedules; "keyed" is a faster single BLAKE2b pass
+HASH_MODE = os.getenv("SCHEDULER_HASH_MODE", "rfc6979").lower()
+K_CACHE_SIZE = 65536  # Max memoized (date, track) hashes
 
 
 # Set decimal precision
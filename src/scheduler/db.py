@@ -1,14 +1,151 @@
+import atexit
+import re
 import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
 
-from scheduler.constants import DATABASE_PATH, SCHEMA_PATH
+from scheduler import profiling
+from scheduler.constants import (
+    DATABASE_PATH,
+    MIGRATIONS_DIR,
+    PROFILES_DIR,
+    SCHEMA_PATH,
+)
+
+# Applied to every connection when it is opened
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("temp_store", "MEMORY"),
+    ("mmap_size", 256 * 1024 * 1024),
+    ("cache_size", -16 * 1024),  # Negative values are KiB
+    ("foreign_keys", "ON"),
+)
+STATEMENT_CACHE_SIZE = 256
+PROFILE_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]*")
+
+_local = threading.local()
+_lock = threading.Lock()
+_connections: List[sqlite3.Connection] = []
+_migrated = set()
+_generation = 0
 
 
 def initialize():
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = connect()
     with SCHEMA_PATH.open("r", encoding="utf-8") as f:
         conn.executescript(f.read())
-    conn.close()
+    migrate(conn)
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply numbered migrations newer than the database's user_version."""
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+
+    # Nothing to upgrade until the base schema has been created
+    has_schema = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schedule'"
+    ).fetchone()
+    if not has_schema:
+        return current
+
+    for path in sorted(MIGRATIONS_DIR.glob("[0-9][0-9][0-9][0-9]_*.sql")):
+        version = int(path.name[:4])
+        if version <= current:
+            continue
+        script = path.read_text(encoding="utf-8")
+        try:
+            conn.executescript(
+                f"BEGIN;\n{script}\nPRAGMA user_version = {version};\nCOMMIT;"
+            )
+        except sqlite3.Error:
+            # executescript stops at the failing statement, inside the BEGIN
+            conn.rollback()
+            raise
+        current = version
+    return current
+
+
+def _open(readonly: bool) -> sqlite3.Connection:
+    # Connections are kept per thread; check_same_thread is off only so that
+    # close_all can close them from wherever it runs
+    opened_at = time.perf_counter()
+    conn = sqlite3.connect(
+        DATABASE_PATH,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=False,
+        factory=profiling.connection_factory(),
+    )
+    for name, value in PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+
+    with _lock:
+        if DATABASE_PATH not in _migrated:
+            migrate(conn)
+            _migrated.add(DATABASE_PATH)
+        _connections.append(conn)
+
+    # Reporting connections refuse writes
+    if readonly:
+        conn.execute("PRAGMA query_only = ON")
+
+    profiling.watch(conn, opened_at)
+    return conn
+
+
+def connect(readonly: bool = False) -> sqlite3.Connection:
+    """Return this thread's shared, tuned connection to the database.
+
+    The connection is opened on first use and reused afterwards, so callers
+    must not close it. Use `with conn:` for transactions.
+    """
+    if getattr(_local, "generation", None) != _generation:
+        _local.generation = _generation
+        _local.connections = {}
+
+    cache: Dict[Tuple[str, bool], sqlite3.Connection] = _local.connections
+    key = (str(DATABASE_PATH), readonly)
+    conn = cache.get(key)
+    if conn is None:
+        conn = cache[key] = _open(readonly)
+    return conn
+
+
+@atexit.register
+def close_all() -> None:
+    """Close every shared connection, e.g. before replacing the database file."""
+    global _generation
+    with _lock:
+        for conn in _connections:
+            conn.close()
+        _connections.clear()
+        _migrated.clear()
+        _generation += 1
+
+
+def use_database(path: Union[str, Path]) -> None:
+    """Point this process at another database file, closing open connections."""
+    global DATABASE_PATH
+    close_all()
+    DATABASE_PATH = Path(path)
+
+
+def profile_path(name: str) -> Path:
+    """Database file for the named profile."""
+    if not PROFILE_NAME.fullmatch(name):
+        raise ValueError(
+            f"Invalid profile name '{name}'. Use letters, digits, '.', '_' or '-'."
+        )
+    return PROFILES_DIR / f"{name}.db"
+
+
+def use_profile(name: str) -> None:
+    """Point this process at the named profile's database."""
+    use_database(profile_path(name))
 
 
-def connect():
-    return sqlite3.connect(DATABASE_PATH)
+def list_profiles() -> List[str]:
+    """Names of all profiles that have a database file."""
+    return sorted(path.stem for path in PROFILES_DIR.glob("*.db"))
@@ -1,38 +1,75 @@
 import hashlib
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional
 
-from scheduler.constants import RANDOM_SEED_MOD
+from scheduler.constants import HASH_MODE, K_CACHE_SIZE, RANDOM_SEED_MOD
 
+# Use a fixed key for deterministic behavior across runs
+KEY = b"learning_scheduler_v1"
 
-def deterministic_k(date_str: str, track: str) -> int:
+# Use a fixed nonce for simplicity, can be adjusted
+NONCE = (0).to_bytes(8, "big")
+
+_INITIAL_K = b"\x01" * 32
+_INITIAL_V = b"\x00" * 32
+_ROUNDS = tuple(n.to_bytes(1, "big") for n in range(5))
+
+
+def _rfc6979_k(date_str: str, track: str) -> int:
     """
     Generate deterministic pseudo-random number using Bitcoin's RFC 6979 approach.
     Uses HMAC-SHA256 for deterministic randomness based on date and track.
     """
     # Create message from date and track
-    message = f"{date_str}:{track}".encode()
-
-    # Use a fixed key for deterministic behavior across runs
-    key = b"learning_scheduler_v1"
-
-    # Use a fixed nonce for simplicity, can be adjusted
-    nonce = 0
-    combined = message + key + nonce.to_bytes(8, "big")
+    combined = f"{date_str}:{track}".encode() + KEY + NONCE
 
     # Generate deterministic k using HMAC-SHA256 chain
-    k = b"\x01" * 32  # Initial k
-    v = b"\x00" * 32  # Initial v
+    k = _INITIAL_K
+    v = _INITIAL_V
 
     # HMAC-SHA256 based deterministic generation (simplified RFC 6979)
-    for n in range(5):  # Multiple rounds for better distribution
-        # Update k
-        h = hashlib.new("sha256")
-        h.update(k + v + combined + n.to_bytes(1, "big"))
-        k = h.digest()
-
-        # Update v
-        h = hashlib.new("sha256")
-        h.update(k + v)
-        v = h.digest()
+    sha256 = hashlib.sha256
+    for n in _ROUNDS:  # Multiple rounds for better distribution
+        k = sha256(k + v + combined + n).digest()
+        v = sha256(k + v).digest()
 
     # Convert to integer and apply modulo
     return int.from_bytes(v, byteorder="big") % RANDOM_SEED_MOD
+
+
+def _keyed_k(date_str: str, track: str) -> int:
+    """Single keyed BLAKE2b digest; faster, but yields different values."""
+    digest = hashlib.blake2b(
+        f"{date_str}:{track}".encode(), key=KEY, digest_size=32
+    ).digest()
+    return int.from_bytes(digest, byteorder="big") % RANDOM_SEED_MOD
+
+
+HASH_MODES: Dict[str, Callable[[str, str], int]] = {
+    "rfc6979": _rfc6979_k,
+    "keyed": _keyed_k,
+}
+
+
+@lru_cache(maxsize=K_CACHE_SIZE)
+def _cached_k(date_str: str, track: str, mode: str) -> int:
+    try:
+        generator = HASH_MODES[mode]
+    except KeyError:
+        raise ValueError(
+            f"Unknown hash mode '{mode}'. Choose one of: {', '.join(HASH_MODES)}"
+        ) from None
+    return generator(date_str, track)
+
+
+def deterministic_k(date_str: str, track: str, mode: Optional[str] = None) -> int:
+    """Deterministic pseudo-random number for a (date, track) pair, memoized."""
+    return _cached_k(date_str, track, mode or HASH_MODE)
+
+
+def deterministic_k_batch(
+    date_str: str, tracks: Iterable[str], mode: Optional[str] = None
+) -> Dict[str, int]:
+    """Compute deterministic_k for every track of a date in one call."""
+    mode = mode or HASH_MODE
+    return {track: _cached_k(date_str, track, mode) for track in tracks}
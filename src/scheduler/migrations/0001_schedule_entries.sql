@@ -0,0 +1,25 @@
+-- Normalized schedule rows so history lookups can use indexes instead of
+-- expanding the JSON `core`/`extra` columns with json_each.
+CREATE TABLE IF NOT EXISTS schedule_entries (
+    date TEXT NOT NULL,
+    track TEXT NOT NULL,
+    slot TEXT NOT NULL CHECK(slot IN ('core', 'extra')),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (date, track),
+    FOREIGN KEY (date) REFERENCES schedule(date) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_schedule_entries_track_date
+ON schedule_entries(track, date);
+
+CREATE INDEX IF NOT EXISTS idx_schedule_entries_date
+ON schedule_entries(date);
+
+-- Backfill from the existing JSON columns
+INSERT OR IGNORE INTO schedule_entries (date, track, slot, position)
+SELECT schedule.date, json_each.value, 'core', json_each.key
+FROM schedule, json_each(schedule.core);
+
+INSERT OR IGNORE INTO schedule_entries (date, track, slot, position)
+SELECT schedule.date, json_each.value, 'extra', json_each.key
+FROM schedule, json_each(schedule.extra);
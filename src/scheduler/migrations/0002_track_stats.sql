@@ -0,0 +1,88 @@
+-- Per-track summary kept current by triggers, so planning reads one row per
+-- track instead of seeking through the whole schedule history.
+CREATE TABLE IF NOT EXISTS track_stats (
+    track TEXT PRIMARY KEY,
+    last_scheduled_date TEXT,
+    last_logged_date TEXT
+);
+
+CREATE TRIGGER IF NOT EXISTS track_stats_entry_insert
+AFTER INSERT ON schedule_entries
+WHEN NEW.slot = 'core'
+BEGIN
+    INSERT INTO track_stats (track, last_scheduled_date)
+    VALUES (NEW.track, NEW.date)
+    ON CONFLICT(track) DO UPDATE SET last_scheduled_date =
+        MAX(COALESCE(last_scheduled_date, ''), excluded.last_scheduled_date);
+END;
+
+-- Only a delete of the latest core entry moves the date; reseek on the
+-- (track, date) index in that case
+CREATE TRIGGER IF NOT EXISTS track_stats_entry_delete
+AFTER DELETE ON schedule_entries
+WHEN OLD.slot = 'core'
+BEGIN
+    UPDATE track_stats
+    SET last_scheduled_date = (
+        SELECT MAX(date) FROM schedule_entries
+        WHERE track = OLD.track AND slot = 'core'
+    )
+    WHERE track = OLD.track AND last_scheduled_date = OLD.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS track_stats_entry_update
+AFTER UPDATE OF date, track, slot ON schedule_entries
+BEGIN
+    UPDATE track_stats
+    SET last_scheduled_date = (
+        SELECT MAX(date) FROM schedule_entries
+        WHERE track = OLD.track AND slot = 'core'
+    )
+    WHERE track = OLD.track;
+
+    INSERT INTO track_stats (track, last_scheduled_date)
+    SELECT NEW.track, MAX(date) FROM schedule_entries
+    WHERE track = NEW.track AND slot = 'core'
+    ON CONFLICT(track) DO UPDATE SET
+        last_scheduled_date = excluded.last_scheduled_date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS track_stats_log_insert
+AFTER INSERT ON logs
+BEGIN
+    INSERT INTO track_stats (track, last_logged_date)
+    VALUES (NEW.track, NEW.date)
+    ON CONFLICT(track) DO UPDATE SET last_logged_date =
+        MAX(COALESCE(last_logged_date, ''), excluded.last_logged_date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS track_stats_log_delete
+AFTER DELETE ON logs
+BEGIN
+    UPDATE track_stats
+    SET last_logged_date = (SELECT MAX(date) FROM logs WHERE track = OLD.track)
+    WHERE track = OLD.track AND last_logged_date = OLD.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS track_stats_log_update
+AFTER UPDATE OF date, track ON logs
+BEGIN
+    UPDATE track_stats
+    SET last_logged_date = (SELECT MAX(date) FROM logs WHERE track = OLD.track)
+    WHERE track = OLD.track;
+
+    INSERT INTO track_stats (track, last_logged_date)
+    SELECT NEW.track, MAX(date) FROM logs WHERE track = NEW.track
+    ON CONFLICT(track) DO UPDATE SET last_logged_date = excluded.last_logged_date;
+END;
+
+-- Backfill from existing history
+INSERT OR REPLACE INTO track_stats (track, last_scheduled_date, last_logged_date)
+SELECT track, MAX(last_scheduled_date), MAX(last_logged_date)
+FROM (
+    SELECT track, MAX(date) AS last_scheduled_date, NULL AS last_logged_date
+    FROM schedule_entries WHERE slot = 'core' GROUP BY track
+    UNION ALL
+    SELECT track, NULL, MAX(date) FROM logs GROUP BY track
+)
+GROUP BY track;
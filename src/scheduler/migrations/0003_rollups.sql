@@ -0,0 +1,210 @@
+-- Pre-aggregated counts for reports, kept current by triggers: totals per
+-- day, and per track per calendar month (keyed 'YYYY-MM').
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    date TEXT PRIMARY KEY,
+    core INTEGER NOT NULL DEFAULT 0,
+    extra INTEGER NOT NULL DEFAULT 0,
+    logged INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    in_progress INTEGER NOT NULL DEFAULT 0,
+    not_started INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS monthly_track_rollup (
+    month TEXT NOT NULL,
+    track TEXT NOT NULL,
+    scheduled INTEGER NOT NULL DEFAULT 0,
+    logged INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    in_progress INTEGER NOT NULL DEFAULT 0,
+    not_started INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (month, track)
+) WITHOUT ROWID;
+
+-- Schedule entries
+
+CREATE TRIGGER IF NOT EXISTS rollup_entry_insert
+AFTER INSERT ON schedule_entries
+BEGIN
+    INSERT INTO daily_rollup (date, core, extra)
+    VALUES (NEW.date, NEW.slot = 'core', NEW.slot = 'extra')
+    ON CONFLICT(date) DO UPDATE SET
+        core = core + excluded.core, extra = extra + excluded.extra;
+
+    INSERT INTO monthly_track_rollup (month, track, scheduled)
+    VALUES (substr(NEW.date, 1, 7), NEW.track, 1)
+    ON CONFLICT(month, track) DO UPDATE SET scheduled = scheduled + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rollup_entry_delete
+AFTER DELETE ON schedule_entries
+BEGIN
+    UPDATE daily_rollup
+    SET core = core - (OLD.slot = 'core'), extra = extra - (OLD.slot = 'extra')
+    WHERE date = OLD.date;
+
+    UPDATE monthly_track_rollup
+    SET scheduled = scheduled - 1
+    WHERE month = substr(OLD.date, 1, 7)
+      AND track = OLD.track;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rollup_entry_update
+AFTER UPDATE OF date, track, slot ON schedule_entries
+BEGIN
+    UPDATE daily_rollup
+    SET core = core - (OLD.slot = 'core'), extra = extra - (OLD.slot = 'extra')
+    WHERE date = OLD.date;
+
+    UPDATE monthly_track_rollup
+    SET scheduled = scheduled - 1
+    WHERE month = substr(OLD.date, 1, 7)
+      AND track = OLD.track;
+
+    INSERT INTO daily_rollup (date, core, extra)
+    VALUES (NEW.date, NEW.slot = 'core', NEW.slot = 'extra')
+    ON CONFLICT(date) DO UPDATE SET
+        core = core + excluded.core, extra = extra + excluded.extra;
+
+    INSERT INTO monthly_track_rollup (month, track, scheduled)
+    VALUES (substr(NEW.date, 1, 7), NEW.track, 1)
+    ON CONFLICT(month, track) DO UPDATE SET scheduled = scheduled + 1;
+END;
+
+-- Logs
+
+CREATE TRIGGER IF NOT EXISTS rollup_log_insert
+AFTER INSERT ON logs
+BEGIN
+    INSERT INTO daily_rollup (date, logged, completed, in_progress, not_started)
+    VALUES (
+        NEW.date,
+        1,
+        NEW.status IS 'completed',
+        NEW.status IS 'in_progress',
+        NEW.status IS 'not_started'
+    )
+    ON CONFLICT(date) DO UPDATE SET
+        logged = logged + 1,
+        completed = completed + excluded.completed,
+        in_progress = in_progress + excluded.in_progress,
+        not_started = not_started + excluded.not_started;
+
+    INSERT INTO monthly_track_rollup (
+        month, track, logged, completed, in_progress, not_started
+    )
+    VALUES (
+        substr(NEW.date, 1, 7),
+        NEW.track,
+        1,
+        NEW.status IS 'completed',
+        NEW.status IS 'in_progress',
+        NEW.status IS 'not_started'
+    )
+    ON CONFLICT(month, track) DO UPDATE SET
+        logged = logged + 1,
+        completed = completed + excluded.completed,
+        in_progress = in_progress + excluded.in_progress,
+        not_started = not_started + excluded.not_started;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rollup_log_delete
+AFTER DELETE ON logs
+BEGIN
+    UPDATE daily_rollup SET
+        logged = logged - 1,
+        completed = completed - (OLD.status IS 'completed'),
+        in_progress = in_progress - (OLD.status IS 'in_progress'),
+        not_started = not_started - (OLD.status IS 'not_started')
+    WHERE date = OLD.date;
+
+    UPDATE monthly_track_rollup SET
+        logged = logged - 1,
+        completed = completed - (OLD.status IS 'completed'),
+        in_progress = in_progress - (OLD.status IS 'in_progress'),
+        not_started = not_started - (OLD.status IS 'not_started')
+    WHERE month = substr(OLD.date, 1, 7)
+      AND track = OLD.track;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rollup_log_update
+AFTER UPDATE OF date, track, status ON logs
+BEGIN
+    UPDATE daily_rollup SET
+        logged = logged - 1,
+        completed = completed - (OLD.status IS 'completed'),
+        in_progress = in_progress - (OLD.status IS 'in_progress'),
+        not_started = not_started - (OLD.status IS 'not_started')
+    WHERE date = OLD.date;
+
+    UPDATE monthly_track_rollup SET
+        logged = logged - 1,
+        completed = completed - (OLD.status IS 'completed'),
+        in_progress = in_progress - (OLD.status IS 'in_progress'),
+        not_started = not_started - (OLD.status IS 'not_started')
+    WHERE month = substr(OLD.date, 1, 7)
+      AND track = OLD.track;
+
+    INSERT INTO daily_rollup (date, logged, completed, in_progress, not_started)
+    VALUES (
+        NEW.date,
+        1,
+        NEW.status IS 'completed',
+        NEW.status IS 'in_progress',
+        NEW.status IS 'not_started'
+    )
+    ON CONFLICT(date) DO UPDATE SET
+        logged = logged + 1,
+        completed = completed + excluded.completed,
+        in_progress = in_progress + excluded.in_progress,
+        not_started = not_started + excluded.not_started;
+
+    INSERT INTO monthly_track_rollup (
+        month, track, logged, completed, in_progress, not_started
+    )
+    VALUES (
+        substr(NEW.date, 1, 7),
+        NEW.track,
+        1,
+        NEW.status IS 'completed',
+        NEW.status IS 'in_progress',
+        NEW.status IS 'not_started'
+    )
+    ON CONFLICT(month, track) DO UPDATE SET
+        logged = logged + 1,
+        completed = completed + excluded.completed,
+        in_progress = in_progress + excluded.in_progress,
+        not_started = not_started + excluded.not_started;
+END;
+
+-- Backfill from existing history
+INSERT INTO daily_rollup (date, core, extra, logged, completed, in_progress, not_started)
+SELECT date, SUM(core), SUM(extra), SUM(logged), SUM(completed), SUM(in_progress),
+       SUM(not_started)
+FROM (
+    SELECT date, slot = 'core' AS core, slot = 'extra' AS extra, 0 AS logged,
+           0 AS completed, 0 AS in_progress, 0 AS not_started
+    FROM schedule_entries
+    UNION ALL
+    SELECT date, 0, 0, 1, status IS 'completed', status IS 'in_progress',
+           status IS 'not_started'
+    FROM logs
+)
+GROUP BY date;
+
+INSERT INTO monthly_track_rollup (
+    month, track, scheduled, logged, completed, in_progress, not_started
+)
+SELECT substr(date, 1, 7), track,
+       SUM(scheduled), SUM(logged), SUM(completed), SUM(in_progress),
+       SUM(not_started)
+FROM (
+    SELECT date, track, 1 AS scheduled, 0 AS logged, 0 AS completed,
+           0 AS in_progress, 0 AS not_started
+    FROM schedule_entries
+    UNION ALL
+    SELECT date, track, 0, 1, status IS 'completed', status IS 'in_progress',
+           status IS 'not_started'
+    FROM logs
+)
+GROUP BY 1, track;
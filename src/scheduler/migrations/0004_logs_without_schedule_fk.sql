@@ -0,0 +1,157 @@
+-- Logs no longer need a schedule row for their date, so progress can be
+-- backdated or imported for days that were never planned. SQLite can't drop
+-- a constraint in place: rebuild the table, then restore its indexes and the
+-- triggers from 0002 and 0003 (dropped along with the old table).
+CREATE TABLE logs_new (
+    date TEXT,
+    track TEXT,
+    completed INTEGER,
+    pending INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'not_started',
+    PRIMARY KEY (date, track),
+    FOREIGN KEY (track) REFERENCES tracks(title) ON DELETE CASCADE
+);
+
+INSERT INTO logs_new (date, track, completed, pending, status)
+SELECT date, track, completed, pending, status FROM logs;
+
+DROP TABLE logs;
+
+ALTER TABLE logs_new RENAME TO logs;
+
+CREATE INDEX IF NOT EXISTS idx_logs_date ON logs(date);
+
+CREATE INDEX IF NOT EXISTS idx_logs_track ON logs(track);
+
+CREATE TRIGGER IF NOT EXISTS track_stats_log_insert
+AFTER INSERT ON logs
+BEGIN
+    INSERT INTO track_stats (track, last_logged_date)
+    VALUES (NEW.track, NEW.date)
+    ON CONFLICT(track) DO UPDATE SET last_logged_date =
+        MAX(COALESCE(last_logged_date, ''), excluded.last_logged_date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS track_stats_log_delete
+AFTER DELETE ON logs
+BEGIN
+    UPDATE track_stats
+    SET last_logged_date = (SELECT MAX(date) FROM logs WHERE track = OLD.track)
+    WHERE track = OLD.track AND last_logged_date = OLD.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS track_stats_log_update
+AFTER UPDATE OF date, track ON logs
+BEGIN
+    UPDATE track_stats
+    SET last_logged_date = (SELECT MAX(date) FROM logs WHERE track = OLD.track)
+    WHERE track = OLD.track;
+
+    INSERT INTO track_stats (track, last_logged_date)
+    SELECT NEW.track, MAX(date) FROM logs WHERE track = NEW.track
+    ON CONFLICT(track) DO UPDATE SET last_logged_date = excluded.last_logged_date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rollup_log_insert
+AFTER INSERT ON logs
+BEGIN
+    INSERT INTO daily_rollup (date, logged, completed, in_progress, not_started)
+    VALUES (
+        NEW.date,
+        1,
+        NEW.status IS 'completed',
+        NEW.status IS 'in_progress',
+        NEW.status IS 'not_started'
+    )
+    ON CONFLICT(date) DO UPDATE SET
+        logged = logged + 1,
+        completed = completed + excluded.completed,
+        in_progress = in_progress + excluded.in_progress,
+        not_started = not_started + excluded.not_started;
+
+    INSERT INTO monthly_track_rollup (
+        month, track, logged, completed, in_progress, not_started
+    )
+    VALUES (
+        substr(NEW.date, 1, 7),
+        NEW.track,
+        1,
+        NEW.status IS 'completed',
+        NEW.status IS 'in_progress',
+        NEW.status IS 'not_started'
+    )
+    ON CONFLICT(month, track) DO UPDATE SET
+        logged = logged + 1,
+        completed = completed + excluded.completed,
+        in_progress = in_progress + excluded.in_progress,
+        not_started = not_started + excluded.not_started;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rollup_log_delete
+AFTER DELETE ON logs
+BEGIN
+    UPDATE daily_rollup SET
+        logged = logged - 1,
+        completed = completed - (OLD.status IS 'completed'),
+        in_progress = in_progress - (OLD.status IS 'in_progress'),
+        not_started = not_started - (OLD.status IS 'not_started')
+    WHERE date = OLD.date;
+
+    UPDATE monthly_track_rollup SET
+        logged = logged - 1,
+        completed = completed - (OLD.status IS 'completed'),
+        in_progress = in_progress - (OLD.status IS 'in_progress'),
+        not_started = not_started - (OLD.status IS 'not_started')
+    WHERE month = substr(OLD.date, 1, 7)
+      AND track = OLD.track;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rollup_log_update
+AFTER UPDATE OF date, track, status ON logs
+BEGIN
+    UPDATE daily_rollup SET
+        logged = logged - 1,
+        completed = completed - (OLD.status IS 'completed'),
+        in_progress = in_progress - (OLD.status IS 'in_progress'),
+        not_started = not_started - (OLD.status IS 'not_started')
+    WHERE date = OLD.date;
+
+    UPDATE monthly_track_rollup SET
+        logged = logged - 1,
+        completed = completed - (OLD.status IS 'completed'),
+        in_progress = in_progress - (OLD.status IS 'in_progress'),
+        not_started = not_started - (OLD.status IS 'not_started')
+    WHERE month = substr(OLD.date, 1, 7)
+      AND track = OLD.track;
+
+    INSERT INTO daily_rollup (date, logged, completed, in_progress, not_started)
+    VALUES (
+        NEW.date,
+        1,
+        NEW.status IS 'completed',
+        NEW.status IS 'in_progress',
+        NEW.status IS 'not_started'
+    )
+    ON CONFLICT(date) DO UPDATE SET
+        logged = logged + 1,
+        completed = completed + excluded.completed,
+        in_progress = in_progress + excluded.in_progress,
+        not_started = not_started + excluded.not_started;
+
+    INSERT INTO monthly_track_rollup (
+        month, track, logged, completed, in_progress, not_started
+    )
+    VALUES (
+        substr(NEW.date, 1, 7),
+        NEW.track,
+        1,
+        NEW.status IS 'completed',
+        NEW.status IS 'in_progress',
+        NEW.status IS 'not_started'
+    )
+    ON CONFLICT(month, track) DO UPDATE SET
+        logged = logged + 1,
+        completed = completed + excluded.completed,
+        in_progress = in_progress + excluded.in_progress,
+        not_started = not_started + excluded.not_started;
+END;
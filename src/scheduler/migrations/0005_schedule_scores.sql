@@ -0,0 +1,19 @@
+-- Score breakdowns of the best-ranked tracks for each planned day, so a
+-- stored schedule can be explained without rescoring it. Rank 1 is the
+-- first core pick; ranks past the picks are the runners-up.
+CREATE TABLE IF NOT EXISTS schedule_scores (
+    date TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    track TEXT NOT NULL,
+    progress REAL NOT NULL,
+    recency REAL NOT NULL,
+    rotation REAL NOT NULL,
+    category REAL NOT NULL,
+    diversity_bonus REAL NOT NULL,
+    total REAL NOT NULL,
+    completion_ratio REAL NOT NULL,
+    days_since_last INTEGER NOT NULL,
+    recent_appearances INTEGER NOT NULL,
+    PRIMARY KEY (date, rank),
+    FOREIGN KEY (date) REFERENCES schedule(date) ON DELETE CASCADE
+) WITHOUT ROWID;
@@ -0,0 +1,36 @@
+-- Each planned day records a fingerprint of the inputs it was scored from,
+-- so a forced regeneration can tell when nothing has changed.
+ALTER TABLE schedule ADD COLUMN fingerprint TEXT;
+
+-- Counters bumped by triggers whenever a table's planning inputs change;
+-- reading one is a single lookup instead of a scan of the table.
+CREATE TABLE IF NOT EXISTS table_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO table_versions (name) VALUES ('tracks');
+
+CREATE TRIGGER IF NOT EXISTS tracks_version_insert
+AFTER INSERT ON tracks
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'tracks';
+END;
+
+CREATE TRIGGER IF NOT EXISTS tracks_version_delete
+AFTER DELETE ON tracks
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'tracks';
+END;
+
+-- Only real changes count: sync and logging may rewrite unchanged values
+CREATE TRIGGER IF NOT EXISTS tracks_version_update
+AFTER UPDATE OF title, category, total, completed, active ON tracks
+WHEN OLD.title IS NOT NEW.title
+  OR OLD.category IS NOT NEW.category
+  OR OLD.total IS NOT NEW.total
+  OR OLD.completed IS NOT NEW.completed
+  OR OLD.active IS NOT NEW.active
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE name = 'tracks';
+END;
@@ -2,7 +2,8 @@ CREATE TABLE tracks (
     title TEXT PRIMARY KEY,
     category TEXT,
     total INTEGER,
-    completed INTEGER DEFAULT 0
+    completed INTEGER DEFAULT 0,
+    active INTEGER DEFAULT 0
 );
 
 CREATE TABLE schedule (
@@ -16,6 +17,7 @@ CREATE TABLE logs (
     track TEXT,
     completed INTEGER,
     pending INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'not_started',
     PRIMARY KEY (date, track),
     FOREIGN KEY (date) REFERENCES schedule(date) ON DELETE CASCADE,
     FOREIGN KEY (track) REFERENCES tracks(title) ON DELETE CASCADE
@@ -1,7 +1,7 @@
 import json
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 
 from rich.console import Console
 
@@ -9,8 +9,47 @@ from scheduler import db
 
 console = Console()
 
+# Upsert instead of REPLACE, which would delete the row and cascade to logs
+UPSERT_SQL = """
+    INSERT INTO tracks (title, category, total, completed, active)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(title) DO UPDATE SET
+        category = excluded.category,
+        total = excluded.total,
+        completed = excluded.completed,
+        active = excluded.active
+"""
 
-@dataclass
+# Imported files carry no `active` field, so existing tracks keep theirs
+IMPORT_UPSERT_SQL = """
+    INSERT INTO tracks (title, category, total, completed, active)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(title) DO UPDATE SET
+        category = excluded.category,
+        total = excluded.total,
+        completed = excluded.completed
+"""
+
+# Fields an import compares and writes for tracks that already exist
+IMPORT_FIELDS = 4
+
+
+class TrackRecord(NamedTuple):
+    """Read-only track row, as the scheduler loads and scores it."""
+
+    title: str
+    category: str
+    total: int
+    completed: int = 0
+    active: int = 0
+
+
+def track_record(cursor, row) -> TrackRecord:
+    """sqlite3 row factory for `SELECT title, category, total, completed, active`."""
+    return TrackRecord._make(row)
+
+
+@dataclass(slots=True)
 class Track:
     title: str
     category: str
@@ -21,15 +60,8 @@ class Track:
     def save(self):
         """Save or update this track in the database."""
         conn = db.connect()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "INSERT OR REPLACE INTO tracks (title, category, total, completed, active) VALUES (?, ?, ?, ?)",
-                (self.title, self.category, self.total, self.completed, self.active),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        with conn:
+            conn.execute(UPSERT_SQL, astuple(self))
 
     def update(self, **kwargs):
         """Update specific fields and save to database."""
@@ -49,24 +81,64 @@ class Track:
     def get(cls, title: str) -> Optional["Track"]:
         """Get a track by title from the database."""
         conn = db.connect()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "SELECT title, category, total, completed, active FROM tracks WHERE title = ?",
-                (title,),
-            )
-            row = cursor.fetchone()
-            if row:
-                return cls(*row)
-            return None
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT title, category, total, completed, active FROM tracks WHERE title = ?",
+            (title,),
+        ).fetchone()
+        if row:
+            return cls(*row)
+        return None
+
+    @classmethod
+    def save_many(
+        cls, tracks: Iterable["Track"], chunk_size: int = 5000
+    ) -> Tuple[int, int, int]:
+        """Upsert tracks in a single transaction, skipping unchanged rows.
+
+        Existing tracks keep their `active` flag; new ones take the track's.
+        Returns the number of inserted, updated and unchanged tracks.
+        """
+        # Later duplicates of a title win, as they would with row-by-row saves
+        rows = list({track.title: astuple(track) for track in tracks}.values())
+        inserted = updated = unchanged = 0
+
+        conn = db.connect()
+        with conn:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                existing = {
+                    row[0]: row
+                    for row in conn.execute(
+                        """
+                        SELECT title, category, total, completed, active
+                        FROM tracks
+                        WHERE title IN (SELECT value FROM json_each(?))
+                    """,
+                        (json.dumps([row[0] for row in chunk]),),
+                    )
+                }
+
+                changed = []
+                for row in chunk:
+                    current = existing.get(row[0])
+                    if current is None:
+                        inserted += 1
+                    elif current[:IMPORT_FIELDS] == row[:IMPORT_FIELDS]:
+                        unchanged += 1
+                        continue
+                    else:
+                        updated += 1
+                    changed.append(row)
+
+                conn.executemany(IMPORT_UPSERT_SQL, changed)
+
+        return inserted, updated, unchanged
 
     @classmethod
     def load_many_from_json(cls, json_path: Optional[Path] = None) -> List["Track"]:
         """Load multiple tracks from a JSON file."""
         if json_path is None:
-            json_path = Path(__file__).parent / "database" / "tracks.json"
+            json_path = Path(__file__).parent.parent / "database" / "tracks.json"
 
         with open(json_path, encoding="utf-8") as f:
             data = json.load(f)
@@ -0,0 +1,247 @@
+"""Opt-in per-phase timing and SQL statement counting and timing.
+
+Enabled by the global ``--profile`` flag or the ``SCHEDULER_TRACE`` environment
+variable: ``SCHEDULER_TRACE=1`` prints a summary to stderr on exit, ``0``,
+``false``, ``no`` or ``off`` leave profiling disabled, and any other value is
+taken as a path to write the summary to as JSON.
+"""
+
+import atexit
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Optional
+
+ENABLED = False
+TOP_STATEMENTS = 10
+
+_output: Optional[Path] = None
+_registered = False
+_current: Optional[str] = None
+# Phase name -> [calls, seconds, statements]
+_phases: Dict[str, List] = {}
+_statements: Counter = Counter()
+_statement_seconds: DefaultDict[str, float] = defaultdict(float)
+_connections = {"opened": 0, "seconds": 0.0}
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_DISABLED = ("0", "false", "no", "off")
+
+# The statement being timed on this thread, and when it started
+_local = threading.local()
+
+
+def enable(output: Optional[Path] = None) -> None:
+    """Start collecting; the summary is emitted when the process exits."""
+    global ENABLED, _output, _registered
+    ENABLED = True
+    _output = output
+    if not _registered:
+        atexit.register(report)
+        _registered = True
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block; statements run inside it are attributed to `name`."""
+    if not ENABLED:
+        yield
+        return
+
+    global _current
+    stats = _phases.setdefault(name, [0, 0.0, 0])
+    outer, _current = _current, name
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats[0] += 1
+        stats[1] += time.perf_counter() - start
+        _current = outer
+
+
+def watch(conn: sqlite3.Connection, opened_at: float) -> None:
+    """Record a newly opened connection and trace its statements."""
+    if not ENABLED:
+        return
+    _connections["opened"] += 1
+    _connections["seconds"] += time.perf_counter() - opened_at
+    conn.set_trace_callback(_trace)
+
+
+def connection_factory() -> type:
+    """Connection class to open tracked connections with."""
+    return TimedConnection if ENABLED else sqlite3.Connection
+
+
+def _trace(statement: str) -> None:
+    # Bound values are expanded into the text; fold them so that the same
+    # query issued per track shows up as one hot statement
+    key = _WHITESPACE.sub(" ", _LITERALS.sub("?", statement)).strip()
+    _statements[key] += 1
+    if _current is not None:
+        _phases[_current][2] += 1
+
+    # A statement starting inside a timed call ends the one before it, e.g.
+    # in a script or after the implicit BEGIN
+    if getattr(_local, "timing", False):
+        now = time.perf_counter()
+        if _local.statement is not None:
+            _statement_seconds[_local.statement] += now - _local.started
+        _local.statement, _local.started = key, now
+
+
+def _timed(cursor: Optional["TimedCursor"], call: Callable, *args) -> Any:
+    # Fetching continues the cursor's last statement
+    _local.statement = cursor.statement if cursor is not None else None
+    _local.started = time.perf_counter()
+    _local.timing = True
+    try:
+        return call(*args)
+    finally:
+        _local.timing = False
+        if _local.statement is not None:
+            elapsed = time.perf_counter() - _local.started
+            _statement_seconds[_local.statement] += elapsed
+        if cursor is not None:
+            cursor.statement = _local.statement
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor that charges the time spent running and fetching to statements.
+
+    SQLite's trace hook only reports when a statement starts, so time is
+    measured around each call instead and split at every traced statement.
+    """
+
+    statement: Optional[str] = None
+
+    def execute(self, *args):
+        return _timed(self, super().execute, *args)
+
+    def executemany(self, *args):
+        return _timed(self, super().executemany, *args)
+
+    def executescript(self, *args):
+        return _timed(self, super().executescript, *args)
+
+    def fetchone(self):
+        return _timed(self, super().fetchone)
+
+    def fetchmany(self, *args):
+        return _timed(self, super().fetchmany, *args)
+
+    def fetchall(self):
+        return _timed(self, super().fetchall)
+
+    def __next__(self):
+        return _timed(self, super().__next__)
+
+
+class TimedConnection(sqlite3.Connection):
+    """Connection whose statements, commits included, run on TimedCursors."""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, *args):
+        return self.cursor().execute(*args)
+
+    def executemany(self, *args):
+        return self.cursor().executemany(*args)
+
+    def executescript(self, *args):
+        return self.cursor().executescript(*args)
+
+    def commit(self):
+        return _timed(None, super().commit)
+
+    def rollback(self):
+        return _timed(None, super().rollback)
+
+    def __exit__(self, *args):
+        return _timed(None, super().__exit__, *args)
+
+
+def summary() -> Dict:
+    """Collected timings and counts as plain data."""
+    return {
+        "phases": {
+            name: {"calls": calls, "seconds": seconds, "statements": statements}
+            for name, (calls, seconds, statements) in _phases.items()
+        },
+        "connections": dict(_connections),
+        "statements": {
+            "total": sum(_statements.values()),
+            "seconds": sum(_statement_seconds.values()),
+            "top": [
+                {"sql": sql, "count": count, "seconds": _statement_seconds[sql]}
+                for sql, count in _statements.most_common(TOP_STATEMENTS)
+            ],
+            "slowest": [
+                {"sql": sql, "count": _statements[sql], "seconds": seconds}
+                for sql, seconds in sorted(
+                    _statement_seconds.items(), key=lambda item: -item[1]
+                )[:TOP_STATEMENTS]
+            ],
+        },
+    }
+
+
+def report() -> None:
+    """Write the summary as JSON, or print it as tables on stderr."""
+    data = summary()
+    if _output is not None:
+        _output.parent.mkdir(parents=True, exist_ok=True)
+        _output.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console(stderr=True)
+
+    phases = Table(title="Profile")
+    phases.add_column("Phase", style="cyan")
+    phases.add_column("Calls", justify="right")
+    phases.add_column("Time (ms)", justify="right")
+    phases.add_column("SQL", justify="right")
+    for name, stats in data["phases"].items():
+        phases.add_row(
+            name,
+            str(stats["calls"]),
+            f"{stats['seconds'] * 1000:.2f}",
+            str(stats["statements"]),
+        )
+    console.print(phases)
+
+    totals = data["statements"]
+    titles = {
+        "top": f"{totals['total']} SQL statements "
+        f"({totals['seconds'] * 1000:.2f} ms) on "
+        f"{_connections['opened']} connection(s) "
+        f"opened in {_connections['seconds'] * 1000:.2f} ms",
+        "slowest": "Slowest statements",
+    }
+    for ranking, title in titles.items():
+        statements = Table(title=title)
+        statements.add_column("Count", justify="right")
+        statements.add_column("Time (ms)", justify="right")
+        statements.add_column("Statement", overflow="fold")
+        for row in totals[ranking]:
+            statements.add_row(
+                str(row["count"]), f"{row['seconds'] * 1000:.2f}", row["sql"]
+            )
+        console.print(statements)
+
+
+trace = os.getenv("SCHEDULER_TRACE", "").strip()
+if trace and trace.lower() not in _DISABLED:
+    enable(None if trace.lower() in ("1", "true", "yes", "on") else Path(trace))
@@ -1,72 +1,74 @@
+import hashlib
+import heapq
 import json
+import sqlite3
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from rich.console import Console
 
-from scheduler import db
+from scheduler import db, profiling
 from scheduler.constants import (
     CATEGORY_WEIGHT,
     COMPLETION_THRESHOLD,
     DAYS_FOR_TRACK_ROTATION,
+    DIVERSITY_BONUS,
+    HASH_MODE,
     MAX_APPEARANCES_PER_WEEK,
     MAX_DAILY_TRACKS,
     PROGRESS_WEIGHT,
     RECENCY_WEIGHT,
     ROTATION_WEIGHT,
+    SCORES_KEPT_PER_DAY,
+    SCORING_ENGINE,
+    WEIGHT_SCALE,
 )
-from scheduler.helpers import deterministic_k
+from scheduler.helpers import deterministic_k_batch
+from scheduler.models.track import TrackRecord, track_record
 
 console = Console()
 
 
-def get_all_tracks() -> List[Dict]:
+def get_all_tracks() -> List[TrackRecord]:
     """Get all track statistics from database."""
-    conn = db.connect()
-    cursor = conn.cursor()
-    cursor.execute("""
+    cursor = db.connect(readonly=True).cursor()
+    cursor.row_factory = track_record
+    return cursor.execute("""
         SELECT title, category, total, completed, active
         FROM tracks
         ORDER BY title
-    """)
-    tracks = []
-    for row in cursor.fetchall():
-        tracks.append(
-            {
-                "title": row[0],
-                "category": row[1],
-                "total": row[2],
-                "completed": row[3],
-                "active": row[4],
-            }
-        )
-    conn.close()
-    return tracks
+    """).fetchall()
 
 
-def get_active_tracks() -> List[Dict]:
+def get_active_tracks() -> List[TrackRecord]:
     """Get active track statistics from database."""
-    conn = db.connect()
-    cursor = conn.cursor()
-    cursor.execute("""
+    cursor = db.connect().cursor()
+    cursor.row_factory = track_record
+    return cursor.execute("""
         SELECT title, category, total, completed, active
         FROM tracks
         WHERE active = 1
         ORDER BY title
-    """)
-    tracks = []
-    for row in cursor.fetchall():
-        tracks.append(
-            {"title": row[0], "category": row[1], "total": row[2], "completed": row[3]}
-        )
-    conn.close()
-    return tracks
+    """).fetchall()
 
 
-def get_recent_history(days: int = DAYS_FOR_TRACK_ROTATION) -> Dict[str, int]:
-    """Get track appearance counts in recent days."""
-    end_date = date.today()
+def get_recent_history(
+    days: int = DAYS_FOR_TRACK_ROTATION, as_of: Optional[date] = None
+) -> Dict[str, int]:
+    """Get track appearance counts in the days before `as_of` (default today)."""
+    end_date = as_of or date.today()
     start_date = end_date - timedelta(days=days)
 
     conn = db.connect()
@@ -74,197 +76,963 @@ def get_recent_history(days: int = DAYS_FOR_TRACK_ROTATION) -> Dict[str, int]:
 
     cursor.execute(
         """
-        SELECT value as track, COUNT(*) as appearances
-        FROM schedule, json_each(schedule.core)
-        WHERE date BETWEEN ? AND ?
-        GROUP BY value
+        SELECT track, COUNT(*) as appearances
+        FROM schedule_entries
+        WHERE slot = 'core' AND date >= ? AND date < ?
+        GROUP BY track
     """,
         (start_date.isoformat(), end_date.isoformat()),
     )
 
     history = {row[0]: row[1] for row in cursor.fetchall()}
-    conn.close()
     return history
 
 
-def get_track_last_appearance(track: str) -> int:
-    """Get days since track last appeared in schedule."""
+def get_track_last_appearance(track: str, as_of: Optional[date] = None) -> int:
+    """Get days since track last appeared in schedule before `as_of`."""
+    as_of = as_of or date.today()
+
     conn = db.connect()
     cursor = conn.cursor()
 
     cursor.execute(
         """
         SELECT MAX(date) as last_date
-        FROM schedule, json_each(schedule.core)
-        WHERE value = ?
+        FROM schedule_entries
+        WHERE track = ? AND slot = 'core' AND date < ?
     """,
-        (track,),
+        (track, as_of.isoformat()),
     )
 
     result = cursor.fetchone()
-    conn.close()
 
     if result[0]:
         last_date = datetime.strptime(result[0], "%Y-%m-%d").date()
-        return (date.today() - last_date).days
+        return (as_of - last_date).days
     return 999
 
 
-def calculate_track_score(
-    track: Dict,
+class Weights(NamedTuple):
+    """Scoring weights and the weekly appearance cap that shape each pick."""
+
+    progress: Decimal
+    recency: Decimal
+    rotation: Decimal
+    category: Decimal
+    diversity_bonus: Decimal
+    max_appearances: int
+
+
+DEFAULT_WEIGHTS = Weights(
+    PROGRESS_WEIGHT,
+    RECENCY_WEIGHT,
+    ROTATION_WEIGHT,
+    CATEGORY_WEIGHT,
+    DIVERSITY_BONUS,
+    MAX_APPEARANCES_PER_WEEK,
+)
+
+
+@dataclass
+class ScoringSnapshot:
+    """All inputs needed to score tracks for one date, loaded up front."""
+
+    target_date: date
+    tracks: List[TrackRecord]
+    history: Dict[str, int]
+    last_appearances: Dict[str, str]
+    category_counts: Dict[str, int]
+    overused_categories: Set[str]
+    k_values: Dict[str, int]
+    weights: Weights = DEFAULT_WEIGHTS
+    fixed_weights: "FixedWeights" = field(init=False)
+
+    def __post_init__(self):
+        self.fixed_weights = scale_weights(self.weights)
+
+    @property
+    def today_str(self) -> str:
+        return self.target_date.isoformat()
+
+    def days_since_last(self, track: str) -> int:
+        """Days between the target date and the track's last appearance."""
+        last_date = self.last_appearances.get(track)
+        if last_date:
+            return (self.target_date - date.fromisoformat(last_date)).days
+        return 999
+
+
+def build_snapshot(
+    target_date: date,
+    tracks: List[TrackRecord],
     history: Dict[str, int],
-    today_str: str,
-    selected_categories: Optional[Set[str]] = None,
-) -> Tuple[Decimal, Dict]:
-    """Calculate comprehensive score for track selection."""
-    title = track["title"]
-    category = track["category"]
+    last_appearances: Dict[str, str],
+    categories: Optional[Dict[str, str]] = None,
+    weights: Weights = DEFAULT_WEIGHTS,
+) -> ScoringSnapshot:
+    """Derive category usage and per-date hashes for a scoring snapshot.
+
+    `categories` maps every active track to its category when `tracks` holds
+    only the tracks worth scoring; category usage is counted over all of them.
+    """
+    # Build category usage counts from recent history
+    category_counts: Dict[str, int] = {}
+    track_lookup = categories or {t.title: t.category for t in tracks}
+
+    for track_title, appearances in history.items():
+        if track_title in track_lookup:
+            category = track_lookup[track_title]
+            category_counts[category] = category_counts.get(category, 0) + appearances
+
+    # Treat frequently appearing categories as "overused" for diversity scoring
+    overused_categories = {
+        cat for cat, count in category_counts.items() if count >= 2
+    }  # Adjust threshold as needed
+
+    return ScoringSnapshot(
+        target_date=target_date,
+        tracks=tracks,
+        history=history,
+        last_appearances=last_appearances,
+        category_counts=category_counts,
+        overused_categories=overused_categories,
+        k_values=deterministic_k_batch(
+            target_date.isoformat(), [t.title for t in tracks]
+        ),
+        weights=weights,
+    )
+
+
+# Everything besides the tracks and the rotation window that shapes a plan
+_PLANNING_CONSTANTS = (
+    PROGRESS_WEIGHT,
+    RECENCY_WEIGHT,
+    ROTATION_WEIGHT,
+    CATEGORY_WEIGHT,
+    DIVERSITY_BONUS,
+    MAX_DAILY_TRACKS,
+    DAYS_FOR_TRACK_ROTATION,
+    COMPLETION_THRESHOLD,
+    MAX_APPEARANCES_PER_WEEK,
+    SCORES_KEPT_PER_DAY,
+    HASH_MODE,
+)
+
+
+def rotation_window(
+    core_by_date: Dict[str, List[str]],
+    target_date: date,
+    days: int = DAYS_FOR_TRACK_ROTATION,
+) -> Iterator[Tuple[str, List[str]]]:
+    """(date, core tracks) for the scheduled days in the window before a date."""
+    for offset in range(days, 0, -1):
+        day_str = (target_date - timedelta(days=offset)).isoformat()
+        core = core_by_date.get(day_str)
+        if core:
+            yield day_str, core
+
+
+def input_fingerprint(
+    tracks_version: int,
+    window: Iterator[Tuple[str, List[str]]],
+    engine: Optional[str] = None,
+) -> str:
+    """Digest of everything a day's plan is derived from.
+
+    Appearances older than the rotation window only ever saturate the recency
+    score, so the window's core tracks stand in for the whole history.
+    """
+    digest = hashlib.blake2b(
+        repr((tracks_version, engine or SCORING_ENGINE, _PLANNING_CONSTANTS)).encode(),
+        digest_size=16,
+    )
+    for date_str, core in window:
+        digest.update(f"{date_str}:{','.join(core)};".encode())
+    return digest.hexdigest()
+
+
+def get_table_version(conn: sqlite3.Connection, name: str) -> int:
+    """Change counter that triggers keep for a table's planning inputs."""
+    row = conn.execute(
+        "SELECT version FROM table_versions WHERE name = ?", (name,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def range_is_fresh(
+    conn: sqlite3.Connection,
+    start_date: date,
+    end_date: date,
+    engine: Optional[str] = None,
+    days: int = DAYS_FOR_TRACK_ROTATION,
+) -> bool:
+    """Whether every day in the range is planned from unchanged inputs.
+
+    Each day is checked against the stored history before it, which is what
+    replanning the (equally fresh) days before it would reproduce. Costs a
+    version lookup and an index range scan, however many tracks there are.
+    """
+    tracks_version = get_table_version(conn, "tracks")
+    stored = dict(
+        conn.execute(
+            "SELECT date, fingerprint FROM schedule WHERE date BETWEEN ? AND ?",
+            (start_date.isoformat(), end_date.isoformat()),
+        )
+    )
+    if len(stored) != (end_date - start_date).days + 1:
+        return False
+
+    core_by_date: Dict[str, List[str]] = {}
+    for date_str, track in conn.execute(
+        """
+        SELECT date, track FROM schedule_entries
+        WHERE slot = 'core' AND date >= ? AND date < ?
+        ORDER BY date, position
+    """,
+        ((start_date - timedelta(days=days)).isoformat(), end_date.isoformat()),
+    ):
+        core_by_date.setdefault(date_str, []).append(track)
+
+    return all(
+        fingerprint
+        == input_fingerprint(
+            tracks_version,
+            rotation_window(core_by_date, date.fromisoformat(date_str), days),
+            engine,
+        )
+        for date_str, fingerprint in stored.items()
+    )
+
+
+@dataclass
+class PlanningState:
+    """Tracks and rolling schedule history for planning consecutive days.
+
+    Loaded once; `record` advances the rotation window and the last-appearance
+    map in memory, so days must be planned in order.
+    """
+
+    tracks: List[TrackRecord]
+    categories: Dict[str, str]
+    last_appearances: Dict[str, str]
+    core_by_date: Dict[str, List[str]]
+    existing: Dict[str, Tuple[List[str], List[str]]]
+    days: int = DAYS_FOR_TRACK_ROTATION
+    tracks_version: int = 0
+    fingerprints: Dict[str, Optional[str]] = field(default_factory=dict)
+    weights: Weights = DEFAULT_WEIGHTS
+
+    def snapshot(self, target_date: date) -> ScoringSnapshot:
+        """Scoring inputs for `target_date` given everything recorded so far."""
+        history: Dict[str, int] = {}
+        for _, core in rotation_window(self.core_by_date, target_date, self.days):
+            for track in core:
+                history[track] = history.get(track, 0) + 1
+
+        return build_snapshot(
+            target_date,
+            self.tracks,
+            history,
+            dict(self.last_appearances),
+            self.categories,
+            self.weights,
+        )
+
+    def fingerprint(self, target_date: date, engine: Optional[str] = None) -> str:
+        """Input fingerprint for `target_date` given everything recorded so far."""
+        return input_fingerprint(
+            self.tracks_version,
+            rotation_window(self.core_by_date, target_date, self.days),
+            engine,
+        )
+
+    def record(self, date_str: str, core: List[str]) -> None:
+        """Add a planned (or already stored) day to the rolling history."""
+        self.core_by_date[date_str] = core
+        for track in core:
+            self.last_appearances[track] = date_str
+
+
+def load_planning_state(
+    start_date: date, end_date: date, days: int = DAYS_FOR_TRACK_ROTATION
+) -> PlanningState:
+    """Load tracks and schedule history for planning `start_date`..`end_date`.
+
+    Only schedules strictly before a planned day count towards it, so a forced
+    regeneration does not count the schedule it is about to replace.
+    """
+    start_str = start_date.isoformat()
+    end_str = end_date.isoformat()
+    window_str = (start_date - timedelta(days=days)).isoformat()
+
+    conn = db.connect()
+    # Read before the tracks, so a concurrent change leaves it stale, not ahead
+    tracks_version = get_table_version(conn, "tracks")
+
+    # Last appearances come from track_stats; only tracks already scheduled
+    # on or after the start date need an index seek for the one before it.
+    # Completed tracks are never picked, so they are only kept for category
+    # usage; the threshold test is the exact one the scorers apply.
+    tracks = []
+    categories: Dict[str, str] = {}
+    last_appearances: Dict[str, str] = {}
+    with profiling.phase("load tracks"):
+        for title, category, total, completed, eligible, last_date in conn.execute(
+            """
+            SELECT t.title, t.category, t.total, t.completed,
+                   t.total = 0 OR t.completed * :den < t.total * :num,
+                   CASE
+                       WHEN s.last_scheduled_date < :start
+                           THEN s.last_scheduled_date
+                       WHEN s.last_scheduled_date IS NOT NULL
+                           THEN (SELECT MAX(date) FROM schedule_entries
+                                 WHERE track = t.title AND slot = 'core'
+                                   AND date < :start)
+                   END
+            FROM tracks t
+            LEFT JOIN track_stats s ON s.track = t.title
+            WHERE t.active = 1
+            ORDER BY t.title
+        """,
+            {"start": start_str, "num": _THRESHOLD_NUM, "den": _THRESHOLD_DEN},
+        ):
+            categories[title] = category
+            if eligible:
+                tracks.append(TrackRecord(title, category, total, completed, 1))
+            if last_date:
+                last_appearances[title] = last_date
+
+    with profiling.phase("load history"):
+        # Stored days inside the range, including empty schedules
+        fingerprints: Dict[str, Optional[str]] = dict(
+            conn.execute(
+                "SELECT date, fingerprint FROM schedule WHERE date BETWEEN ? AND ?",
+                (start_str, end_str),
+            )
+        )
+        existing: Dict[str, Tuple[List[str], List[str]]] = {
+            date_str: ([], []) for date_str in fingerprints
+        }
+
+        # Range scan on (date) over the rotation window and the planned range
+        core_by_date: Dict[str, List[str]] = {}
+        for date_str, slot, track in conn.execute(
+            """
+            SELECT date, slot, track
+            FROM schedule_entries
+            WHERE date >= ? AND date <= ?
+            ORDER BY date, slot, position
+        """,
+            (window_str, end_str),
+        ):
+            if slot == "core":
+                core_by_date.setdefault(date_str, []).append(track)
+            if date_str in existing:
+                existing[date_str][0 if slot == "core" else 1].append(track)
+
+    return PlanningState(
+        tracks=tracks,
+        categories=categories,
+        last_appearances=last_appearances,
+        core_by_date=core_by_date,
+        existing=existing,
+        days=days,
+        tracks_version=tracks_version,
+        fingerprints=fingerprints,
+    )
+
+
+# What track_stats should contain, derived from the full history
+TRACK_STATS_SQL = """
+    SELECT track, MAX(last_scheduled_date), MAX(last_logged_date)
+    FROM (
+        SELECT track, MAX(date) AS last_scheduled_date, NULL AS last_logged_date
+        FROM schedule_entries WHERE slot = 'core' GROUP BY track
+        UNION ALL
+        SELECT track, NULL, MAX(date) FROM logs GROUP BY track
+    )
+    GROUP BY track
+"""
+
+
+def check_track_stats(conn: sqlite3.Connection) -> List[Tuple]:
+    """Return (track, stored, expected) for every track_stats row that drifted."""
+    stored = {
+        row[0]: row[1:]
+        for row in conn.execute(
+            """
+            SELECT track, last_scheduled_date, last_logged_date FROM track_stats
+            WHERE last_scheduled_date IS NOT NULL OR last_logged_date IS NOT NULL
+        """
+        )
+    }
+    expected = {row[0]: row[1:] for row in conn.execute(TRACK_STATS_SQL)}
+
+    return [
+        (track, stored.get(track), expected.get(track))
+        for track in sorted(stored.keys() | expected.keys())
+        if stored.get(track) != expected.get(track)
+    ]
+
+
+def rebuild_track_stats(conn: sqlite3.Connection) -> int:
+    """Recompute track_stats from schedule_entries and logs."""
+    with conn:
+        conn.execute("DELETE FROM track_stats")
+        cursor = conn.execute(
+            "INSERT INTO track_stats (track, last_scheduled_date, last_logged_date)"
+            + TRACK_STATS_SQL
+        )
+    return cursor.rowcount
+
+
+# What the rollup tables should contain, derived from the full history
+ROLLUP_SQL = (
+    """
+    INSERT INTO daily_rollup (
+        date, core, extra, logged, completed, in_progress, not_started
+    )
+    SELECT date, SUM(core), SUM(extra), SUM(logged), SUM(completed),
+           SUM(in_progress), SUM(not_started)
+    FROM (
+        SELECT date, slot = 'core' AS core, slot = 'extra' AS extra,
+               0 AS logged, 0 AS completed, 0 AS in_progress, 0 AS not_started
+        FROM schedule_entries
+        UNION ALL
+        SELECT date, 0, 0, 1, status IS 'completed', status IS 'in_progress',
+               status IS 'not_started'
+        FROM logs
+    )
+    GROUP BY date
+""",
+    """
+    INSERT INTO monthly_track_rollup (
+        month, track, scheduled, logged, completed, in_progress, not_started
+    )
+    SELECT substr(date, 1, 7), track, SUM(scheduled), SUM(logged),
+           SUM(completed), SUM(in_progress), SUM(not_started)
+    FROM (
+        SELECT date, track, 1 AS scheduled, 0 AS logged, 0 AS completed,
+               0 AS in_progress, 0 AS not_started
+        FROM schedule_entries
+        UNION ALL
+        SELECT date, track, 0, 1, status IS 'completed', status IS 'in_progress',
+               status IS 'not_started'
+        FROM logs
+    )
+    GROUP BY 1, track
+""",
+)
 
-    selected_categories = selected_categories or set()
+
+def rebuild_rollups(conn: sqlite3.Connection) -> None:
+    """Recompute daily_rollup and monthly_track_rollup from the raw history."""
+    with conn:
+        conn.execute("DELETE FROM daily_rollup")
+        conn.execute("DELETE FROM monthly_track_rollup")
+        for sql in ROLLUP_SQL:
+            conn.execute(sql)
+
+
+def load_scoring_snapshot(
+    target_date: date, days: int = DAYS_FOR_TRACK_ROTATION
+) -> ScoringSnapshot:
+    """Load tracks and schedule history for `target_date` in a few queries."""
+    return load_planning_state(target_date, target_date, days).snapshot(target_date)
+
+
+class ScoreBreakdown(NamedTuple):
+    """Per-component scores behind a track's total, as stored for each day."""
+
+    progress: float
+    recency: float
+    rotation: float
+    category: float
+    diversity_bonus: float
+    total: float
+    completion_ratio: float
+    days_since_last: int
+    recent_appearances: int
+
+
+SCORE_COLUMNS = ", ".join(ScoreBreakdown._fields)
+
+
+def calculate_track_score(
+    track: TrackRecord, snapshot: ScoringSnapshot, explain: bool = False
+) -> Tuple[Decimal, Optional[ScoreBreakdown]]:
+    """Calculate comprehensive score for track selection.
+
+    The breakdown is only built when `explain` is set, otherwise it is None.
+    """
+    title = track.title
+    category = track.category
 
     # 1. Progress Score (inverse of completion ratio)
-    completion_ratio = Decimal(track["completed"]) / Decimal(track["total"])
+    completion_ratio = Decimal(track.completed) / Decimal(track.total)
     if completion_ratio >= COMPLETION_THRESHOLD:
         progress_score = Decimal("0")  # Completed tracks get lowest priority
     else:
         progress_score = Decimal("1") - completion_ratio
 
     # 2. Recency Score (days since last appearance)
-    days_since = get_track_last_appearance(title)
+    days_since = snapshot.days_since_last(title)
     recency_score = min(Decimal(days_since) / Decimal("7"), Decimal("1"))
 
     # 3. Rotation Score (inverse of recent appearances)
-    recent_appearances = history.get(title, 0)
-    if recent_appearances >= MAX_APPEARANCES_PER_WEEK:
+    weights = snapshot.weights
+    recent_appearances = snapshot.history.get(title, 0)
+    if recent_appearances >= weights.max_appearances:
         rotation_score = Decimal("0")  # Maxed out for the week
     else:
         rotation_score = Decimal("1") - (
-            Decimal(recent_appearances) / Decimal(MAX_APPEARANCES_PER_WEEK)
+            Decimal(recent_appearances) / Decimal(weights.max_appearances)
         )
 
     # 4. Category Diversity Score (pseudo-random based on deterministic seed)
-    k_value = deterministic_k(today_str, title)
+    k_value = snapshot.k_values[title]
     category_score = Decimal(k_value % 1000) / Decimal("1000")  # Normalize to 0-1
 
     # 5. Category Diversity Bonus (boost for unused categories)
     diversity_bonus = (
-        Decimal("0.5") if category not in selected_categories else Decimal("0")
+        weights.diversity_bonus
+        if category not in snapshot.overused_categories
+        else Decimal("0")
     )
 
     # Combine scores with weights
     total_score = (
-        progress_score * PROGRESS_WEIGHT
-        + recency_score * RECENCY_WEIGHT
-        + rotation_score * ROTATION_WEIGHT
-        + category_score * CATEGORY_WEIGHT
+        progress_score * weights.progress
+        + recency_score * weights.recency
+        + rotation_score * weights.rotation
+        + category_score * weights.category
         + diversity_bonus  # Flat bonus for category diversity
     )
 
-    score_breakdown = {
-        "progress": float(progress_score),
-        "recency": float(recency_score),
-        "rotation": float(rotation_score),
-        "category": float(category_score),
-        "diversity_bonus": float(diversity_bonus),
-        "total": float(total_score),
-        "completion_ratio": float(completion_ratio),
-        "days_since_last": days_since,
-        "recent_appearances": recent_appearances,
-    }
+    if not explain:
+        return total_score, None
 
-    return total_score, score_breakdown
+    return total_score, ScoreBreakdown(
+        float(progress_score),
+        float(recency_score),
+        float(rotation_score),
+        float(category_score),
+        float(diversity_bonus),
+        float(total_score),
+        float(completion_ratio),
+        days_since,
+        recent_appearances,
+    )
 
 
-def generate_schedule(
-    target_date: Optional[date] = None, force: bool = False
-) -> Tuple[List[str], List[str], Dict]:
-    """Generate schedule using Bitcoin-style deterministic selection."""
-    if target_date is None:
-        target_date = date.today()
+_FIXED_SCALE = 10**20
+_THRESHOLD_NUM, _THRESHOLD_DEN = COMPLETION_THRESHOLD.as_integer_ratio()
 
-    today_str = target_date.isoformat()
 
-    # Check if schedule already exists
-    if not force:
-        conn = db.connect()
-        cursor = conn.cursor()
-        row = cursor.execute(
-            "SELECT core, extra FROM schedule WHERE date = ?",
-            (today_str,),
-        ).fetchone()
-        if row:
-            core = json.loads(row[0])
-            extra = json.loads(row[1])
-            conn.close()
-            return core, extra, {}
-        conn.close()
-
-    # Get all data needed for scoring
-    tracks = get_active_tracks()
-    history = get_recent_history()
-
-    # Score all tracks once
-    scored_tracks = []
-    score_details = {}
+class FixedWeights(NamedTuple):
+    """Integer multiplier per score component for the fixed-point engine."""
 
-    # Build category usage counts from recent history
-    category_counts = {}
-    track_lookup = {t["title"]: t["category"] for t in tracks}
+    progress: int
+    recency: int
+    rotation: int
+    category: int
+    diversity_bonus: int
+    max_appearances: int
+    unit: int  # A total of 1.0
 
-    for track_title, appearances in history.items():
-        if track_title in track_lookup:
-            category = track_lookup[track_title]
-            category_counts[category] = category_counts.get(category, 0) + appearances
 
-    for track in tracks:
-        # Treat frequently appearing categories as "overused" for diversity scoring
-        overused_categories = {
-            cat for cat, count in category_counts.items() if count >= 2
-        }  # Adjust threshold as needed
+def scale_weights(weights: Weights) -> FixedWeights:
+    """Lay out `weights` for calculate_track_score_fixed.
+
+    Weights are taken in parts per million. Recency (/7), rotation
+    (/max_appearances) and category (/1000) share one integer denominator, so
+    only the progress term (/total) is divided, and it is floored once at a
+    scale far finer than the smallest gap between two distinct totals.
+    """
+    progress, recency, rotation, category, bonus = (
+        int(weight * WEIGHT_SCALE) for weight in weights[:5]
+    )
+    denominator = 7 * weights.max_appearances * 1000
+    return FixedWeights(
+        progress=progress * denominator * _FIXED_SCALE,
+        recency=denominator // 7 * recency * _FIXED_SCALE,
+        rotation=denominator // weights.max_appearances * rotation * _FIXED_SCALE,
+        category=denominator // 1000 * category * _FIXED_SCALE,
+        diversity_bonus=bonus * denominator * _FIXED_SCALE,
+        max_appearances=weights.max_appearances,
+        unit=WEIGHT_SCALE * denominator * _FIXED_SCALE,
+    )
+
+
+def calculate_track_score_fixed(
+    track: TrackRecord, snapshot: ScoringSnapshot, explain: bool = False
+) -> Tuple[int, Optional[ScoreBreakdown]]:
+    """Integer-only equivalent of calculate_track_score.
+
+    The returned score is the exact weighted total scaled by the snapshot's
+    `fixed_weights.unit` and floored, so distinct totals rank the same way as
+    in the Decimal engine.
+    Exactly equal totals are left to `match_decimal_ties`.
+    """
+    title, category, total, completed, _ = track
+    weights = snapshot.fixed_weights
+
+    # 1. Progress Score, as a fraction of `total`
+    if completed * _THRESHOLD_DEN >= total * _THRESHOLD_NUM:
+        progress = 0  # Completed tracks get lowest priority
+    else:
+        progress = total - completed
+
+    # 2. Recency Score, in sevenths
+    days_since = snapshot.days_since_last(title)
+    recency = min(days_since, 7)
+
+    # 3. Rotation Score, in fractions of max_appearances
+    recent_appearances = snapshot.history.get(title, 0)
+    rotation = max(weights.max_appearances - recent_appearances, 0)
+
+    # 4. Category Diversity Score, in thousandths
+    category_score = snapshot.k_values[title] % 1000
+
+    # 5. Category Diversity Bonus
+    diversity_bonus = (
+        weights.diversity_bonus if category not in snapshot.overused_categories else 0
+    )
+
+    # Combine scores with weights
+    fixed_score = (
+        progress * weights.progress // total
+        + recency * weights.recency
+        + rotation * weights.rotation
+        + category_score * weights.category
+        + diversity_bonus
+    )
+
+    if not explain:
+        return fixed_score, None
+
+    return fixed_score, ScoreBreakdown(
+        progress / total,
+        recency / 7,
+        rotation / weights.max_appearances,
+        category_score / 1000,
+        diversity_bonus / weights.unit,
+        fixed_score / weights.unit,
+        completed / total,
+        days_since,
+        recent_appearances,
+    )
+
+
+def match_decimal_ties(
+    scored_tracks: List[Tuple[str, int, TrackRecord]], snapshot: ScoringSnapshot
+) -> None:
+    """Reorder exact fixed-point ties the way the Decimal engine ranks them.
+
+    Decimal rounds every intermediate to 28 digits, so two tracks with exactly
+    equal totals can come out a few ulps apart there. Only those tied runs are
+    rescored with the Decimal engine; everything else is already in order.
+    """
+    start = 0
+    while start < len(scored_tracks):
+        end = start + 1
+        while (
+            end < len(scored_tracks)
+            and scored_tracks[end][1] == scored_tracks[start][1]
+        ):
+            end += 1
+
+        if end - start > 1:
+            decimal_scores = {
+                title: calculate_track_score(track, snapshot)[0]
+                for title, _, track in scored_tracks[start:end]
+            }
+            scored_tracks[start:end] = sorted(
+                scored_tracks[start:end],
+                key=lambda item: (-decimal_scores[item[0]], snapshot.k_values[item[0]]),
+            )
+        start = end
+
+
+Scorer = Callable[..., Tuple[Any, Optional[ScoreBreakdown]]]
+
+SCORING_ENGINES: Dict[str, Scorer] = {
+    "decimal": calculate_track_score,
+    "fixed": calculate_track_score_fixed,
+}
 
-        score, breakdown = calculate_track_score(
-            track, history, today_str, overused_categories
+
+def get_scorer(engine: Optional[str] = None) -> Scorer:
+    """Look up a scoring engine by name (defaults to SCORING_ENGINE)."""
+    engine = engine or SCORING_ENGINE
+    try:
+        return SCORING_ENGINES[engine]
+    except KeyError:
+        raise ValueError(
+            f"Unknown scoring engine '{engine}'. "
+            f"Choose one of: {', '.join(SCORING_ENGINES)}"
+        ) from None
+
+
+def get_schedule(
+    conn: sqlite3.Connection, date_str: str
+) -> Optional[Tuple[List[str], List[str]]]:
+    """Read the stored core and extra tracks for a date, if scheduled."""
+    rows = conn.execute(
+        """
+        SELECT entries.slot, entries.track
+        FROM schedule
+        LEFT JOIN schedule_entries AS entries ON entries.date = schedule.date
+        WHERE schedule.date = ?
+        ORDER BY entries.slot, entries.position
+    """,
+        (date_str,),
+    ).fetchall()
+    if not rows:
+        return None
+
+    slots: Dict[str, List[str]] = {"core": [], "extra": []}
+    for slot, track in rows:
+        if slot is not None:
+            slots[slot].append(track)
+    return slots["core"], slots["extra"]
+
+
+def save_schedules(
+    conn: sqlite3.Connection,
+    schedules: List[Tuple[str, List[str], List[str]]],
+    scores: Optional[Dict[str, Dict[str, ScoreBreakdown]]] = None,
+    fingerprints: Optional[Dict[str, str]] = None,
+) -> None:
+    """Write schedule rows, their normalized entries and score breakdowns.
+
+    `scores` maps a date to its breakdowns in rank order and `fingerprints` a
+    date to its input fingerprint; whatever a rewritten date had of either is
+    dropped when it is not given.
+    """
+    fingerprints = fingerprints or {}
+    # Upsert rather than REPLACE so logs referencing the date are not cascaded away
+    conn.executemany(
+        """
+        INSERT INTO schedule (date, core, extra, fingerprint) VALUES (?, ?, ?, ?)
+        ON CONFLICT(date) DO UPDATE SET
+            core = excluded.core,
+            extra = excluded.extra,
+            fingerprint = excluded.fingerprint
+    """,
+        [
+            (date_str, json.dumps(core), json.dumps(extra), fingerprints.get(date_str))
+            for date_str, core, extra in schedules
+        ],
+    )
+    conn.executemany(
+        "DELETE FROM schedule_entries WHERE date = ?",
+        [(date_str,) for date_str, _, _ in schedules],
+    )
+    conn.executemany(
+        "INSERT INTO schedule_entries (date, track, slot, position) VALUES (?, ?, ?, ?)",
+        [
+            (date_str, track, slot, position)
+            for date_str, core, extra in schedules
+            for slot, tracks in (("core", core), ("extra", extra))
+            for position, track in enumerate(tracks)
+        ],
+    )
+    conn.executemany(
+        "DELETE FROM schedule_scores WHERE date = ?",
+        [(date_str,) for date_str, _, _ in schedules],
+    )
+    conn.executemany(
+        f"INSERT INTO schedule_scores (date, rank, track, {SCORE_COLUMNS}) "
+        f"VALUES (?, ?, ?{', ?' * len(ScoreBreakdown._fields)})",
+        [
+            (date_str, rank, track, *breakdown)
+            for date_str, breakdowns in (scores or {}).items()
+            for rank, (track, breakdown) in enumerate(breakdowns.items(), 1)
+        ],
+    )
+
+
+def get_score_breakdowns(
+    conn: sqlite3.Connection, date_str: str
+) -> Dict[str, ScoreBreakdown]:
+    """Read the breakdowns stored for a planned date, in rank order."""
+    return {
+        row[0]: ScoreBreakdown._make(row[1:])
+        for row in conn.execute(
+            f"SELECT track, {SCORE_COLUMNS} FROM schedule_scores "
+            "WHERE date = ? ORDER BY rank",
+            (date_str,),
         )
-        scored_tracks.append((track["title"], score, track["category"]))
-        score_details[track["title"]] = breakdown
+    }
+
+
+def select_tracks(
+    snapshot: ScoringSnapshot, score_track: Scorer, keep: int = SCORES_KEPT_PER_DAY
+) -> Tuple[List[str], List[str], Dict[str, ScoreBreakdown]]:
+    """Score the pickable tracks in the snapshot and pick core and extra tracks.
 
-    # Sort by score (descending) then by deterministic hash for tie-breaking
+    Completed tracks are expected to be filtered out when the snapshot is
+    loaded; tracks at the weekly appearance cap are skipped before scoring.
+    Breakdowns are built for the picks and the best runners-up only, up to
+    `keep`, in rank order.
+    """
+    max_appearances = snapshot.weights.max_appearances
+    scored_tracks = []
+
+    with profiling.phase("scoring"):
+        for track in snapshot.tracks:
+            # Skip if maxed out appearances this week
+            if snapshot.history.get(track.title, 0) >= max_appearances:
+                continue
+
+            score, _ = score_track(track, snapshot)
+            scored_tracks.append((track.title, score, track))
+
+    # Order by score (descending) then by deterministic hash for tie-breaking
     def sort_key(item):
         title, score, _ = item
-        k_value = deterministic_k(today_str, title)
-        return (-score, k_value)
+        return (-score, snapshot.k_values[title])
 
-    scored_tracks.sort(key=sort_key)
+    # Only the top few are kept, so select them with a heap instead of sorting
+    total_tracks = MAX_DAILY_TRACKS + 2  # Assuming 2 extra slots
+    with profiling.phase("select"):
+        ranked = heapq.nsmallest(max(total_tracks, keep), scored_tracks, key=sort_key)
+        picked = ranked[:total_tracks]
+        if picked and score_track is calculate_track_score_fixed:
+            # A tie run crossing the cut-off may be reordered by the Decimal
+            # engine, so bring the whole run in before matching it
+            boundary = picked[-1][1]
+            chosen = {title for title, _, _ in picked}
+            picked.extend(
+                sorted(
+                    (
+                        item
+                        for item in scored_tracks
+                        if item[1] == boundary and item[0] not in chosen
+                    ),
+                    key=sort_key,
+                )
+            )
+            match_decimal_ties(picked, snapshot)
+            del picked[total_tracks:]
 
-    # Filter out ineligible tracks
-    eligible_tracks = []
-    for title, score, category in scored_tracks:
-        # Skip if already completed
-        if score_details[title]["completion_ratio"] >= float(COMPLETION_THRESHOLD):
-            continue
+        chosen = {title for title, _, _ in picked}
+        ranked = picked + [item for item in ranked if item[0] not in chosen]
+        del ranked[max(total_tracks, keep) :]
 
-        # Skip if maxed out appearances this week
-        if score_details[title]["recent_appearances"] >= MAX_APPEARANCES_PER_WEEK:
-            continue
-
-        eligible_tracks.append(title)
+    with profiling.phase("explain"):
+        breakdowns = {
+            title: score_track(track, snapshot, True)[1] for title, _, track in ranked
+        }
 
     # Split tracks by ratio - core gets the majority, extra gets the rest
-    total_tracks = min(
-        len(eligible_tracks), MAX_DAILY_TRACKS + 2
-    )  # Assuming 2 extra slots
-    core_count = min(MAX_DAILY_TRACKS, total_tracks)
+    core_count = min(MAX_DAILY_TRACKS, len(picked))
+    core = [title for title, _, _ in picked[:core_count]]
+    extra = [title for title, _, _ in picked[core_count:]]
+
+    return core, extra, breakdowns
+
 
-    # Split the eligible tracks
-    core = eligible_tracks[:core_count]
-    extra = eligible_tracks[core_count:total_tracks]
+def generate_range(
+    start_date: date,
+    end_date: date,
+    force: bool = False,
+    engine: Optional[str] = None,
+    explain: bool = False,
+    reuse: bool = True,
+) -> Dict[str, Tuple[List[str], List[str], Dict[str, ScoreBreakdown]]]:
+    """Plan every day from `start_date` to `end_date` in one pass.
+
+    State is loaded once and rolled forward in memory, and all new days are
+    written in a single transaction. The result matches calling
+    generate_schedule for each day in order. Score breakdowns are stored for
+    every planned day and returned only with `explain`.
+
+    Even with `force`, a stored day whose input fingerprint still matches is
+    kept as it is, since replanning it would give the same result; `reuse`
+    turns that off. When the whole range matches, nothing is scored at all.
+    """
+    if end_date < start_date:
+        raise ValueError("End date must not be before start date")
+
+    score_track = get_scorer(engine)
+    results: Dict[str, Tuple[List[str], List[str], Dict[str, ScoreBreakdown]]] = {}
+
+    if force and reuse:
+        conn = db.connect()
+        with profiling.phase("fingerprint"):
+            fresh = range_is_fresh(conn, start_date, end_date, engine)
+        if fresh:
+            for offset in range((end_date - start_date).days + 1):
+                day_str = (start_date + timedelta(days=offset)).isoformat()
+                core, extra = get_schedule(conn, day_str)
+                details = get_score_breakdowns(conn, day_str) if explain else {}
+                results[day_str] = (core, extra, details)
+            return results
+
+    state = load_planning_state(start_date, end_date)
+
+    generated = []
+    scores: Dict[str, Dict[str, ScoreBreakdown]] = {}
+    fingerprints: Dict[str, str] = {}
+
+    day = start_date
+    while day <= end_date:
+        day_str = day.isoformat()
+        fingerprint = state.fingerprint(day, engine)
+        if day_str in state.existing and (
+            not force or (reuse and state.fingerprints[day_str] == fingerprint)
+        ):
+            core, extra = state.existing[day_str]
+            details = get_score_breakdowns(db.connect(), day_str) if explain else {}
+        else:
+            with profiling.phase("snapshot"):
+                snapshot = state.snapshot(day)
+            core, extra, details = select_tracks(snapshot, score_track)
+            generated.append((day_str, core, extra))
+            scores[day_str] = details
+            fingerprints[day_str] = fingerprint
+
+        state.record(day_str, core)
+        results[day_str] = (core, extra, details if explain else {})
+        day += timedelta(days=1)
 
     # Store in database
-    conn = db.connect()
-    with conn:
-        conn.execute(
-            "INSERT OR REPLACE INTO schedule (date, core, extra) VALUES (?, ?, ?)",
-            (today_str, json.dumps(core), json.dumps(extra)),
-        )
+    if generated:
+        conn = db.connect()
+        with profiling.phase("persist"), conn:
+            save_schedules(conn, generated, scores, fingerprints)
+
+    return results
+
+
+def generate_schedule(
+    target_date: Optional[date] = None,
+    force: bool = False,
+    engine: Optional[str] = None,
+    explain: bool = False,
+    reuse: bool = True,
+) -> Tuple[List[str], List[str], Dict[str, ScoreBreakdown]]:
+    """Generate schedule using Bitcoin-style deterministic selection.
+
+    A forced run keeps the stored schedule when its inputs are unchanged,
+    unless `reuse` is off (see generate_range).
+    """
+    if target_date is None:
+        target_date = date.today()
+
+    today_str = target_date.isoformat()
+
+    # Check if schedule already exists
+    if not force:
+        conn = db.connect()
+        with profiling.phase("lookup"):
+            existing = get_schedule(conn, today_str)
+        if existing:
+            core, extra = existing
+            return core, extra, get_score_breakdowns(conn, today_str) if explain else {}
 
-    return core, extra, score_details
+    return generate_range(target_date, target_date, force, engine, explain, reuse)[
+        today_str
+    ]
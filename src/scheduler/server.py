@@ -0,0 +1,186 @@
+"""Local HTTP API over the asyncio SchedulerService (stdlib only)."""
+
+import asyncio
+import json
+import os
+import signal
+from datetime import date
+from http import HTTPStatus
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from scheduler import client, utils
+from scheduler.service import MAX_BATCH, READ_WORKERS, SchedulerService
+
+MAX_HEADERS = 100
+
+Handler = Callable[[Dict[str, str], Dict], Awaitable[Dict]]
+
+
+def _date(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value) if value else None
+
+
+def _routes(service: SchedulerService) -> Dict[Tuple[str, str], Handler]:
+    """(method, path) -> coroutine taking (query, body) and returning JSON data."""
+
+    async def health(query, body):
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "write_batches": service.writer.batches,
+            "writes": service.writer.writes,
+        }
+
+    async def schedule(query, body):
+        return await service.generate(_date(query.get("date")))
+
+    async def generate(query, body):
+        return await service.generate(
+            _date(body.get("date")),
+            bool(body.get("force", False)),
+            bool(body.get("scores", False)),
+        )
+
+    async def log(query, body):
+        if not isinstance(body["track"], str):
+            raise ValueError("track must be a string")
+        return await service.log(
+            body["track"],
+            body.get("status", "completed"),
+            int(body.get("exercises", 1)),
+            _date(body.get("date")),
+        )
+
+    async def log_many(query, body):
+        return await service.log_many(body["records"])
+
+    async def status(query, body):
+        return await service.status()
+
+    async def report(query, body):
+        start, end = utils.get_week_range()
+        return await service.report(query.get("from", start), query.get("to", end))
+
+    return {
+        ("GET", "/health"): health,
+        ("GET", "/schedule"): schedule,
+        ("POST", "/generate"): generate,
+        ("POST", "/log"): log,
+        ("POST", "/logs"): log_many,
+        ("GET", "/status"): status,
+        ("GET", "/report"): report,
+    }
+
+
+class SchedulerServer:
+    """Minimal HTTP/1.1 (keep-alive, Content-Length bodies) over asyncio streams."""
+
+    def __init__(
+        self,
+        workers: int = READ_WORKERS,
+        max_batch: int = MAX_BATCH,
+        verbose: bool = False,
+    ):
+        self.service = SchedulerService(workers, max_batch)
+        self.routes = _routes(self.service)
+        self.verbose = verbose
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Dict]:
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        if handler is None:
+            return 404, {"error": f"No route for {method} {url.path}"}
+
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ValueError("Request body must be a JSON object")
+            return 200, await handler(query, payload)
+        except KeyError as e:
+            return 400, {"error": f"Missing field {e}"}
+        except (TypeError, ValueError) as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": str(e)}
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests on one connection until the client closes it."""
+        try:
+            while request_line := await reader.readline():
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers: Dict[str, str] = {}
+                for _ in range(MAX_HEADERS):
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+
+                code, data = await self.dispatch(method, target, body)
+                payload = json.dumps(data).encode()
+                writer.write(
+                    f"HTTP/1.1 {code} {HTTPStatus(code).phrase}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode("latin-1")
+                    + payload
+                )
+                await writer.drain()
+                if self.verbose:
+                    print(f"{method} {target} {code}", flush=True)
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def run(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        socket_path: Optional[Path] = None,
+        on_ready: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Listen until SIGINT/SIGTERM, advertising the address meanwhile."""
+        if socket_path is not None:
+            socket_path.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(self.handle, str(socket_path))
+            address: Dict = {"socket": str(socket_path)}
+            where = str(socket_path)
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+            port = server.sockets[0].getsockname()[1]
+            address = {"host": host, "port": port}
+            where = f"http://{host}:{port}"
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
+        service_file = client.service_file()
+        service_file.write_text(
+            json.dumps({**address, "pid": os.getpid()}), encoding="utf-8"
+        )
+        try:
+            if on_ready is not None:
+                on_ready(where)
+            await stop.wait()
+        finally:
+            service_file.unlink(missing_ok=True)
+            server.close()
+            server.close_clients()
+            await server.wait_closed()
+            self.service.close()
+            if socket_path is not None:
+                socket_path.unlink(missing_ok=True)
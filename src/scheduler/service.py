@@ -0,0 +1,256 @@
+"""Asyncio service core over the scheduler's blocking SQLite functions.
+
+Reads run on a bounded pool of threads, each with its own read-only
+connection. Writes go to a single writer thread that groups whatever is
+queued into one transaction, so many concurrent clients cost one commit.
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from scheduler import db, scheduler
+from scheduler.commands.log import parse_records, write_log, write_logs
+from scheduler.commands.report import load_report
+from scheduler.commands.status import load_status
+
+READ_WORKERS = 4
+MAX_BATCH = 256
+
+_STOP = object()
+
+Job = Tuple[Callable[[sqlite3.Connection], Any], bool, Future]
+
+
+class BatchWriter(threading.Thread):
+    """Single writer thread that commits queued writes in batches.
+
+    Each batched write runs in its own savepoint, so one failing write is
+    rolled back without taking the rest of its batch with it. Writes that
+    manage their own transaction (e.g. schedule generation) run alone.
+    """
+
+    def __init__(self, max_batch: int = MAX_BATCH):
+        super().__init__(name="scheduler-writer", daemon=True)
+        self.max_batch = max_batch
+        self.batches = 0
+        self.writes = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    def submit(
+        self, fn: Callable[[sqlite3.Connection], Any], batched: bool = True
+    ) -> Future:
+        """Queue `fn(conn)` to run on the writer thread."""
+        future: Future = Future()
+        self._queue.put((fn, batched, future))
+        return future
+
+    def stop(self) -> None:
+        """Finish queued writes and stop the thread."""
+        self._queue.put(_STOP)
+        self.join()
+
+    def run(self) -> None:
+        conn = db.connect()
+        job = self._queue.get()
+        while job is not _STOP:
+            fn, batched, future = job
+            if not batched:
+                self._run_alone(conn, fn, future)
+                job = self._queue.get()
+                continue
+
+            # Take everything already queued, up to the next unbatched job
+            batch: List[Job] = [job]
+            job = None
+            while len(batch) < self.max_batch:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    job = None
+                    break
+                if job is _STOP or not job[1]:
+                    break
+                batch.append(job)
+                job = None
+
+            self._run_batch(conn, batch)
+            if job is None:
+                job = self._queue.get()
+
+    def _run_alone(self, conn: sqlite3.Connection, fn, future: Future) -> None:
+        try:
+            future.set_result(fn(conn))
+        except Exception as e:
+            future.set_exception(e)
+        self.writes += 1
+
+    def _run_batch(self, conn: sqlite3.Connection, batch: List[Job]) -> None:
+        outcomes = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fn, _, future in batch:
+                conn.execute("SAVEPOINT write")
+                try:
+                    outcomes.append((future, fn(conn), None))
+                    conn.execute("RELEASE write")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO write")
+                    conn.execute("RELEASE write")
+                    outcomes.append((future, None, e))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        # Only report success once the batch is durable
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+        self.batches += 1
+        self.writes += len(batch)
+
+
+class SchedulerService:
+    """Answer generate/log/status/report requests without blocking the loop.
+
+    Read results are cached on the event loop thread until the database
+    changes, which is detected with PRAGMA data_version, so commits by the
+    writer thread and by other processes both invalidate them.
+    """
+
+    def __init__(self, workers: int = READ_WORKERS, max_batch: int = MAX_BATCH):
+        self._readers = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="scheduler-reader"
+        )
+        self.writer = BatchWriter(max_batch)
+        self.writer.start()
+        self._cache: Dict[Hashable, Any] = {}
+        self._seen_version: Optional[int] = None
+
+    def close(self) -> None:
+        """Drain pending writes and stop the worker threads."""
+        self.writer.stop()
+        self._readers.shutdown()
+
+    def _data_version(self) -> int:
+        # A few microseconds on the loop thread's own read-only connection
+        return db.connect(readonly=True).execute("PRAGMA data_version").fetchone()[0]
+
+    async def _read(self, key: Hashable, fn: Callable, *args) -> Any:
+        version = self._data_version()
+        if version != self._seen_version:
+            self._cache.clear()
+            self._seen_version = version
+        if key in self._cache:
+            return self._cache[key]
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._readers, fn, *args)
+        # Don't cache a result that raced with a commit
+        if result is not None and self._data_version() == version:
+            self._cache[key] = result
+        return result
+
+    async def _write(self, fn: Callable, batched: bool = True) -> Any:
+        try:
+            return await asyncio.wrap_future(self.writer.submit(fn, batched))
+        finally:
+            self._cache.clear()
+
+    async def generate(
+        self, day: Optional[date] = None, force: bool = False, explain: bool = False
+    ) -> Dict:
+        """Schedule for `day` (default today), planning it if necessary.
+
+        With `explain`, the schedule also carries its score breakdowns. A forced
+        request whose inputs are unchanged is answered from the read pool too.
+        """
+        day = day or date.today()
+        existing = await self._read(
+            ("schedule", day.isoformat(), explain, force),
+            _load_schedule,
+            day,
+            explain,
+            force,
+        )
+        if existing is not None:
+            return existing
+
+        return await self._write(lambda _: _plan(day, force, explain), batched=False)
+
+    async def log(
+        self,
+        track: str,
+        status: str = "completed",
+        exercises: int = 1,
+        day: Optional[date] = None,
+    ) -> Dict:
+        """Log progress for a track as part of the next write batch."""
+        day_str = (day or date.today()).isoformat()
+        previous = await self._write(
+            partial(
+                write_log,
+                track=track,
+                status=status,
+                exercises=exercises,
+                day_str=day_str,
+            )
+        )
+        return {"track": track, "status": status, "previous_status": previous}
+
+    async def log_many(self, rows: List[Dict]) -> Dict:
+        """Apply many log records as a single write."""
+        records = list(parse_records(rows))
+        return await self._write(partial(write_logs, records=records))
+
+    async def status(self) -> Dict:
+        """Overall and per-category progress."""
+        return await self._read("status", load_status)
+
+    async def report(self, start_date: str, end_date: str) -> Dict:
+        """Schedules and logs between two ISO dates."""
+        return await self._read(
+            ("report", start_date, end_date), load_report, start_date, end_date
+        )
+
+
+def _load_schedule(
+    day: date, explain: bool = False, fresh: bool = False
+) -> Optional[Dict]:
+    conn = db.connect(readonly=True)
+    # With `fresh`, only a schedule whose input fingerprint still matches
+    if fresh and not scheduler.range_is_fresh(conn, day, day):
+        return None
+    existing = scheduler.get_schedule(conn, day.isoformat())
+    if existing is None:
+        return None
+    core, extra = existing
+    details = scheduler.get_score_breakdowns(conn, day.isoformat()) if explain else {}
+    return {
+        "date": day.isoformat(),
+        "core": core,
+        "extra": extra,
+        "details": {track: scores._asdict() for track, scores in details.items()},
+    }
+
+
+def _plan(day: date, force: bool, explain: bool) -> Dict:
+    core, extra, details = scheduler.generate_schedule(
+        day, force=force, explain=explain
+    )
+    return {
+        "date": day.isoformat(),
+        "core": core,
+        "extra": extra,
+        "details": {track: scores._asdict() for track, scores in details.items()},
+    }
@@ -0,0 +1,182 @@
+"""Replay planning over simulated days under alternative scoring weights.
+
+The planning state is loaded from the database once. Each configuration then
+plans its days and works through its picks entirely in memory, so nothing is
+written back and configurations run side by side in worker processes.
+"""
+
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import date, timedelta
+from itertools import product
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from scheduler.constants import (
+    COMPLETION_THRESHOLD,
+    DIVERSITY_BONUS,
+    MIN_APPEARANCES_PER_WEEK,
+)
+from scheduler.scheduler import (
+    PlanningState,
+    Weights,
+    get_scorer,
+    load_planning_state,
+    select_tracks,
+)
+
+_THRESHOLD_NUM, _THRESHOLD_DEN = COMPLETION_THRESHOLD.as_integer_ratio()
+
+
+class SimulationResult(NamedTuple):
+    """How one weight configuration played out over the simulated days."""
+
+    weights: Weights
+    # Share of track-weeks with at least MIN_APPEARANCES_PER_WEEK core picks
+    coverage: float
+    # Jain's index of core picks per day each track was pickable (1 = even)
+    fairness: float
+    # Tracks that crossed the completion threshold, and the median day they did
+    completed: int
+    median_days: Optional[float]
+
+
+def weight_grid(
+    progress: Iterable,
+    recency: Iterable,
+    rotation: Iterable,
+    category: Iterable,
+    max_appearances: Iterable[int],
+) -> List[Weights]:
+    """Every combination of the given values, with the default diversity bonus."""
+    return [
+        Weights(p, r, rot, c, DIVERSITY_BONUS, m)
+        for p, r, rot, c, m in product(
+            progress, recency, rotation, category, max_appearances
+        )
+    ]
+
+
+def _jain_index(values: List[float]) -> float:
+    squares = sum(value * value for value in values)
+    if not squares:
+        return 1.0
+    return sum(values) ** 2 / (len(values) * squares)
+
+
+def simulate(
+    state: PlanningState,
+    weights: Weights,
+    start_date: date,
+    days: int,
+    exercises: int = 1,
+    engine: Optional[str] = None,
+) -> SimulationResult:
+    """Plan `days` days from `start_date` under `weights`.
+
+    Every day, each core pick gains `exercises` completed exercises, and
+    tracks leave the pool once they cross the completion threshold, just as
+    they would after being logged. `state` itself is left untouched.
+    """
+    score_track = get_scorer(engine)
+    state = replace(
+        state,
+        tracks=list(state.tracks),
+        last_appearances=dict(state.last_appearances),
+        core_by_date=dict(state.core_by_date),
+        weights=weights,
+    )
+    position = {track.title: i for i, track in enumerate(state.tracks)}
+    pickable = list(position)
+    finished: Dict[str, int] = {}
+    plan: List[List[str]] = []
+
+    for offset in range(days):
+        day = start_date + timedelta(days=offset)
+        core, _, _ = select_tracks(state.snapshot(day), score_track, keep=0)
+        state.record(day.isoformat(), core)
+        plan.append(core)
+
+        for title in core:
+            i = position[title]
+            track = state.tracks[i]
+            completed = min(track.total, track.completed + exercises)
+            state.tracks[i] = track._replace(completed=completed)
+            if completed * _THRESHOLD_DEN >= track.total * _THRESHOLD_NUM:
+                finished[title] = offset + 1
+
+        if any(title in finished for title in core):
+            state.tracks = [t for t in state.tracks if t.title not in finished]
+            position = {track.title: i for i, track in enumerate(state.tracks)}
+
+    # A track counts towards a week's coverage if it was pickable when it began
+    covered = track_weeks = 0
+    for week_start in range(0, days - days % 7, 7):
+        counts: Dict[str, int] = {}
+        for core in plan[week_start : week_start + 7]:
+            for title in core:
+                counts[title] = counts.get(title, 0) + 1
+        for title in pickable:
+            if finished.get(title, days) > week_start:
+                track_weeks += 1
+                covered += counts.get(title, 0) >= MIN_APPEARANCES_PER_WEEK
+
+    picks = dict.fromkeys(pickable, 0)
+    for core in plan:
+        for title in core:
+            picks[title] += 1
+
+    return SimulationResult(
+        weights=weights,
+        coverage=covered / track_weeks if track_weeks else 1.0,
+        fairness=_jain_index(
+            [picks[title] / finished.get(title, days) for title in pickable]
+        ),
+        completed=len(finished),
+        median_days=statistics.median(finished.values()) if finished else None,
+    )
+
+
+# Per-process inputs shared by every configuration a worker simulates
+_worker_args: Optional[Tuple] = None
+
+
+def _init_worker(*args) -> None:
+    global _worker_args
+    _worker_args = args
+
+
+def _simulate_in_worker(weights: Weights) -> SimulationResult:
+    state, start_date, days, exercises, engine = _worker_args
+    return simulate(state, weights, start_date, days, exercises, engine)
+
+
+def run_grid(
+    grid: List[Weights],
+    start_date: date,
+    days: int,
+    exercises: int = 1,
+    workers: Optional[int] = None,
+    engine: Optional[str] = None,
+) -> Iterator[SimulationResult]:
+    """Simulate every configuration in `grid`, in order, across a process pool.
+
+    The state is loaded once and handed to each worker when it starts, so a
+    configuration costs only its own planning, not a copy of the catalog.
+    """
+    state = load_planning_state(start_date, start_date)
+    args = (state, start_date, days, exercises, engine)
+
+    workers = min(workers or os.cpu_count() or 1, len(grid))
+    if workers <= 1:
+        for weights in grid:
+            yield simulate(state, weights, start_date, days, exercises, engine)
+        return
+
+    # Chunks amortize the round trips while leaving a few per worker to balance
+    chunksize = max(1, len(grid) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=args
+    ) as pool:
+        yield from pool.map(_simulate_in_worker, grid, chunksize=chunksize)
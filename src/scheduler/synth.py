@@ -0,0 +1,185 @@
+import random
+from collections import Counter, deque
+from datetime import date, timedelta
+from itertools import accumulate, islice, repeat
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from scheduler import db
+from scheduler.constants import (
+    DAYS_FOR_TRACK_ROTATION,
+    MAX_APPEARANCES_PER_WEEK,
+    MAX_DAILY_TRACKS,
+)
+from scheduler.scheduler import rebuild_rollups, rebuild_track_stats, save_schedules
+
+# Completion ratio samplers, keyed by distribution name
+DISTRIBUTIONS: Dict[str, Callable[[random.Random], float]] = {
+    "uniform": lambda rng: rng.random(),
+    "beginner": lambda rng: rng.betavariate(1.2, 5),
+    "advanced": lambda rng: rng.betavariate(5, 1.2),
+    "bimodal": lambda rng: rng.betavariate(0.4, 0.4),
+}
+
+LOG_STATUSES = ("completed", "in_progress", "not_started")
+LOG_STATUS_WEIGHTS = (6, 3, 1)
+STATUS_CUM_WEIGHTS = tuple(accumulate(LOG_STATUS_WEIGHTS))
+EXTRA_TRACKS = 2
+
+
+def synthesize(
+    path: Union[str, Path],
+    tracks: int = 1000,
+    categories: int = 10,
+    days: int = 365,
+    seed: int = 0,
+    distribution: str = "uniform",
+    logs_per_day: Optional[int] = None,
+    end_date: Optional[date] = None,
+    chunk_size: int = 100_000,
+    overwrite: bool = False,
+) -> Dict[str, int]:
+    """Create a database at `path` filled with deterministic synthetic data.
+
+    Schedules respect MAX_APPEARANCES_PER_WEEK over the rotation window. Each
+    day logs its scheduled tracks plus random others up to `logs_per_day`.
+    An existing file at `path` is only replaced with `overwrite`. The process
+    is pointed back at its previous database afterwards.
+    Returns the number of rows written per table.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(
+            f"Unknown distribution '{distribution}'. "
+            f"Choose one of: {', '.join(DISTRIBUTIONS)}"
+        )
+
+    path = Path(path)
+    if path.exists() and not overwrite:
+        raise FileExistsError(f"{path} already exists")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for suffix in ("", "-wal", "-shm"):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+    # Only for the load; the database in use before is restored afterwards
+    previous = db.DATABASE_PATH
+    db.use_database(path)
+    try:
+        db.initialize()
+
+        rng = random.Random(seed)
+        end_date = end_date or date.today()
+        titles = [f"track-{i:07d}" for i in range(tracks)]
+        category_names = [f"category-{i:03d}" for i in range(max(1, categories))]
+        sample_ratio = DISTRIBUTIONS[distribution]
+
+        track_rows = []
+        for title in titles:
+            total = rng.randint(20, 200)
+            completed = min(total, round(total * sample_ratio(rng)))
+            track_rows.append((title, rng.choice(category_names), total, completed, 1))
+
+        schedules = list(_schedules(rng, titles, days, end_date))
+
+        conn = db.connect()
+        # Generated rows are consistent by construction; skip per-row FK checks,
+        # and set the log indexes and triggers aside until the load is done
+        deferred = conn.execute(
+            "SELECT type, name, sql FROM sqlite_master "
+            "WHERE tbl_name = 'logs' AND type IN ('index', 'trigger') AND sql IS NOT NULL"
+        ).fetchall()
+        conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            with conn:
+                for kind, name, _ in deferred:
+                    conn.execute(f"DROP {kind.upper()} {name}")
+                conn.executemany(
+                    "INSERT INTO tracks (title, category, total, completed, active) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    track_rows,
+                )
+                save_schedules(conn, schedules)
+
+                logs = _logs(rng, titles, schedules, logs_per_day)
+                log_count = 0
+                while chunk := list(islice(logs, chunk_size)):
+                    conn.executemany(
+                        "INSERT INTO logs (date, track, status) VALUES (?, ?, ?)", chunk
+                    )
+                    log_count += len(chunk)
+
+                for _, _, sql in deferred:
+                    conn.execute(sql)
+        finally:
+            conn.execute("PRAGMA foreign_keys = ON")
+        rebuild_track_stats(conn)
+        rebuild_rollups(conn)
+    finally:
+        db.use_database(previous)
+
+    return {
+        "tracks": len(track_rows),
+        "schedule": len(schedules),
+        "schedule_entries": sum(len(c) + len(e) for _, c, e in schedules),
+        "logs": log_count,
+    }
+
+
+def _schedules(
+    rng: random.Random, titles: List[str], days: int, end_date: date
+) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """Random daily picks that never exceed MAX_APPEARANCES_PER_WEEK in core."""
+    window: deque = deque()
+    appearances: Counter = Counter()
+    per_day = min(MAX_DAILY_TRACKS + EXTRA_TRACKS, len(titles))
+
+    for offset in range(days, 0, -1):
+        day_str = (end_date - timedelta(days=offset)).isoformat()
+
+        if len(window) == DAYS_FOR_TRACK_ROTATION:
+            appearances.subtract(window.popleft())
+
+        picked: List[str] = []
+        # Rejection sampling is cheap for large catalogs; fall back to a scan
+        for title in rng.sample(titles, min(len(titles), per_day * 4)):
+            if len(picked) == per_day:
+                break
+            if title not in picked and (
+                len(picked) >= MAX_DAILY_TRACKS
+                or appearances[title] < MAX_APPEARANCES_PER_WEEK
+            ):
+                picked.append(title)
+        if len(picked) < per_day:
+            for title in titles:
+                if len(picked) == per_day:
+                    break
+                if title not in picked and (
+                    len(picked) >= MAX_DAILY_TRACKS
+                    or appearances[title] < MAX_APPEARANCES_PER_WEEK
+                ):
+                    picked.append(title)
+
+        core, extra = picked[:MAX_DAILY_TRACKS], picked[MAX_DAILY_TRACKS:]
+        window.append(core)
+        appearances.update(core)
+        yield day_str, core, extra
+
+
+def _logs(
+    rng: random.Random,
+    titles: List[str],
+    schedules: List[Tuple[str, List[str], List[str]]],
+    logs_per_day: Optional[int],
+) -> Iterator[Tuple[str, str, str]]:
+    """Log rows per day, in primary-key order so inserts append to the B-tree."""
+    for day_str, core, extra in schedules:
+        logged = set(core) | set(extra)
+        if logs_per_day is not None:
+            target = min(logs_per_day, len(titles))
+            if len(logged) > target:
+                logged = set(core[:target])
+            while len(logged) < target:
+                logged.update(rng.sample(titles, target - len(logged)))
+
+        statuses = rng.choices(
+            LOG_STATUSES, cum_weights=STATUS_CUM_WEIGHTS, k=len(logged)
+        )
+        yield from zip(repeat(day_str), sorted(logged), statuses)
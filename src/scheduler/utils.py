@@ -1,26 +1,73 @@
 import csv
+import gzip
 import json
+import textwrap
 from datetime import date, timedelta
 
 
-def export_to_csv(data, fieldnames, filename):
-    with open(
-        filename,
-        mode="w",
-        encoding="utf-8",
-    ) as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+def get_week_range(today=None):
+    today = today or date.today()
+    start = today - timedelta(days=today.weekday())  # Monday
+    end = start + timedelta(days=6)  # Sunday
+    return start.isoformat(), end.isoformat()
 
 
-def export_to_json(data, filename):
-    with open(filename, mode="w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+def get_month_range(today=None):
+    today = today or date.today()
+    start = today.replace(day=1)
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start.isoformat(), end.isoformat()
 
 
-def get_week_range():
-    today = date.today()
-    start = today - timedelta(days=today.weekday())  # Monday
-    end = start + timedelta(days=6)  # Sunday
-    return start.isoformat(), end.isoformat()
+def get_year_range(today=None):
+    today = today or date.today()
+    return today.replace(month=1, day=1).isoformat(), today.replace(
+        month=12, day=31
+    ).isoformat()
+
+
+def iter_rows(cursor, batch_size=1000):
+    """Yield rows from an executed cursor using fetchmany batches."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def open_export(filename, compress=False):
+    """Open an export file for text writing, optionally gzip-compressed."""
+    if compress:
+        return gzip.open(filename, mode="wt", encoding="utf-8", newline="")
+    return open(filename, mode="w", encoding="utf-8", newline="")
+
+
+def stream_csv(rows, fieldnames, f):
+    writer = csv.writer(f)
+    writer.writerow(fieldnames)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def stream_ndjson(rows, fieldnames, f):
+    count = 0
+    for row in rows:
+        f.write(json.dumps(dict(zip(fieldnames, row))))
+        f.write("\n")
+        count += 1
+    return count
+
+
+def stream_json(rows, fieldnames, f):
+    """Write a JSON array one element at a time, matching json.dump(indent=2)."""
+    count = 0
+    for row in rows:
+        item = json.dumps(dict(zip(fieldnames, row)), indent=2)
+        f.write("[\n" if count == 0 else ",\n")
+        f.write(textwrap.indent(item, "  "))
+        count += 1
+    f.write("\n]" if count else "[]")
+    return count
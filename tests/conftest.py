@@ -0,0 +1,72 @@
+"""Throwaway databases for tests that plan, log and report."""
+
+import random
+import sqlite3
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pytest
+
+from scheduler import db
+
+CATEGORIES = ("scripting", "system", "shell", "functional", "database")
+
+# Every table whose contents planning and logging maintain
+TABLES = (
+    "tracks",
+    "schedule",
+    "schedule_entries",
+    "schedule_scores",
+    "logs",
+    "track_stats",
+    "daily_rollup",
+    "monthly_track_rollup",
+)
+
+
+def catalog(count: int, seed: int) -> List[tuple]:
+    """Track rows, some around the completion threshold and some inactive."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        total = rng.choice([25, 50, 99, 140, rng.randint(10, 200)])
+        completed = rng.choice([0, 3, total // 2, total - 1, (total * 24) // 25])
+        active = 0 if i % 11 == 10 else 1
+        rows.append(
+            (f"track-{i:02d}", rng.choice(CATEGORIES), total, completed, active)
+        )
+    return rows
+
+
+def dump(conn: sqlite3.Connection) -> Dict[str, list]:
+    """Contents of TABLES, sorted, for comparing two databases."""
+    return {
+        table: sorted(conn.execute(f"SELECT * FROM {table}"), key=repr)
+        for table in TABLES
+    }
+
+
+@pytest.fixture
+def make_database(tmp_path: Path) -> Callable[..., Path]:
+    """Create a migrated database with a catalog and point the scheduler at it.
+
+    Call `db.use_database(path)` to switch between several; the database in
+    use before the test is restored afterwards.
+    """
+    previous = db.DATABASE_PATH
+
+    def make(name: str = "scheduler", tracks: int = 24, seed: int = 0) -> Path:
+        path = tmp_path / f"{name}.db"
+        db.use_database(path)
+        db.initialize()
+        conn = db.connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO tracks (title, category, total, completed, active) "
+                "VALUES (?, ?, ?, ?, ?)",
+                catalog(tracks, seed),
+            )
+        return path
+
+    yield make
+    db.use_database(previous)
@@ -0,0 +1,104 @@
+"""Snapshots restore to the same contents and damaged ones are refused."""
+
+import gzip
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+from conftest import dump
+
+from scheduler import backup, db
+from scheduler.commands.init import init
+from scheduler.commands.log import write_log
+from scheduler.constants import MIGRATIONS_DIR, SCHEMA_PATH
+from scheduler.scheduler import generate_range
+
+START = date(2026, 3, 1)
+
+
+@pytest.fixture
+def planned(make_database, tmp_path, monkeypatch):
+    """A database with schedules and logs, snapshotted under tmp_path."""
+    monkeypatch.setattr(backup, "BACKUPS_DIR", tmp_path / "backups")
+    make_database()
+    generate_range(START, START + timedelta(days=6))
+    conn = db.connect()
+    with conn:
+        for offset, track in enumerate(("track-00", "track-01", "track-02")):
+            day = (START + timedelta(days=offset)).isoformat()
+            write_log(conn, track, "completed", 2, day)
+    return conn
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(planned, compress):
+    expected = dump(planned)
+    saved = backup.backup_database(backup.snapshot_path(compress=compress), compress)
+    assert backup.latest_snapshot() == saved["path"]
+
+    # Change everything the snapshot covers
+    with planned:
+        planned.execute("DELETE FROM logs")
+        planned.execute("UPDATE tracks SET completed = 0")
+    generate_range(START, START + timedelta(days=9), force=True)
+    assert dump(planned) != expected
+
+    backup.restore_database(saved["path"])
+    assert dump(db.connect()) == expected
+
+
+def test_backup_refuses_a_damaged_database(planned, tmp_path):
+    # An index whose definition no longer matches its entries
+    with planned:
+        planned.execute("PRAGMA writable_schema = ON")
+        planned.execute(
+            "UPDATE sqlite_master SET sql = replace(sql, 'logs(date)', 'logs(track)') "
+            "WHERE name = 'idx_logs_date'"
+        )
+    db.close_all()
+
+    with pytest.raises(ValueError, match="Integrity check failed"):
+        backup.backup_database(backup.snapshot_path(compress=True), compress=True)
+    assert not list((tmp_path / "backups").iterdir())
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_restore_refuses_a_damaged_snapshot(planned, compress):
+    saved = backup.backup_database(backup.snapshot_path(), verify=False)
+    pages = bytearray(saved["path"].read_bytes())
+    page_size = saved["page_size"]
+    pages[3 * page_size : 3 * page_size + 256] = b"\xff" * 256
+    path = saved["path"]
+    if compress:
+        path = path.with_name(path.name + ".gz")
+        with gzip.open(path, "wb") as f:
+            f.write(pages)
+    else:
+        path.write_bytes(pages)
+
+    expected = dump(planned)
+    with pytest.raises(ValueError):
+        backup.restore_database(path)
+    assert dump(db.connect()) == expected
+
+
+def test_init_force_snapshots_the_file_as_it_was(tmp_path, monkeypatch):
+    monkeypatch.setattr(backup, "BACKUPS_DIR", tmp_path / "backups")
+    previous = db.DATABASE_PATH
+    path = tmp_path / "old.db"
+    # A database from before the report rollups, never opened by this process
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    for script in sorted(MIGRATIONS_DIR.glob("000[12]_*.sql")):
+        conn.executescript(script.read_text(encoding="utf-8"))
+    conn.execute("PRAGMA user_version = 2")
+    conn.close()
+
+    db.use_database(path)
+    try:
+        init(force=True, snapshot=True)
+        with backup.open_snapshot(backup.latest_snapshot()) as saved:
+            assert saved.execute("PRAGMA user_version").fetchone()[0] == 2
+        assert db.connect().execute("PRAGMA user_version").fetchone()[0] > 2
+    finally:
+        db.use_database(previous)
@@ -0,0 +1,50 @@
+"""Planning a range in one pass matches planning its days one at a time."""
+
+from datetime import date, timedelta
+
+import pytest
+from conftest import dump
+
+from scheduler import db
+from scheduler.scheduler import generate_range, generate_schedule
+
+START = date(2026, 3, 1)
+END = START + timedelta(days=20)
+
+
+def plan_history(engine: str):
+    # Days before the range and part of the range itself, then a change to
+    # the tracks so that forced days really are replanned
+    generate_range(START - timedelta(days=10), START + timedelta(days=5), engine=engine)
+    conn = db.connect()
+    with conn:
+        conn.execute(
+            "UPDATE tracks SET completed = total WHERE title IN "
+            "(SELECT track FROM schedule_entries WHERE date = ? AND slot = 'core')",
+            (START.isoformat(),),
+        )
+
+
+@pytest.mark.parametrize("force", [False, True])
+@pytest.mark.parametrize("engine", ["fixed", "decimal"])
+def test_range_matches_daily_planning(make_database, engine, force):
+    days = [START + timedelta(days=offset) for offset in range((END - START).days + 1)]
+
+    make_database("range")
+    plan_history(engine)
+    planned = generate_range(START, END, force=force, engine=engine, explain=True)
+    range_tables = dump(db.connect())
+
+    make_database("daily")
+    plan_history(engine)
+    before = {day.isoformat(): generate_schedule(day) for day in days[:6]}
+    daily = {
+        day.isoformat(): generate_schedule(day, force, engine, explain=True)
+        for day in days
+    }
+
+    assert planned == daily
+    assert range_tables == dump(db.connect())
+    # Forcing replans the days whose tracks changed, keeping does not
+    changed = [day for day, plan in before.items() if plan[:2] != daily[day][:2]]
+    assert bool(changed) == force
@@ -0,0 +1,92 @@
+"""Batched log imports match logging the same records one at a time."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+from conftest import dump
+
+from scheduler import db
+from scheduler.commands.log import VALID_STATUSES, write_log, write_logs
+from scheduler.scheduler import generate_range
+
+START = date(2026, 5, 1)
+
+
+def log_each(records):
+    conn = db.connect()
+    with conn:
+        for day_str, track, status, exercises in records:
+            write_log(conn, track, status, exercises, day_str)
+
+
+def log_batch(records):
+    conn = db.connect()
+    with conn:
+        return write_logs(conn, records)
+
+
+def random_records(rng: random.Random, titles, count: int):
+    return [
+        (
+            (START + timedelta(days=rng.randint(0, 9))).isoformat(),
+            rng.choice(titles),
+            rng.choice(VALID_STATUSES),
+            rng.randint(1, 5),
+        )
+        for _ in range(count)
+    ]
+
+
+def prepare(make_database, name: str, earlier):
+    make_database(name)
+    # Some planned days (and some without a plan), low completed counts so
+    # that decrements hit zero, and logs the import will move away from
+    generate_range(START, START + timedelta(days=4))
+    conn = db.connect()
+    with conn:
+        conn.execute("UPDATE tracks SET completed = completed % 4")
+    log_each(earlier)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_batch_matches_single_logs(make_database, seed):
+    rng = random.Random(seed)
+    titles = [f"track-{i:02d}" for i in range(6)]
+    earlier = random_records(rng, titles, 15)
+    records = random_records(rng, titles, 60)
+
+    prepare(make_database, "single", earlier)
+    log_each(records)
+    expected = dump(db.connect())
+
+    prepare(make_database, "batch", earlier)
+    counts = log_batch(records)
+
+    assert dump(db.connect()) == expected
+    assert counts["records"] == len(records)
+
+
+def test_decrements_below_zero_are_replayed(make_database):
+    day = START.isoformat()
+    # Starting from 1 completed exercise: 1 can't lose 2 (skipped), +1 = 2,
+    # 2 can't lose 3 (skipped), +1 = 3. The net change alone would give -2.
+    records = [
+        (day, "track-00", "not_started", 2),
+        (day, "track-00", "completed", 1),
+        (day, "track-00", "in_progress", 3),
+        (day, "track-00", "completed", 1),
+    ]
+    completed = {}
+    for name, apply in (("single", log_each), ("batch", log_batch)):
+        make_database(name)
+        log_each([(day, "track-00", "completed", 2)])
+        conn = db.connect()
+        with conn:
+            conn.execute("UPDATE tracks SET completed = 1 WHERE title = 'track-00'")
+        apply(records)
+        completed[name] = dump(conn)
+
+    assert completed["batch"] == completed["single"]
+    (track,) = [row for row in completed["single"]["tracks"] if row[0] == "track-00"]
+    assert track[3] == 3
@@ -0,0 +1,27 @@
+"""Numbered migrations apply one transaction each."""
+
+import sqlite3
+
+import pytest
+
+from scheduler import db
+from scheduler.constants import SCHEMA_PATH
+
+
+def test_failed_migration_rolls_back(tmp_path):
+    conn = sqlite3.connect(tmp_path / "broken.db")
+    conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    # 0002 builds track_stats from the logs
+    conn.execute("DROP TABLE logs")
+    conn.commit()
+
+    with pytest.raises(sqlite3.OperationalError):
+        db.migrate(conn)
+
+    # Earlier migrations stay applied, the failed one leaves nothing behind
+    assert not conn.in_transaction
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+    assert not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'track_stats'"
+    ).fetchone()
+    conn.close()
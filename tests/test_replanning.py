@@ -0,0 +1,86 @@
+"""Forced replans reuse a stored day only while its inputs are unchanged."""
+
+from datetime import date, timedelta
+
+import pytest
+from conftest import dump
+
+from scheduler import db
+from scheduler import scheduler as planner
+from scheduler.commands.log import write_log
+from scheduler.scheduler import generate_range, get_schedule
+
+START = date(2026, 6, 1)
+END = START + timedelta(days=6)
+
+
+@pytest.fixture
+def scored_days(monkeypatch):
+    """Dates select_tracks is called for from here on."""
+    days = []
+    select_tracks = planner.select_tracks
+
+    def counting(snapshot, *args, **kwargs):
+        days.append(snapshot.target_date)
+        return select_tracks(snapshot, *args, **kwargs)
+
+    monkeypatch.setattr(planner, "select_tracks", counting)
+    return days
+
+
+def replan(reuse: bool = True):
+    return generate_range(START, END, force=True, explain=True, reuse=reuse)
+
+
+def test_reuse_matches_rescoring(make_database, scored_days):
+    make_database()
+    generate_range(START - timedelta(days=10), END)
+    tables = dump(db.connect())
+    scored_days.clear()
+
+    reused = replan()
+    assert scored_days == []
+    assert dump(db.connect()) == tables
+
+    assert replan(reuse=False) == reused
+    assert len(scored_days) == 7
+    assert dump(db.connect()) == tables
+
+
+def edit_track(conn):
+    # The first core pick can't be picked once it is completed
+    (track, *_), _ = get_schedule(conn, START.isoformat())
+    conn.execute("UPDATE tracks SET completed = total WHERE title = ?", (track,))
+
+
+def log_in_window(conn):
+    (track, *_), _ = get_schedule(conn, (START - timedelta(days=2)).isoformat())
+    write_log(conn, track, "completed", 5, (START - timedelta(days=2)).isoformat())
+
+
+def drop_earlier_day(conn):
+    conn.execute(
+        "DELETE FROM schedule WHERE date = ?",
+        ((START - timedelta(days=2)).isoformat(),),
+    )
+
+
+@pytest.mark.parametrize("change", [edit_track, log_in_window, drop_earlier_day])
+def test_changed_inputs_are_replanned(make_database, scored_days, change):
+    make_database()
+    generate_range(START - timedelta(days=10), END)
+    conn = db.connect()
+    with conn:
+        change(conn)
+    scored_days.clear()
+
+    replanned = replan()
+    assert scored_days and scored_days[0] == START
+
+    # Matches a full rescore, and is stored: a second replan is a reuse hit
+    scored_days.clear()
+    tables = dump(db.connect())
+    assert replan() == replanned
+    assert scored_days == []
+    assert replan(reuse=False) == replanned
+    assert dump(db.connect()) == tables